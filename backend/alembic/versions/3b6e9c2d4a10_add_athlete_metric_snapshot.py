@@ -0,0 +1,59 @@
+"""add athlete metric snapshot table
+
+Revision ID: 3b6e9c2d4a10
+Revises: 07556f6b6c04
+Create Date: 2026-10-17 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b6e9c2d4a10"
+down_revision: Union[str, Sequence[str], None] = "07556f6b6c04"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "athlete_metric_snapshot",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "athlete_id",
+            sa.Integer(),
+            sa.ForeignKey("athlete.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("metric_id", sa.String(), nullable=False),
+        sa.Column("value", sa.Float(), nullable=True),
+        sa.Column("unit", sa.String(), nullable=True),
+        sa.Column("score", sa.JSON(), nullable=True),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint(
+            "athlete_id", "metric_id", name="uq_athlete_metric_snapshot_metric"
+        ),
+    )
+    op.create_index(
+        "ix_athlete_metric_snapshot_athlete_id",
+        "athlete_metric_snapshot",
+        ["athlete_id"],
+    )
+    op.create_index(
+        "ix_athlete_metric_snapshot_metric_id",
+        "athlete_metric_snapshot",
+        ["metric_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_athlete_metric_snapshot_metric_id", table_name="athlete_metric_snapshot"
+    )
+    op.drop_index(
+        "ix_athlete_metric_snapshot_athlete_id", table_name="athlete_metric_snapshot"
+    )
+    op.drop_table("athlete_metric_snapshot")
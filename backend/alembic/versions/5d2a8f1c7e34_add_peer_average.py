@@ -0,0 +1,119 @@
+"""add peer average table
+
+Revision ID: 5d2a8f1c7e34
+Revises: 3b6e9c2d4a10
+Create Date: 2026-10-17 11:00:00.000000
+"""
+
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2a8f1c7e34"
+down_revision: Union[str, Sequence[str], None] = "3b6e9c2d4a10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _age_band(birth_date: date | None, reference: date) -> int | None:
+    if birth_date is None:
+        return None
+    age = reference.year - birth_date.year
+    if (reference.month, reference.day) < (birth_date.month, birth_date.day):
+        age -= 1
+    return (age // 2) * 2
+
+
+def upgrade() -> None:
+    peer_average = op.create_table(
+        "peer_average",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "test_id",
+            sa.Integer(),
+            sa.ForeignKey("testdefinition.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("age_band", sa.Integer(), nullable=False),
+        sa.Column("value_sum", sa.Float(), nullable=False),
+        sa.Column("sample_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint("test_id", "age_band", name="uq_peer_average_test_band"),
+    )
+    op.create_index("ix_peer_average_test_id", "peer_average", ["test_id"])
+
+    # Backfill from existing results, banding each athlete by age on the
+    # session date (today for unscheduled sessions).
+    result = sa.table(
+        "sessionresult",
+        sa.column("test_id", sa.Integer),
+        sa.column("athlete_id", sa.Integer),
+        sa.column("session_id", sa.Integer),
+        sa.column("value", sa.Float),
+    )
+    athlete = sa.table(
+        "athlete", sa.column("id", sa.Integer), sa.column("birth_date", sa.Date)
+    )
+    session = sa.table(
+        "assessmentsession",
+        sa.column("id", sa.Integer),
+        sa.column("scheduled_at", sa.DateTime),
+    )
+    statement = (
+        sa.select(
+            result.c.test_id,
+            athlete.c.birth_date,
+            session.c.scheduled_at,
+            sa.func.sum(result.c.value),
+            sa.func.count(result.c.value),
+        )
+        .select_from(
+            result.join(athlete, athlete.c.id == result.c.athlete_id).join(
+                session, session.c.id == result.c.session_id
+            )
+        )
+        .group_by(
+            result.c.test_id,
+            result.c.athlete_id,
+            result.c.session_id,
+            athlete.c.birth_date,
+            session.c.scheduled_at,
+        )
+    )
+    today = date.today()
+    totals: dict[tuple[int, int], list[float]] = defaultdict(lambda: [0.0, 0])
+    for test_id, birth_date, scheduled_at, total, count in op.get_bind().execute(
+        statement
+    ):
+        reference = scheduled_at.date() if scheduled_at is not None else today
+        band = _age_band(birth_date, reference)
+        if band is None or not count:
+            continue
+        totals[(test_id, band)][0] += float(total or 0.0)
+        totals[(test_id, band)][1] += int(count)
+
+    now = datetime.now(timezone.utc)
+    if totals:
+        op.bulk_insert(
+            peer_average,
+            [
+                {
+                    "test_id": test_id,
+                    "age_band": band,
+                    "value_sum": total,
+                    "sample_count": int(count),
+                    "updated_at": now,
+                }
+                for (test_id, band), (total, count) in sorted(totals.items())
+            ],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_peer_average_test_id", table_name="peer_average")
+    op.drop_table("peer_average")
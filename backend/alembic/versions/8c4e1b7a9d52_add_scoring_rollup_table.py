@@ -0,0 +1,101 @@
+"""add scoring rollup table
+
+Revision ID: 8c4e1b7a9d52
+Revises: 5d2a8f1c7e34
+Create Date: 2026-10-17 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4e1b7a9d52"
+down_revision: Union[str, Sequence[str], None] = "5d2a8f1c7e34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    scoring_rollup = op.create_table(
+        "scoring_rollup",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "athlete_id",
+            sa.Integer(),
+            sa.ForeignKey("athlete.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "team_id",
+            sa.Integer(),
+            sa.ForeignKey("team.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column("team_key", sa.Integer(), nullable=False),
+        sa.Column("goals", sa.Integer(), nullable=False),
+        sa.Column("games_played", sa.Integer(), nullable=False),
+        sa.Column("goalless_games", sa.Integer(), nullable=False),
+        sa.Column("clean_sheets", sa.Integer(), nullable=False),
+        sa.Column("goals_conceded", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint("athlete_id", "team_key", name="uq_scoring_rollup_team"),
+    )
+    op.create_index("ix_scoring_rollup_athlete_id", "scoring_rollup", ["athlete_id"])
+    op.create_index("ix_scoring_rollup_team_id", "scoring_rollup", ["team_id"])
+    op.create_index("ix_scoring_rollup_goals", "scoring_rollup", ["goals"])
+    op.create_index(
+        "ix_scoring_rollup_clean_sheets", "scoring_rollup", ["clean_sheets"]
+    )
+
+    # Backfill from existing match stats.  Clean sheet totals only count
+    # appearances without goals or shootout goals, as the leaderboard does.
+    match_stat = sa.table(
+        "match_stat",
+        sa.column("id", sa.Integer),
+        sa.column("athlete_id", sa.Integer),
+        sa.column("team_id", sa.Integer),
+        sa.column("goals", sa.Integer),
+        sa.column("shootout_goals", sa.Integer),
+        sa.column("goals_conceded", sa.Integer),
+    )
+    goalless = sa.and_(match_stat.c.goals == 0, match_stat.c.shootout_goals == 0)
+    totals = sa.select(
+        match_stat.c.athlete_id,
+        match_stat.c.team_id,
+        sa.func.coalesce(match_stat.c.team_id, 0),
+        sa.func.coalesce(sa.func.sum(match_stat.c.goals), 0),
+        sa.func.count(match_stat.c.id),
+        sa.func.sum(sa.case((goalless, 1), else_=0)),
+        sa.func.sum(
+            sa.case((sa.and_(goalless, match_stat.c.goals_conceded == 0), 1), else_=0)
+        ),
+        sa.func.sum(sa.case((goalless, match_stat.c.goals_conceded), else_=0)),
+        sa.func.current_timestamp(),
+    ).group_by(match_stat.c.athlete_id, match_stat.c.team_id)
+    op.execute(
+        scoring_rollup.insert().from_select(
+            [
+                "athlete_id",
+                "team_id",
+                "team_key",
+                "goals",
+                "games_played",
+                "goalless_games",
+                "clean_sheets",
+                "goals_conceded",
+                "updated_at",
+            ],
+            totals,
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scoring_rollup_clean_sheets", table_name="scoring_rollup")
+    op.drop_index("ix_scoring_rollup_goals", table_name="scoring_rollup")
+    op.drop_index("ix_scoring_rollup_team_id", table_name="scoring_rollup")
+    op.drop_index("ix_scoring_rollup_athlete_id", table_name="scoring_rollup")
+    op.drop_table("scoring_rollup")
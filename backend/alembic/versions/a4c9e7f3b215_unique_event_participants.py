@@ -0,0 +1,53 @@
+"""unique event participants per user and athlete
+
+Revision ID: a4c9e7f3b215
+Revises: f2b8d5c1a947
+Create Date: 2026-10-17 21:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c9e7f3b215"
+down_revision: Union[str, Sequence[str], None] = "f2b8d5c1a947"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the earliest invite when a user or athlete was added twice.
+    for column in ("user_id", "athlete_id"):
+        op.execute(
+            f"""
+            DELETE FROM event_participant
+            WHERE {column} IS NOT NULL
+              AND id NOT IN (
+                SELECT keep_id FROM (
+                  SELECT MIN(id) AS keep_id
+                  FROM event_participant
+                  WHERE {column} IS NOT NULL
+                  GROUP BY event_id, {column}
+                ) AS keep
+              )
+            """
+        )
+    op.create_index(
+        "uq_event_participant_event_user",
+        "event_participant",
+        ["event_id", "user_id"],
+        unique=True,
+    )
+    op.create_index(
+        "uq_event_participant_event_athlete",
+        "event_participant",
+        ["event_id", "athlete_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_event_participant_event_athlete", table_name="event_participant")
+    op.drop_index("uq_event_participant_event_user", table_name="event_participant")
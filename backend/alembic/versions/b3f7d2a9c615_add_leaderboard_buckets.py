@@ -0,0 +1,191 @@
+"""add daily leaderboard buckets
+
+Revision ID: b3f7d2a9c615
+Revises: 8c4e1b7a9d52
+Create Date: 2026-10-17 16:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f7d2a9c615"
+down_revision: Union[str, Sequence[str], None] = "8c4e1b7a9d52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LOWER_IS_BETTER = ("split_10m_s", "split_20m_s", "split_35m_s")
+HIGHER_IS_BETTER = ("jump_cm", "max_power_kmh", "yoyo_distance_m")
+
+
+def _backfill_scoring_buckets(scoring_bucket: sa.Table) -> None:
+    match_stat = sa.table(
+        "match_stat",
+        sa.column("id", sa.Integer),
+        sa.column("athlete_id", sa.Integer),
+        sa.column("team_id", sa.Integer),
+        sa.column("match_date", sa.DateTime),
+        sa.column("goals", sa.Integer),
+        sa.column("shootout_goals", sa.Integer),
+        sa.column("goals_conceded", sa.Integer),
+    )
+    goalless = sa.and_(match_stat.c.goals == 0, match_stat.c.shootout_goals == 0)
+    match_day = sa.func.date(match_stat.c.match_date)
+    totals = sa.select(
+        match_stat.c.athlete_id,
+        match_stat.c.team_id,
+        sa.func.coalesce(match_stat.c.team_id, 0),
+        match_day,
+        sa.func.coalesce(sa.func.sum(match_stat.c.goals), 0),
+        sa.func.count(match_stat.c.id),
+        sa.func.sum(sa.case((goalless, 1), else_=0)),
+        sa.func.sum(
+            sa.case((sa.and_(goalless, match_stat.c.goals_conceded == 0), 1), else_=0)
+        ),
+        sa.func.sum(sa.case((goalless, match_stat.c.goals_conceded), else_=0)),
+        sa.func.current_timestamp(),
+    ).group_by(match_stat.c.athlete_id, match_stat.c.team_id, match_day)
+    op.execute(
+        scoring_bucket.insert().from_select(
+            [
+                "athlete_id",
+                "team_id",
+                "team_key",
+                "bucket_date",
+                "goals",
+                "games_played",
+                "goalless_games",
+                "clean_sheets",
+                "goals_conceded",
+                "updated_at",
+            ],
+            totals,
+        )
+    )
+
+
+def _backfill_combine_buckets(combine_bucket: sa.Table) -> None:
+    combine_metric = sa.table(
+        "team_combine_metric",
+        sa.column("athlete_id", sa.Integer),
+        sa.column("team_id", sa.Integer),
+        sa.column("recorded_at", sa.DateTime),
+        *(sa.column(name, sa.Float) for name in LOWER_IS_BETTER + HIGHER_IS_BETTER),
+    )
+    recorded_day = sa.func.date(combine_metric.c.recorded_at)
+    bests = (
+        sa.select(
+            combine_metric.c.athlete_id,
+            combine_metric.c.team_id,
+            recorded_day,
+            *(sa.func.min(combine_metric.c[name]) for name in LOWER_IS_BETTER),
+            *(sa.func.max(combine_metric.c[name]) for name in HIGHER_IS_BETTER),
+            sa.func.current_timestamp(),
+        )
+        .where(combine_metric.c.athlete_id.isnot(None))
+        .group_by(
+            combine_metric.c.athlete_id, combine_metric.c.team_id, recorded_day
+        )
+    )
+    op.execute(
+        combine_bucket.insert().from_select(
+            [
+                "athlete_id",
+                "team_id",
+                "bucket_date",
+                *LOWER_IS_BETTER,
+                *HIGHER_IS_BETTER,
+                "updated_at",
+            ],
+            bests,
+        )
+    )
+
+
+def upgrade() -> None:
+    scoring_bucket = op.create_table(
+        "scoring_bucket",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "athlete_id",
+            sa.Integer(),
+            sa.ForeignKey("athlete.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "team_id",
+            sa.Integer(),
+            sa.ForeignKey("team.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column("team_key", sa.Integer(), nullable=False),
+        sa.Column("bucket_date", sa.Date(), nullable=False),
+        sa.Column("goals", sa.Integer(), nullable=False),
+        sa.Column("games_played", sa.Integer(), nullable=False),
+        sa.Column("goalless_games", sa.Integer(), nullable=False),
+        sa.Column("clean_sheets", sa.Integer(), nullable=False),
+        sa.Column("goals_conceded", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint(
+            "athlete_id", "team_key", "bucket_date", name="uq_scoring_bucket_day"
+        ),
+    )
+    op.create_index("ix_scoring_bucket_athlete_id", "scoring_bucket", ["athlete_id"])
+    op.create_index("ix_scoring_bucket_team_id", "scoring_bucket", ["team_id"])
+    op.create_index("ix_scoring_bucket_bucket_date", "scoring_bucket", ["bucket_date"])
+
+    combine_bucket = op.create_table(
+        "combine_metric_bucket",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "athlete_id",
+            sa.Integer(),
+            sa.ForeignKey("athlete.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "team_id",
+            sa.Integer(),
+            sa.ForeignKey("team.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("bucket_date", sa.Date(), nullable=False),
+        *(
+            sa.Column(name, sa.Float(), nullable=True)
+            for name in LOWER_IS_BETTER + HIGHER_IS_BETTER
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint(
+            "athlete_id", "team_id", "bucket_date", name="uq_combine_metric_bucket_day"
+        ),
+    )
+    op.create_index(
+        "ix_combine_metric_bucket_athlete_id", "combine_metric_bucket", ["athlete_id"]
+    )
+    op.create_index(
+        "ix_combine_metric_bucket_team_id", "combine_metric_bucket", ["team_id"]
+    )
+    op.create_index(
+        "ix_combine_metric_bucket_bucket_date", "combine_metric_bucket", ["bucket_date"]
+    )
+
+    _backfill_scoring_buckets(scoring_bucket)
+    _backfill_combine_buckets(combine_bucket)
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_combine_metric_bucket_bucket_date", table_name="combine_metric_bucket"
+    )
+    op.drop_index("ix_combine_metric_bucket_team_id", table_name="combine_metric_bucket")
+    op.drop_index(
+        "ix_combine_metric_bucket_athlete_id", table_name="combine_metric_bucket"
+    )
+    op.drop_table("combine_metric_bucket")
+    op.drop_index("ix_scoring_bucket_bucket_date", table_name="scoring_bucket")
+    op.drop_index("ix_scoring_bucket_team_id", table_name="scoring_bucket")
+    op.drop_index("ix_scoring_bucket_athlete_id", table_name="scoring_bucket")
+    op.drop_table("scoring_bucket")
@@ -0,0 +1,63 @@
+"""add email outbox table
+
+Revision ID: b7d3e9a4c162
+Revises: a4c9e7f3b215
+Create Date: 2026-10-17 22:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d3e9a4c162"
+down_revision: Union[str, Sequence[str], None] = "a4c9e7f3b215"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUS = sa.Enum("PENDING", "SENDING", "SENT", "FAILED", name="emailoutboxstatus")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("template", sa.String(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column(
+            "notification_id",
+            sa.Integer(),
+            sa.ForeignKey("notification.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column("status", STATUS, nullable=False, server_default="PENDING"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("claim_token", sa.String(), nullable=True),
+        sa.Column("locked_until", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()
+        ),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "ix_email_outbox_notification_id", "email_outbox", ["notification_id"]
+    )
+    op.create_index(
+        "ix_email_outbox_status_due", "email_outbox", ["status", "next_attempt_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_email_outbox_status_due", table_name="email_outbox")
+    op.drop_index("ix_email_outbox_notification_id", table_name="email_outbox")
+    op.drop_table("email_outbox")
+    STATUS.drop(op.get_bind(), checkfirst=True)
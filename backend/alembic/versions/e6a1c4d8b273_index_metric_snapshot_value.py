@@ -0,0 +1,32 @@
+"""index athlete metric snapshots by metric and value
+
+Revision ID: e6a1c4d8b273
+Revises: b3f7d2a9c615
+Create Date: 2026-10-17 18:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6a1c4d8b273"
+down_revision: Union[str, Sequence[str], None] = "b3f7d2a9c615"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_athlete_metric_snapshot_metric_value",
+        "athlete_metric_snapshot",
+        ["metric_id", "value"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_athlete_metric_snapshot_metric_value",
+        table_name="athlete_metric_snapshot",
+    )
@@ -0,0 +1,100 @@
+"""add event visibility table
+
+Revision ID: f2b8d5c1a947
+Revises: e6a1c4d8b273
+Create Date: 2026-10-17 20:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b8d5c1a947"
+down_revision: Union[str, Sequence[str], None] = "e6a1c4d8b273"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    visibility = op.create_table(
+        "event_visibility",
+        sa.Column(
+            "user_id",
+            sa.Integer(),
+            sa.ForeignKey("user.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "event_id",
+            sa.Integer(),
+            sa.ForeignKey("event.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+    )
+    op.create_index("ix_event_visibility_event_id", "event_visibility", ["event_id"])
+
+    # Backfill with the same rules event_visibility_service applies.
+    event = sa.table(
+        "event",
+        sa.column("id", sa.Integer),
+        sa.column("created_by_id", sa.Integer),
+        sa.column("coach_id", sa.Integer),
+    )
+    participant = sa.table(
+        "event_participant",
+        sa.column("event_id", sa.Integer),
+        sa.column("user_id", sa.Integer),
+        sa.column("athlete_id", sa.Integer),
+    )
+    team_link = sa.table(
+        "event_team_link",
+        sa.column("event_id", sa.Integer),
+        sa.column("team_id", sa.Integer),
+    )
+    coach_link = sa.table(
+        "coachteamlink",
+        sa.column("user_id", sa.Integer),
+        sa.column("team_id", sa.Integer),
+    )
+    user = sa.table(
+        "user",
+        sa.column("id", sa.Integer),
+        sa.column("role", sa.String),
+        sa.column("athlete_id", sa.Integer),
+    )
+    athlete = sa.table(
+        "athlete", sa.column("id", sa.Integer), sa.column("team_id", sa.Integer)
+    )
+    is_coach = sa.cast(user.c.role, sa.String) == "COACH"
+    is_athlete = sa.cast(user.c.role, sa.String) == "ATHLETE"
+    pairs = sa.union(
+        sa.select(event.c.created_by_id, event.c.id).where(
+            event.c.created_by_id.isnot(None)
+        ),
+        sa.select(event.c.coach_id, event.c.id)
+        .join(user, user.c.id == event.c.coach_id)
+        .where(is_coach),
+        sa.select(participant.c.user_id, participant.c.event_id).where(
+            participant.c.user_id.isnot(None)
+        ),
+        sa.select(user.c.id, participant.c.event_id)
+        .join(participant, participant.c.athlete_id == user.c.athlete_id)
+        .where(is_athlete),
+        sa.select(user.c.id, team_link.c.event_id)
+        .join(athlete, athlete.c.id == user.c.athlete_id)
+        .join(team_link, team_link.c.team_id == athlete.c.team_id)
+        .where(is_athlete),
+        sa.select(coach_link.c.user_id, team_link.c.event_id)
+        .join(team_link, team_link.c.team_id == coach_link.c.team_id)
+        .join(user, user.c.id == coach_link.c.user_id)
+        .where(is_coach),
+    )
+    op.execute(visibility.insert().from_select(["user_id", "event_id"], pairs))
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_visibility_event_id", table_name="event_visibility")
+    op.drop_table("event_visibility")
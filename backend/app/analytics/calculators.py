@@ -0,0 +1,284 @@
+"""Calculator registry turning an athlete's best trials into metric values.
+
+Every entry in ``METRIC_DEFINITIONS`` has a calculator here.  A calculator is
+declarative: ``component`` converts the best trial of one test into the value
+displayed for it (or ``None`` to skip the test) and ``combine`` reduces the
+component values, keyed by normalized test name, into the headline value.
+``MetricEngine`` evaluates any number of calculators from one batch of
+aggregated results, so adding a metric never adds a query.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from statistics import mean
+from typing import Callable, Mapping
+
+from app.analytics.catalog import _TestMeta
+
+Component = tuple[float, str | None]
+ComponentFn = Callable[[_TestMeta, float], Component | None]
+CombineFn = Callable[[Mapping[str, float], int | None], float | None]
+
+
+SPRINT_DISTANCES_METERS = {
+    "5msprint": 5.0,
+    "10msprint": 10.0,
+    "12stepsprint": 12.0,
+    "15msprint": 15.0,
+    "20msprint": 20.0,
+    "25msprint": 25.0,
+    "30msprint": 30.0,
+    "35msprint": 35.0,
+    "40msprint": 40.0,
+}
+
+INCH_UNITS = {"in", "inch", "inches"}
+ACCURACY_ATTEMPTS = 5
+GRAVITY_M_S2 = 9.81
+
+_LEADING_DISTANCE = re.compile(r"^(\d+)m")
+
+
+@dataclass(frozen=True)
+class MetricCalculator:
+    """How one metric is computed from best trials.
+
+    ``trial_direction`` picks which raw trial counts as the best ("lower" or
+    "higher"); ``None`` defers to each test definition's target_direction.
+    """
+
+    unit: str | None
+    component: ComponentFn
+    combine: CombineFn
+    trial_direction: str | None = None
+
+
+# Components ----------------------------------------------------------------
+
+
+def _raw(test: _TestMeta, best: float) -> Component:
+    return best, test.definition.unit or None
+
+
+def _raw_or(default_unit: str) -> ComponentFn:
+    def component(test: _TestMeta, best: float) -> Component:
+        return best, test.definition.unit or default_unit
+
+    return component
+
+
+def _sprint_speed(test: _TestMeta, best: float) -> Component | None:
+    distance = SPRINT_DISTANCES_METERS.get(test.normalized)
+    if not distance or best <= 0:
+        return None
+    return distance / best, "m/s"
+
+
+def _jump_cm(test: _TestMeta, best: float) -> Component:
+    unit = test.definition.unit or ""
+    if unit.lower() in INCH_UNITS:
+        return best * 2.54, "cm"
+    return best, unit or "cm"
+
+
+def _reaction_ms(test: _TestMeta, best: float) -> Component | None:
+    if best <= 0:
+        return None
+    unit = (test.definition.unit or "").lower()
+    if unit == "cm":
+        # Ruler drop distance converted to fall time: t = sqrt(2d / g).
+        return math.sqrt(2 * (best / 100) / GRAVITY_M_S2) * 1000, "ms"
+    if unit == "s":
+        return best * 1000, "ms"
+    return best, "ms"
+
+
+def _positive_time(test: _TestMeta, best: float) -> Component | None:
+    if best <= 0:
+        return None
+    return best, test.definition.unit or "s"
+
+
+def _hit_rate(test: _TestMeta, best: float) -> Component:
+    return min(best / ACCURACY_ATTEMPTS, 1.0) * 100, "%"
+
+
+# Combiners -----------------------------------------------------------------
+
+
+def _mean(values: Mapping[str, float], age: int | None) -> float | None:
+    return mean(values.values()) if values else None
+
+
+def _max(values: Mapping[str, float], age: int | None) -> float | None:
+    return max(values.values()) if values else None
+
+
+def _sum(values: Mapping[str, float], age: int | None) -> float | None:
+    return sum(values.values()) if values else None
+
+
+def _inverse_mean(scale: float) -> CombineFn:
+    """Turn times (lower is better) into an index where higher is better."""
+
+    def combine(values: Mapping[str, float], age: int | None) -> float | None:
+        if not values:
+            return None
+        average = mean(values.values())
+        return scale / average if average > 0 else None
+
+    return combine
+
+
+def _distance_weighted_mean(values: Mapping[str, float], age: int | None) -> float | None:
+    weighted = 0.0
+    total_weight = 0.0
+    for normalized, value in values.items():
+        match = _LEADING_DISTANCE.match(normalized)
+        weight = float(match.group(1)) if match else 1.0
+        weighted += value * weight
+        total_weight += weight
+    return weighted / total_weight if total_weight else None
+
+
+def _vo2_from_beep(values: Mapping[str, float], age: int | None) -> float | None:
+    level = values.get("beeptest")
+    if level is None:
+        return None
+    return 3.46 * level + 12
+
+
+def _body_mass_index(values: Mapping[str, float], age: int | None) -> float | None:
+    bmi = values.get("bodymassindexbmi")
+    if bmi is not None:
+        return bmi
+    height_cm = values.get("height")
+    weight_kg = values.get("bodyweight")
+    if not height_cm or not weight_kg:
+        return None
+    return weight_kg / (height_cm / 100) ** 2
+
+
+def _readiness(values: Mapping[str, float], age: int | None) -> float | None:
+    max_hr = 220 - age if age else values.get("maximumheartrate")
+    parts: list[float] = []
+    resting = values.get("restingheartrateseated")
+    if resting and max_hr:
+        parts.append(max(0.0, 1 - resting / max_hr) * 100)
+    recovery = values.get("recoverytime60s")
+    if recovery is not None:
+        parts.append(max(0.0, 1 - recovery / 60) * 100)
+    return mean(parts) if parts else None
+
+
+def _two_footedness(values: Mapping[str, float], age: int | None) -> float | None:
+    differences: list[float] = []
+    for normalized, right in values.items():
+        if "right" not in normalized:
+            continue
+        left = values.get(normalized.replace("right", "left"))
+        if left is None:
+            continue
+        average = (right + left) / 2
+        if average <= 0:
+            continue
+        differences.append(abs(right - left) / average * 100)
+    if not differences:
+        return None
+    return max(0.0, 100 - mean(differences))
+
+
+# Registry ------------------------------------------------------------------
+
+CALCULATORS: dict[str, MetricCalculator] = {
+    "anthropometrics_profile": MetricCalculator(
+        unit="kg/m²", component=_raw, combine=_body_mass_index
+    ),
+    "resting_readiness": MetricCalculator(
+        unit="score", component=_raw, combine=_readiness
+    ),
+    "mobility_balance": MetricCalculator(
+        unit="cm", component=_raw_or("cm"), combine=_mean, trial_direction="higher"
+    ),
+    "reactive_quickness": MetricCalculator(
+        unit="1/s",
+        component=_reaction_ms,
+        combine=_inverse_mean(1000),
+        trial_direction="lower",
+    ),
+    "upper_body_endurance": MetricCalculator(
+        unit=None, component=_raw, combine=_mean, trial_direction="higher"
+    ),
+    "core_stability": MetricCalculator(
+        unit=None, component=_raw, combine=_mean, trial_direction="higher"
+    ),
+    "lower_body_power": MetricCalculator(
+        unit="cm", component=_jump_cm, combine=_mean, trial_direction="higher"
+    ),
+    "short_acceleration": MetricCalculator(
+        unit="m/s", component=_sprint_speed, combine=_mean, trial_direction="lower"
+    ),
+    "top_end_speed": MetricCalculator(
+        unit="m/s", component=_sprint_speed, combine=_max, trial_direction="lower"
+    ),
+    "change_of_direction": MetricCalculator(
+        unit="index",
+        component=_positive_time,
+        combine=_inverse_mean(100),
+        trial_direction="lower",
+    ),
+    "dribbling_agility": MetricCalculator(
+        unit="index",
+        component=_positive_time,
+        combine=_inverse_mean(100),
+        trial_direction="lower",
+    ),
+    "aerobic_capacity": MetricCalculator(
+        unit="ml·kg⁻¹·min⁻¹",
+        component=_raw_or("level"),
+        combine=_vo2_from_beep,
+        trial_direction="higher",
+    ),
+    "ball_mastery": MetricCalculator(
+        unit="pts", component=_raw, combine=_sum, trial_direction="higher"
+    ),
+    "shoot_power_right": MetricCalculator(
+        unit="km/h", component=_raw_or("km/h"), combine=_mean, trial_direction="higher"
+    ),
+    "shoot_power_left": MetricCalculator(
+        unit="km/h", component=_raw_or("km/h"), combine=_mean, trial_direction="higher"
+    ),
+    "shoot_accuracy_right": MetricCalculator(
+        unit="%",
+        component=_hit_rate,
+        combine=_distance_weighted_mean,
+        trial_direction="higher",
+    ),
+    "shoot_accuracy_left": MetricCalculator(
+        unit="%",
+        component=_hit_rate,
+        combine=_distance_weighted_mean,
+        trial_direction="higher",
+    ),
+    "cross_accuracy_right": MetricCalculator(
+        unit="%", component=_hit_rate, combine=_mean, trial_direction="higher"
+    ),
+    "cross_accuracy_left": MetricCalculator(
+        unit="%", component=_hit_rate, combine=_mean, trial_direction="higher"
+    ),
+    "two_footedness_index": MetricCalculator(
+        unit="%", component=_raw, combine=_two_footedness, trial_direction="higher"
+    ),
+}
+
+
+def register_calculator(metric_id: str, calculator: MetricCalculator) -> None:
+    """Register or replace the calculator used for ``metric_id``."""
+    CALCULATORS[metric_id] = calculator
+
+
+def get_calculator(metric_id: str) -> MetricCalculator | None:
+    return CALCULATORS.get(metric_id)
@@ -0,0 +1,139 @@
+"""Process-wide cache of test definitions and their metric resolution."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Sequence
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import func, select
+from sqlmodel import Session
+
+from app.analytics.metric_definitions import METRIC_DEFINITIONS
+from app.models.test_definition import TestDefinition
+
+__test__ = False  # Prevent pytest from collecting TestCatalog as a test
+
+
+def _normalize_name(name: str) -> str:
+    return "".join(ch for ch in name.lower() if ch.isalnum())
+
+
+VERTICAL_JUMP_ALIASES = {
+    "verticaljumpnorunup": {
+        "vertical jump (no run-up)",
+        "vertical jump",
+        "vertical jump norun",
+    },
+    "verticaljumprunup": {
+        "vertical jump (run-up)",
+        "vertical jump run",
+        "vertical jump run-up",
+    },
+}
+
+
+@dataclass(frozen=True)
+class _TestMeta:
+    definition: TestDefinition
+    normalized: str
+
+
+@dataclass(frozen=True)
+class TestCatalog:
+    """Immutable view of the test table, shared by every MetricEngine."""
+
+    version: int
+    fingerprint: tuple[int, int | None]
+    tests: dict[str, _TestMeta]
+    _resolved: dict[tuple[str, ...], tuple[_TestMeta, ...]] = field(
+        default_factory=dict
+    )
+
+    def _match(self, names: Sequence[str]) -> tuple[_TestMeta, ...]:
+        resolved: list[_TestMeta] = []
+        for name in names:
+            normalized = _normalize_name(name)
+            match = self.tests.get(normalized)
+            if match:
+                resolved.append(match)
+                continue
+            # Handle aliases for vertical jump variations.
+            aliases = VERTICAL_JUMP_ALIASES.get(normalized)
+            if aliases:
+                for alias in aliases:
+                    alias_meta = self.tests.get(_normalize_name(alias))
+                    if alias_meta and alias_meta not in resolved:
+                        resolved.append(alias_meta)
+                        break
+        return tuple(resolved)
+
+    def resolve(self, names: Sequence[str]) -> list[_TestMeta]:
+        """Return the tests matching ``names``, precomputed for every metric."""
+        key = tuple(names)
+        cached = self._resolved.get(key)
+        if cached is None:
+            cached = self._match(key)
+        return list(cached)
+
+
+_lock = threading.Lock()
+_version = 0
+_catalogs: WeakKeyDictionary[object, TestCatalog] = WeakKeyDictionary()
+
+
+def _fingerprint(session: Session) -> tuple[int, int | None]:
+    # Tests are only ever appended, so count and max id detect definitions
+    # created by other worker processes without reloading the table.
+    count, max_id = session.exec(
+        select(func.count(TestDefinition.id), func.max(TestDefinition.id))
+    ).one()
+    return int(count or 0), max_id
+
+
+def _build_catalog(
+    session: Session, version: int, fingerprint: tuple[int, int | None]
+) -> TestCatalog:
+    tests: dict[str, _TestMeta] = {}
+    for definition in session.exec(select(TestDefinition)).scalars().all():
+        normalized = _normalize_name(definition.name)
+        # Copy so the cached object never expires with the request session.
+        detached = TestDefinition(**definition.model_dump())
+        tests[normalized] = _TestMeta(definition=detached, normalized=normalized)
+
+    catalog = TestCatalog(version=version, fingerprint=fingerprint, tests=tests)
+    for metric in METRIC_DEFINITIONS:
+        key = tuple(metric.primary_tests)
+        catalog._resolved[key] = catalog._match(key)
+    return catalog
+
+
+def get_test_catalog(session: Session) -> TestCatalog:
+    """Return the cached catalog for the session's database, rebuilding if stale."""
+    bind = session.get_bind()
+    fingerprint = _fingerprint(session)
+    with _lock:
+        version = _version
+        cached = _catalogs.get(bind)
+    if (
+        cached is not None
+        and cached.version == version
+        and cached.fingerprint == fingerprint
+    ):
+        return cached
+
+    catalog = _build_catalog(session, version, fingerprint)
+    with _lock:
+        # Skip caching if an invalidation happened while we were building.
+        if _version == version:
+            _catalogs[bind] = catalog
+    return catalog
+
+
+def invalidate_test_catalog() -> None:
+    """Discard every cached catalog; the next MetricEngine reloads the table."""
+    global _version
+    with _lock:
+        _version += 1
+        _catalogs.clear()
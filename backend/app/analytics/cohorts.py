@@ -0,0 +1,291 @@
+"""Precomputed cohort distributions for percentile and z-score lookups.
+
+For every test the athletes' best trials are bucketed by (age band, gender)
+and kept as sorted arrays, so a percentile is a binary search instead of a
+scan over ``SessionResult``.  Distributions are cached per database, rebuilt
+after results or athletes change, and otherwise expire after
+``COHORT_DISTRIBUTION_TTL_SECONDS`` so other worker processes catch up.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from statistics import mean, pstdev
+from typing import Iterable
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import func, select
+from sqlmodel import Session
+
+from app.models.athlete import Athlete
+from app.models.session_result import SessionResult
+from app.models.test_definition import TestDefinition
+from app.schemas.analytics import AthletePercentilesResponse, TestPercentile
+
+__test__ = False  # Prevent pytest from collecting TestDistributions as a test
+
+COHORT_DISTRIBUTION_TTL_SECONDS = 300
+AGE_BAND_YEARS = 2
+
+CohortKey = tuple[int | None, str | None]
+
+
+def age_on(birth_date: date | None, reference: date | None = None) -> int | None:
+    if birth_date is None:
+        return None
+    ref = reference or date.today()
+    age = ref.year - birth_date.year
+    if (ref.month, ref.day) < (birth_date.month, birth_date.day):
+        age -= 1
+    return age
+
+
+def age_band(age: int | None) -> int | None:
+    """Lower bound of the two-year band the age falls into (e.g. 14 for 14-15)."""
+    if age is None:
+        return None
+    return (age // AGE_BAND_YEARS) * AGE_BAND_YEARS
+
+
+@dataclass(frozen=True)
+class CohortDistribution:
+    """Sorted best trials of one cohort with summary statistics."""
+
+    values: tuple[float, ...]
+    mean: float
+    stdev: float
+
+    @classmethod
+    def from_values(cls, values: Iterable[float]) -> "CohortDistribution":
+        ordered = tuple(sorted(values))
+        return cls(values=ordered, mean=mean(ordered), stdev=pstdev(ordered))
+
+    @property
+    def size(self) -> int:
+        return len(self.values)
+
+    def percentile_rank(self, value: float) -> float:
+        """Share of the cohort below ``value`` (ties count half), as 0-100."""
+        below = bisect_left(self.values, value)
+        ties = bisect_right(self.values, value) - below
+        return (below + ties / 2) / self.size * 100
+
+    def z_score(self, value: float) -> float | None:
+        if self.stdev == 0:
+            return None
+        return (value - self.mean) / self.stdev
+
+
+@dataclass(frozen=True)
+class TestDistributions:
+    """All cohort distributions for one test."""
+
+    test_id: int
+    higher_is_better: bool
+    built_at: float
+    cohorts: dict[CohortKey, CohortDistribution] = field(default_factory=dict)
+
+    def lookup(
+        self, band: int | None, gender: str | None
+    ) -> CohortDistribution | None:
+        """Return the cohort for the band/gender; ``None`` matches everyone."""
+        return self.cohorts.get((band, gender))
+
+    def percentile(self, value: float, cohort: CohortDistribution) -> float:
+        rank = cohort.percentile_rank(value)
+        return rank if self.higher_is_better else 100 - rank
+
+    def z_score(self, value: float, cohort: CohortDistribution) -> float | None:
+        """Cohort z-score, positive when ``value`` is better than the mean."""
+        z_score = cohort.z_score(value)
+        if z_score is None or self.higher_is_better:
+            return z_score
+        return -z_score
+
+
+_lock = threading.Lock()
+_generation = 0
+_caches: WeakKeyDictionary[object, dict[int, TestDistributions]] = WeakKeyDictionary()
+
+
+def _build(
+    db: Session, tests: dict[int, bool], built_at: float
+) -> dict[int, TestDistributions]:
+    statement = (
+        select(
+            SessionResult.test_id,
+            Athlete.birth_date,
+            Athlete.gender,
+            func.min(SessionResult.value),
+            func.max(SessionResult.value),
+        )
+        .join(Athlete, Athlete.id == SessionResult.athlete_id)
+        .where(SessionResult.test_id.in_(sorted(tests)))
+        .group_by(
+            SessionResult.test_id,
+            SessionResult.athlete_id,
+            Athlete.birth_date,
+            Athlete.gender,
+        )
+    )
+    buckets: dict[int, dict[CohortKey, list[float]]] = {
+        test_id: {} for test_id in tests
+    }
+    today = date.today()
+    for test_id, birth_date, gender, lowest, highest in db.exec(statement).all():
+        best = highest if tests[test_id] else lowest
+        if best is None:
+            continue
+        band = age_band(age_on(birth_date, today))
+        gender_value = getattr(gender, "value", gender)
+        # Register the athlete in the exact cohort and every wildcard cohort.
+        for key in {
+            (band, gender_value),
+            (band, None),
+            (None, gender_value),
+            (None, None),
+        }:
+            buckets[test_id].setdefault(key, []).append(float(best))
+
+    return {
+        test_id: TestDistributions(
+            test_id=test_id,
+            higher_is_better=tests[test_id],
+            built_at=built_at,
+            cohorts={
+                key: CohortDistribution.from_values(values)
+                for key, values in cohorts.items()
+            },
+        )
+        for test_id, cohorts in buckets.items()
+    }
+
+
+def get_test_distributions(
+    db: Session, test_ids: Iterable[int]
+) -> dict[int, TestDistributions]:
+    """Return distributions for the tests, building missing or expired ones."""
+    wanted = {test_id for test_id in test_ids if test_id is not None}
+    if not wanted:
+        return {}
+    bind = db.get_bind()
+    now = time.monotonic()
+    with _lock:
+        generation = _generation
+        cache = _caches.setdefault(bind, {})
+        found = {
+            test_id: cache[test_id]
+            for test_id in wanted
+            if test_id in cache
+            and now - cache[test_id].built_at < COHORT_DISTRIBUTION_TTL_SECONDS
+        }
+    missing = wanted.difference(found)
+    if missing:
+        directions = db.exec(
+            select(TestDefinition.id, TestDefinition.target_direction).where(
+                TestDefinition.id.in_(sorted(missing))
+            )
+        ).all()
+        tests = {
+            test_id: (direction or "higher").lower() != "lower"
+            for test_id, direction in directions
+        }
+        if tests:
+            built = _build(db, tests, now)
+            with _lock:
+                # Results added while building would be missing; skip caching.
+                if _generation == generation:
+                    _caches.setdefault(bind, {}).update(built)
+            found.update(built)
+    return found
+
+
+def invalidate_cohort_distributions(test_ids: Iterable[int] | None = None) -> None:
+    """Drop cached distributions for the tests (all when ``None``).
+
+    Call after commit so a concurrent build cannot cache the old rows.
+    """
+    global _generation
+    with _lock:
+        _generation += 1
+        for cache in _caches.values():
+            if test_ids is None:
+                cache.clear()
+                continue
+            for test_id in test_ids:
+                cache.pop(test_id, None)
+
+
+def build_percentile_response(
+    db: Session,
+    athlete: Athlete,
+    test_ids: Iterable[int] | None = None,
+    *,
+    by_age_band: bool = True,
+    by_gender: bool = True,
+) -> AthletePercentilesResponse:
+    """Rank the athlete's best trial per test against their cohort."""
+    band = age_band(age_on(athlete.birth_date))
+    gender = athlete.gender.value if athlete.gender else None
+    statement = (
+        select(
+            SessionResult.test_id,
+            TestDefinition.name,
+            TestDefinition.unit,
+            TestDefinition.target_direction,
+            func.min(SessionResult.value),
+            func.max(SessionResult.value),
+        )
+        .join(TestDefinition, TestDefinition.id == SessionResult.test_id)
+        .where(SessionResult.athlete_id == athlete.id)
+        .group_by(
+            SessionResult.test_id,
+            TestDefinition.name,
+            TestDefinition.unit,
+            TestDefinition.target_direction,
+        )
+        .order_by(SessionResult.test_id)
+    )
+    if test_ids is not None:
+        statement = statement.where(SessionResult.test_id.in_(sorted(set(test_ids))))
+    rows = db.exec(statement).all()
+
+    distributions = get_test_distributions(db, [row[0] for row in rows])
+    cohort_key = (band if by_age_band else None, gender if by_gender else None)
+    percentiles: list[TestPercentile] = []
+    for test_id, name, unit, direction, lowest, highest in rows:
+        higher_is_better = (direction or "higher").lower() != "lower"
+        value = float(highest if higher_is_better else lowest)
+        test_distribution = distributions.get(test_id)
+        cohort = test_distribution.lookup(*cohort_key) if test_distribution else None
+        percentiles.append(
+            TestPercentile(
+                test_id=test_id,
+                test_name=name,
+                unit=unit or None,
+                value=value,
+                percentile=(
+                    round(test_distribution.percentile(value, cohort), 1)
+                    if cohort
+                    else None
+                ),
+                z_score=(
+                    round(z_score, 2)
+                    if cohort
+                    and (z_score := test_distribution.z_score(value, cohort))
+                    is not None
+                    else None
+                ),
+                cohort_size=cohort.size if cohort else 0,
+            )
+        )
+    return AthletePercentilesResponse(
+        athlete_id=athlete.id,
+        age_band=cohort_key[0],
+        gender=cohort_key[1],
+        percentiles=percentiles,
+    )
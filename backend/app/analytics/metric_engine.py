@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import heapq
 from collections import defaultdict
-from dataclasses import dataclass
 from datetime import date
-from statistics import mean
 from typing import Iterable, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.sql import ColumnElement
 from sqlmodel import Session
 
-from app.analytics.metric_definitions import MetricDefinition, get_metric_by_id
-from app.models.athlete import Athlete
+from app.analytics.catalog import _TestMeta, get_test_catalog
+from app.analytics.calculators import MetricCalculator, get_calculator
+from app.analytics.metric_definitions import (
+    METRIC_DEFINITIONS,
+    MetricDefinition,
+    get_metric_by_id,
+)
+from app.models.athlete import Athlete, AthleteGender
 from app.models.session_result import SessionResult
-from app.models.test_definition import TestDefinition
 from app.schemas.analytics import (
     AthleteMetricsResponse,
     MetricComponent,
@@ -22,35 +27,9 @@ from app.schemas.analytics import (
 )
 
 
-def _normalize_name(name: str) -> str:
-    return "".join(ch for ch in name.lower() if ch.isalnum())
-
-
-SPRINT_DISTANCES_METERS = {
-    "5msprint": 5.0,
-    "10msprint": 10.0,
-    "12stepsprint": 12.0,
-    "15msprint": 15.0,
-    "20msprint": 20.0,
-    "25msprint": 25.0,
-    "30msprint": 30.0,
-    "35msprint": 35.0,
-    "40msprint": 40.0,
-}
-
-
-VERTICAL_JUMP_ALIASES = {
-    "verticaljumpnorunup": {
-        "vertical jump (no run-up)",
-        "vertical jump",
-        "vertical jump norun",
-    },
-    "verticaljumprunup": {
-        "vertical jump (run-up)",
-        "vertical jump run",
-        "vertical jump run-up",
-    },
-}
+# Upper bound on bound parameters per IN clause when batching athletes, kept
+# well below SQLite's variable limit.
+ATHLETE_BATCH_SIZE = 500
 
 
 def _age_from_birth_year(athlete: Athlete) -> int | None:
@@ -73,297 +52,233 @@ AGE_CATEGORY_BOUNDS = {
 }
 
 
-@dataclass(frozen=True)
-class _TestMeta:
-    definition: TestDefinition
-    normalized: str
+# Every declared metric has a calculator, so responses cover the full set.
+DEFAULT_METRIC_IDS: tuple[str, ...] = tuple(
+    metric.id for metric in METRIC_DEFINITIONS
+)
+KNOWN_METRIC_IDS = frozenset(DEFAULT_METRIC_IDS)
 
 
 class MetricEngine:
     def __init__(self, session: Session) -> None:
         self.session = session
-        self._tests = self._load_tests()
-
-    def _load_tests(self) -> dict[str, _TestMeta]:
-        statement = select(TestDefinition)
-        tests: dict[str, _TestMeta] = {}
-        definitions = self.session.exec(statement).scalars().all()
-        for definition in definitions:
-            normalized = _normalize_name(definition.name)
-            tests[normalized] = _TestMeta(definition=definition, normalized=normalized)
-        return tests
+        self._catalog = get_test_catalog(session)
+        self._tests = self._catalog.tests
 
     def _get_metric_definition(self, metric_id: str) -> MetricDefinition:
         return get_metric_by_id(metric_id)
 
     def _resolve_tests(self, names: Sequence[str]) -> list[_TestMeta]:
-        resolved: list[_TestMeta] = []
-        for name in names:
-            normalized = _normalize_name(name)
-            match = self._tests.get(normalized)
-            if match:
-                resolved.append(match)
-                continue
-            # Handle aliases for vertical jump variations.
-            aliases = VERTICAL_JUMP_ALIASES.get(normalized)
-            if aliases:
-                for alias in aliases:
-                    alias_meta = self._tests.get(_normalize_name(alias))
-                    if alias_meta and alias_meta not in resolved:
-                        resolved.append(alias_meta)
-                        break
-        return resolved
-
-    def _fetch_results(
-        self, athlete_id: int, tests: Sequence[_TestMeta]
-    ) -> dict[int, list[float]]:
-        if not tests:
-            return {}
-        test_ids = [
-            test.definition.id for test in tests if test.definition.id is not None
-        ]
-        if not test_ids:
-            return {}
-
-        statement = (
-            select(SessionResult.test_id, SessionResult.value)
-            .where(SessionResult.athlete_id == athlete_id)
-            .where(SessionResult.test_id.in_(test_ids))
+        return self._catalog.resolve(names)
+
+    def _higher_is_better(self, metric: MetricDefinition, test: _TestMeta) -> bool:
+        calculator = get_calculator(metric.id)
+        direction = calculator.trial_direction if calculator else None
+        if direction is None:
+            direction = test.definition.target_direction
+        return (direction or "higher").lower() != "lower"
+
+    def _fetch_trial_ranges(
+        self, athlete_ids: Iterable[int | None], test_ids: Iterable[int]
+    ) -> dict[int, dict[int, tuple[float, float]]]:
+        """Return (min, max) trial per athlete and test, aggregated in the database.
+
+        Both extremes are read so metrics that disagree on which trial is the
+        best can share one query.
+        """
+        unique_test_ids = sorted(set(test_ids))
+        unique_athlete_ids = sorted(
+            {athlete_id for athlete_id in athlete_ids if athlete_id is not None}
         )
-        values: dict[int, list[float]] = defaultdict(list)
-        for test_id, value in self.session.exec(statement).all():
-            if value is None:
-                continue
-            values[test_id].append(float(value))
-        return values
-
-    def _best_value(self, values: Iterable[float], higher_is_better: bool) -> float:
-        data = list(values)
-        if not data:
-            raise ValueError("No data provided")
-        return max(data) if higher_is_better else min(data)
-
-    def _compute_short_acceleration(self, athlete: Athlete) -> MetricScore | None:
-        metric = self._get_metric_definition("short_acceleration")
-        tests = self._resolve_tests(metric.primary_tests)
-        results = self._fetch_results(athlete.id, tests)
-        if not results:
-            return None
+        if not unique_test_ids or not unique_athlete_ids:
+            return {}
 
-        component_scores: list[MetricComponent] = []
-        speeds: list[float] = []
-        for test in tests:
-            test_id = test.definition.id
-            if test_id is None or test_id not in results:
-                continue
-            normalized = test.normalized
-            distance = SPRINT_DISTANCES_METERS.get(normalized)
-            if not distance:
-                continue
-            best_time = self._best_value(results[test_id], higher_is_better=False)
-            if best_time <= 0:
-                continue
-            speed = distance / best_time
-            speeds.append(speed)
-            component_scores.append(
-                MetricComponent(
-                    label=test.definition.name, value=round(speed, 2), unit="m/s"
+        ranges: dict[int, dict[int, tuple[float, float]]] = defaultdict(dict)
+        for start in range(0, len(unique_athlete_ids), ATHLETE_BATCH_SIZE):
+            batch = unique_athlete_ids[start : start + ATHLETE_BATCH_SIZE]
+            statement = (
+                select(
+                    SessionResult.athlete_id,
+                    SessionResult.test_id,
+                    func.min(SessionResult.value),
+                    func.max(SessionResult.value),
                 )
+                .where(SessionResult.athlete_id.in_(batch))
+                .where(SessionResult.test_id.in_(unique_test_ids))
+                .group_by(SessionResult.athlete_id, SessionResult.test_id)
             )
-
-        if not speeds:
-            return None
-
-        value = round(mean(speeds), 2)
-        return MetricScore(
-            id=metric.id,
-            name=metric.name,
-            category=metric.category,
-            description=metric.description,
-            direction="higher_is_better",
-            value=value,
-            unit="m/s",
-            components=component_scores,
-            tags=list(metric.tags or ()),
-        )
-
-    def _compute_top_end_speed(self, athlete: Athlete) -> MetricScore | None:
-        metric = self._get_metric_definition("top_end_speed")
-        tests = self._resolve_tests(metric.primary_tests)
-        results = self._fetch_results(athlete.id, tests)
-        if not results:
-            return None
-
-        component_scores: list[MetricComponent] = []
-        top_speed: float | None = None
+            for athlete_id, test_id, lowest, highest in self.session.exec(
+                statement
+            ).all():
+                if lowest is None or highest is None:
+                    continue
+                ranges[athlete_id][test_id] = (float(lowest), float(highest))
+        return ranges
+
+    def _best_values(
+        self,
+        metric: MetricDefinition,
+        tests: Sequence[_TestMeta],
+        ranges: dict[int, tuple[float, float]],
+    ) -> dict[int, float]:
+        best: dict[int, float] = {}
         for test in tests:
             test_id = test.definition.id
-            if test_id is None or test_id not in results:
-                continue
-            distance = SPRINT_DISTANCES_METERS.get(test.normalized)
-            if not distance:
-                continue
-            best_time = self._best_value(results[test_id], higher_is_better=False)
-            if best_time <= 0:
+            if test_id is None or test_id not in ranges:
                 continue
-            speed = distance / best_time
-            component_scores.append(
-                MetricComponent(
-                    label=test.definition.name, value=round(speed, 2), unit="m/s"
-                )
-            )
-            if top_speed is None or speed > top_speed:
-                top_speed = speed
+            lowest, highest = ranges[test_id]
+            best[test_id] = highest if self._higher_is_better(metric, test) else lowest
+        return best
 
-        if top_speed is None:
-            return None
-
-        return MetricScore(
-            id=metric.id,
-            name=metric.name,
-            category=metric.category,
-            description=metric.description,
-            direction="higher_is_better",
-            value=round(top_speed, 2),
-            unit="m/s",
-            components=component_scores,
-            tags=list(metric.tags or ()),
-        )
-
-    def _compute_lower_body_power(self, athlete: Athlete) -> MetricScore | None:
-        metric = self._get_metric_definition("lower_body_power")
-        tests = self._resolve_tests(metric.primary_tests)
-        results = self._fetch_results(athlete.id, tests)
+    def _fetch_best_values(
+        self,
+        metric: MetricDefinition,
+        athlete_ids: Sequence[int],
+        tests: Sequence[_TestMeta],
+    ) -> dict[int, dict[int, float]]:
+        """Return each athlete's best trial per test for one metric."""
+        test_ids = [test.definition.id for test in tests if test.definition.id]
+        ranges = self._fetch_trial_ranges(athlete_ids, test_ids)
+        return {
+            athlete_id: self._best_values(metric, tests, athlete_ranges)
+            for athlete_id, athlete_ranges in ranges.items()
+        }
+
+    def _score_metric(
+        self,
+        metric: MetricDefinition,
+        calculator: MetricCalculator,
+        tests: Sequence[_TestMeta],
+        athlete: Athlete,
+        results: dict[int, float],
+    ) -> MetricScore | None:
         if not results:
             return None
 
-        converted: list[float] = []
+        values: dict[str, float] = {}
         components: list[MetricComponent] = []
         for test in tests:
             test_id = test.definition.id
             if test_id is None or test_id not in results:
                 continue
-            raw_best = self._best_value(results[test_id], higher_is_better=True)
-            unit = test.definition.unit or ""
-            value = raw_best
-            if unit.lower() in {"in", "inch", "inches"}:
-                value = raw_best * 2.54
-                unit_display = "cm"
-            else:
-                unit_display = unit or "cm"
-            converted.append(value)
+            converted = calculator.component(test, results[test_id])
+            if converted is None:
+                continue
+            value, unit = converted
+            values[test.normalized] = value
             components.append(
                 MetricComponent(
-                    label=test.definition.name, value=round(value, 2), unit=unit_display
+                    label=test.definition.name, value=round(value, 2), unit=unit
                 )
             )
 
-        if not converted:
-            return None
-
-        average_power = round(mean(converted), 2)
-        return MetricScore(
-            id=metric.id,
-            name=metric.name,
-            category=metric.category,
-            description=metric.description,
-            direction="higher_is_better",
-            value=average_power,
-            unit="cm",
-            components=components,
-            tags=list(metric.tags or ()),
-        )
-
-    def _compute_aerobic_capacity(self, athlete: Athlete) -> MetricScore | None:
-        metric = self._get_metric_definition("aerobic_capacity")
-        tests = self._resolve_tests(metric.primary_tests)
-        results = self._fetch_results(athlete.id, tests)
-        if not results:
+        if not values:
             return None
-
-        test = tests[0]
-        test_id = test.definition.id
-        if test_id is None or test_id not in results:
+        headline = calculator.combine(values, _age_from_birth_year(athlete))
+        if headline is None:
             return None
-        best_level = self._best_value(results[test_id], higher_is_better=True)
-        vo2_estimate = round(3.46 * best_level + 12, 2)
-
-        components = [
-            MetricComponent(
-                label=test.definition.name,
-                value=best_level,
-                unit=test.definition.unit or "level",
-            )
-        ]
 
         return MetricScore(
             id=metric.id,
             name=metric.name,
             category=metric.category,
             description=metric.description,
-            direction="higher_is_better",
-            value=vo2_estimate,
-            unit="ml·kg⁻¹·min⁻¹",
+            direction=metric.direction
+            if metric.direction in {"higher_is_better", "lower_is_better", "mixed"}
+            else "mixed",
+            value=round(headline, 2),
+            unit=calculator.unit,
             components=components,
             tags=list(metric.tags or ()),
         )
 
-    def _compute_metric(self, athlete: Athlete, metric_id: str) -> MetricScore | None:
-        if metric_id == "short_acceleration":
-            return self._compute_short_acceleration(athlete)
-        if metric_id == "top_end_speed":
-            return self._compute_top_end_speed(athlete)
-        if metric_id == "lower_body_power":
-            return self._compute_lower_body_power(athlete)
-        if metric_id == "aerobic_capacity":
-            return self._compute_aerobic_capacity(athlete)
-        return None
+    def score_cohort(
+        self, athletes: Sequence[Athlete], metric_ids: Sequence[str]
+    ) -> dict[str, dict[int, MetricScore]]:
+        """Compute several metrics for many athletes from one aggregation pass.
+
+        Returns scores keyed by metric id, then athlete id.  Unknown metric ids
+        raise ``KeyError``; metrics without a calculator score nobody.
+        """
+        plans: list[tuple[MetricDefinition, MetricCalculator, list[_TestMeta]]] = []
+        test_ids: set[int] = set()
+        scores: dict[str, dict[int, MetricScore]] = {}
+        for metric_id in metric_ids:
+            definition = self._get_metric_definition(metric_id)
+            scores[metric_id] = {}
+            calculator = get_calculator(metric_id)
+            if calculator is None:
+                continue
+            tests = self._resolve_tests(definition.primary_tests)
+            plans.append((definition, calculator, tests))
+            test_ids.update(test.definition.id for test in tests if test.definition.id)
+
+        ranges = self._fetch_trial_ranges([athlete.id for athlete in athletes], test_ids)
+        for athlete in athletes:
+            athlete_ranges = ranges.get(athlete.id)
+            if not athlete_ranges:
+                continue
+            for definition, calculator, tests in plans:
+                results = self._best_values(definition, tests, athlete_ranges)
+                score = self._score_metric(
+                    definition, calculator, tests, athlete, results
+                )
+                if score is not None:
+                    scores[definition.id][athlete.id] = score
+        return scores
 
     def build_metric_response(
         self,
         athlete: Athlete,
         metric_ids: Sequence[str] | None = None,
     ) -> AthleteMetricsResponse:
-        targets = metric_ids or [
-            "short_acceleration",
-            "top_end_speed",
-            "lower_body_power",
-            "aerobic_capacity",
+        targets = [
+            metric_id
+            for metric_id in (metric_ids or DEFAULT_METRIC_IDS)
+            if metric_id in KNOWN_METRIC_IDS
         ]
+        scores = self.score_cohort([athlete], targets)
         metrics: list[MetricScore] = []
         for metric_id in targets:
-            score = self._compute_metric(athlete, metric_id)
+            score = scores[metric_id].get(athlete.id)
             if score is not None:
                 metrics.append(score)
         return AthleteMetricsResponse(athlete_id=athlete.id, metrics=metrics)
 
+    def score_athletes(
+        self, metric_id: str, athletes: Sequence[Athlete]
+    ) -> dict[int, MetricScore]:
+        """Compute one metric for many athletes, keyed by athlete id."""
+        return self.score_cohort(athletes, [metric_id])[metric_id]
+
     def metric_ranking(
         self,
         metric_id: str,
         athletes: Sequence[Athlete],
         limit: int = 10,
+        scores: dict[int, MetricScore] | None = None,
     ) -> MetricRankingResponse:
         definition = self._get_metric_definition(metric_id)
-        entries: list[RankingEntry] = []
-        for athlete in athletes:
-            score = self._compute_metric(athlete, metric_id)
-            if score is None or score.value is None:
-                continue
-            entries.append(
-                RankingEntry(
-                    athlete_id=athlete.id,
-                    full_name=f"{athlete.first_name} {athlete.last_name}",
-                    value=score.value,
-                    unit=score.unit,
-                    team=athlete.club_affiliation,
-                    age=_age_from_birth_year(athlete),
-                    gender=athlete.gender.value if athlete.gender else None,
-                )
+        if scores is None:
+            scores = self.score_athletes(metric_id, athletes)
+        winners = top_scores(
+            athletes,
+            scores,
+            limit,
+            descending=definition.direction != "lower_is_better",
+        )
+        entries = [
+            RankingEntry(
+                athlete_id=athlete.id,
+                full_name=f"{athlete.first_name} {athlete.last_name}",
+                value=score.value,
+                unit=score.unit,
+                team=athlete.club_affiliation,
+                age=_age_from_birth_year(athlete),
+                gender=athlete.gender.value if athlete.gender else None,
             )
-
-        reverse = definition.direction != "lower_is_better"
-        entries.sort(key=lambda item: item.value, reverse=reverse)
-        entries = entries[:limit]
+            for athlete, score in winners
+        ]
 
         representative = MetricScore(
             id=definition.id,
@@ -382,6 +297,63 @@ class MetricEngine:
         return MetricRankingResponse(metric=representative, entries=entries)
 
 
+def top_scores(
+    athletes: Iterable[Athlete],
+    scores: dict[int, MetricScore],
+    limit: int,
+    *,
+    descending: bool,
+) -> list[tuple[Athlete, MetricScore]]:
+    """The ``limit`` best scored athletes, keeping input order on ties.
+
+    Selection runs over plain tuples in a bounded heap, so callers only build
+    response models for the winners.
+    """
+    candidates = (
+        (athlete, score)
+        for athlete in athletes
+        if (score := scores.get(athlete.id)) is not None and score.value is not None
+    )
+    select_top = heapq.nlargest if descending else heapq.nsmallest
+    return select_top(limit, candidates, key=lambda item: item[1].value)
+
+
+def _gender_target(gender: str) -> AthleteGender:
+    gender_norm = gender.lower()
+    if gender_norm in {"m", "boy", "boys", "male", "masculino"}:
+        return AthleteGender.male
+    return AthleteGender.female
+
+
+def _years_before(today: date, years: int) -> date:
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:  # 29 February in a non-leap year
+        return today.replace(year=today.year - years, day=28)
+
+
+def athlete_filter_clauses(
+    *,
+    age_category: str | None = None,
+    gender: str | None = None,
+    today: date | None = None,
+) -> list[ColumnElement[bool]]:
+    """SQL equivalent of :func:`filter_athletes` for ``select(Athlete)``.
+
+    Age bounds become a birth-date range: an athlete is at least ``n`` years
+    old when born on or before the same day ``n`` years ago.
+    """
+    clauses: list[ColumnElement[bool]] = []
+    if gender:
+        clauses.append(Athlete.gender == _gender_target(gender))
+    if age_category and age_category in AGE_CATEGORY_BOUNDS:
+        lower, upper = AGE_CATEGORY_BOUNDS[age_category]
+        today = today or date.today()
+        clauses.append(Athlete.birth_date <= _years_before(today, lower))
+        clauses.append(Athlete.birth_date > _years_before(today, upper + 1))
+    return clauses
+
+
 def filter_athletes(
     athletes: Sequence[Athlete],
     *,
@@ -391,13 +363,7 @@ def filter_athletes(
     filtered: list[Athlete] = []
     for athlete in athletes:
         if gender:
-            gender_norm = gender.lower()
-            target = (
-                "male"
-                if gender_norm in {"m", "boy", "boys", "male", "masculino"}
-                else "female"
-            )
-            if not athlete.gender or athlete.gender.value != target:
+            if athlete.gender != _gender_target(gender):
                 continue
         if age_category and age_category in AGE_CATEGORY_BOUNDS:
             bounds = AGE_CATEGORY_BOUNDS[age_category]
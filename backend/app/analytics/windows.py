@@ -0,0 +1,41 @@
+"""Date windows for the time-windowed leaderboards."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Literal
+
+LeaderboardWindow = Literal["all_time", "season", "month", "last_days"]
+DateRange = tuple[date, date]
+
+
+def season_start(today: date, start_month: int) -> date:
+    """First day of the season containing ``today``."""
+    year = today.year if today.month >= start_month else today.year - 1
+    return date(year, start_month, 1)
+
+
+def resolve_window(
+    window: LeaderboardWindow,
+    today: date,
+    *,
+    days: int = 30,
+    season_start_month: int = 8,
+) -> DateRange | None:
+    """Return the inclusive ``(start, end)`` dates, or ``None`` for all time."""
+    if window == "season":
+        return season_start(today, season_start_month), today
+    if window == "month":
+        return today.replace(day=1), today
+    if window == "last_days":
+        return today - timedelta(days=days - 1), today
+    return None
+
+
+def bucket_date(value: date | datetime | str) -> date:
+    """Normalise a timestamp (or SQLite ``date()`` string) to its day bucket."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
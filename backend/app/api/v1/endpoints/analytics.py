@@ -1,37 +1,53 @@
 from __future__ import annotations
 
+from datetime import date
 from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import case, func
+from fastapi.responses import Response
+from sqlalchemy import Float, cast
 from sqlmodel import Session, select
 
-from app.analytics.metric_engine import MetricEngine, filter_athletes
+from app.analytics.cohorts import build_percentile_response
+from app.analytics.metric_engine import MetricEngine, athlete_filter_clauses
+from app.analytics.windows import DateRange, LeaderboardWindow, resolve_window
 from app.api.deps import get_current_active_user
+from app.core.config import settings
+from app.core.response_cache import (
+    LEADERBOARD_COMBINE,
+    LEADERBOARD_SCORING,
+    METRIC_RANKINGS,
+    cached_response,
+)
 from app.db.session import get_session
 from app.models.athlete import Athlete, AthleteStatus
-from app.models.match_stat import MatchStat
 from app.models.team import Team
-from app.models.team_combine_metric import TeamCombineMetric
 from app.models.user import User, UserRole
 from app.schemas.analytics import (
     AthleteMetricsResponse,
+    AthletePercentilesResponse,
     CombineLeaderboardResponse,
     LeaderboardEntry,
     LeaderboardResponse,
     MetricRankingResponse,
 )
+from app.services.combine_bucket_service import COMBINE_METRIC_CONFIG, combine_bests
+from app.services.metric_snapshot_service import (
+    build_snapshot_metric_response,
+    rank_metric_scores,
+)
+from app.services.scoring_rollup_service import scoring_totals
 
 router = APIRouter()
 
-COMBINE_METRIC_CONFIG: dict[str, dict[str, str | None]] = {
-    "split_10m_s": {"direction": "lower_is_better", "unit": "s"},
-    "split_20m_s": {"direction": "lower_is_better", "unit": "s"},
-    "split_35m_s": {"direction": "lower_is_better", "unit": "s"},
-    "jump_cm": {"direction": "higher_is_better", "unit": "cm"},
-    "max_power_kmh": {"direction": "higher_is_better", "unit": "km/h"},
-    "yoyo_distance_m": {"direction": "higher_is_better", "unit": "m"},
-}
+
+def _window_range(window: LeaderboardWindow, days: int) -> DateRange | None:
+    return resolve_window(
+        window,
+        date.today(),
+        days=days,
+        season_start_month=settings.SEASON_START_MONTH,
+    )
 
 
 @router.get("/athletes/{athlete_id}/metrics", response_model=AthleteMetricsResponse)
@@ -48,15 +64,41 @@ def athlete_metrics(
         )
     if current_user.role == UserRole.ATHLETE and current_user.athlete_id != athlete.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed")
-    engine = MetricEngine(session)
     try:
-        return engine.build_metric_response(athlete, metric_ids)
+        return build_snapshot_metric_response(session, athlete, metric_ids)
     except KeyError as exc:  # pragma: no cover - defensive
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
         ) from exc
 
 
+@router.get(
+    "/athletes/{athlete_id}/percentiles", response_model=AthletePercentilesResponse
+)
+def athlete_percentiles(
+    athlete_id: int,
+    test_ids: list[int] | None = Query(default=None, alias="test_id"),
+    by_age_band: bool = Query(default=True),
+    by_gender: bool = Query(default=True),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user),
+) -> AthletePercentilesResponse:
+    athlete = session.get(Athlete, athlete_id)
+    if athlete is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Athlete not found"
+        )
+    if current_user.role == UserRole.ATHLETE and current_user.athlete_id != athlete.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed")
+    return build_percentile_response(
+        session,
+        athlete,
+        test_ids,
+        by_age_band=by_age_band,
+        by_gender=by_gender,
+    )
+
+
 @router.get("/rankings/metrics/{metric_id}", response_model=MetricRankingResponse)
 def metric_ranking(
     metric_id: str,
@@ -65,31 +107,40 @@ def metric_ranking(
     age_category: str | None = Query(default=None),
     session: Session = Depends(get_session),
     _current_user: User = Depends(get_current_active_user),
-) -> MetricRankingResponse:
-    statement = select(Athlete).where(Athlete.status == AthleteStatus.active)
-    engine = MetricEngine(session)
-    athletes = session.exec(statement).all()
-    if not athletes:
-        try:
-            return engine.metric_ranking(metric_id, [], limit=limit)
-        except KeyError as exc:  # pragma: no cover - defensive
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
-            ) from exc
-
-    filtered_athletes = filter_athletes(
-        athletes, age_category=age_category, gender=gender
+) -> Response:
+    return cached_response(
+        session,
+        METRIC_RANKINGS,
+        {
+            "metric_id": metric_id,
+            "limit": limit,
+            "gender": gender,
+            "age_category": age_category,
+        },
+        lambda: _metric_ranking(session, metric_id, limit, gender, age_category),
     )
-    if not filtered_athletes:
-        try:
-            return engine.metric_ranking(metric_id, [], limit=limit)
-        except KeyError as exc:  # pragma: no cover - defensive
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
-            ) from exc
 
+
+def _metric_ranking(
+    session: Session,
+    metric_id: str,
+    limit: int,
+    gender: str | None,
+    age_category: str | None,
+) -> MetricRankingResponse:
+    conditions = [
+        Athlete.status == AthleteStatus.active,
+        *athlete_filter_clauses(age_category=age_category, gender=gender),
+    ]
+    engine = MetricEngine(session)
     try:
-        return engine.metric_ranking(metric_id, filtered_athletes, limit=limit)
+        ranked = rank_metric_scores(session, metric_id, conditions, limit, engine)
+        return engine.metric_ranking(
+            metric_id,
+            [athlete for athlete, _ in ranked],
+            limit=limit,
+            scores={athlete.id: score for athlete, score in ranked},
+        )
     except KeyError as exc:  # pragma: no cover - defensive
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
@@ -103,164 +154,117 @@ def scoring_leaderboard(
     gender: str | None = Query(default=None),
     age_category: str | None = Query(default=None),
     team_id: int | None = Query(default=None),
+    window: LeaderboardWindow = Query(default="all_time"),
+    days: int = Query(default=30, ge=1, le=366),
     session: Session = Depends(get_session),
     _current_user: User = Depends(get_current_active_user),
-) -> LeaderboardResponse:
-    if leaderboard_type == "clean_sheets":
-        clean_sheet_case = case((MatchStat.goals_conceded == 0, 1), else_=0)
-        statement = (
-            select(
-                Athlete.id,
-                Athlete.first_name,
-                Athlete.last_name,
-                Athlete.primary_position,
-                Team.name,
-                Team.age_category,
-                Athlete.photo_url,
-                func.count(MatchStat.id).label("games_played"),
-                func.sum(clean_sheet_case).label("clean_sheets"),
-                func.sum(MatchStat.goals_conceded).label("goals_conceded"),
-            )
-            .join(MatchStat, MatchStat.athlete_id == Athlete.id)
-            .outerjoin(Team, Team.id == MatchStat.team_id)
-            .where(Athlete.status == AthleteStatus.active)
-            .where(MatchStat.goals == 0, MatchStat.shootout_goals == 0)
-        )
+) -> Response:
+    date_range = _window_range(window, days)
+    return cached_response(
+        session,
+        LEADERBOARD_SCORING,
+        {
+            "leaderboard_type": leaderboard_type,
+            "limit": limit,
+            "gender": gender.lower() if gender else None,
+            "age_category": age_category,
+            "team_id": team_id,
+            "date_range": date_range,
+        },
+        lambda: _scoring_leaderboard(
+            session,
+            leaderboard_type,
+            limit,
+            gender,
+            age_category,
+            team_id,
+            date_range,
+        ),
+    )
 
-        if gender:
-            statement = statement.where(Athlete.gender == gender.lower())
-        if age_category:
-            statement = statement.where(Team.age_category == age_category)
-        if team_id is not None:
-            statement = statement.where(MatchStat.team_id == team_id)
 
-        grouped = statement.group_by(
-            Athlete.id,
+def _scoring_leaderboard(
+    session: Session,
+    leaderboard_type: Literal["scorers", "clean_sheets"],
+    limit: int,
+    gender: str | None,
+    age_category: str | None,
+    team_id: int | None,
+    date_range: DateRange | None,
+) -> LeaderboardResponse:
+    totals = scoring_totals(date_range)
+    statement = (
+        select(
+            totals.c.athlete_id,
+            totals.c.goals,
+            totals.c.goalless_games,
+            totals.c.clean_sheets,
+            totals.c.goals_conceded,
             Athlete.first_name,
             Athlete.last_name,
             Athlete.primary_position,
+            Athlete.photo_url,
             Team.name,
             Team.age_category,
-            Athlete.photo_url,
         )
+        .join(Athlete, Athlete.id == totals.c.athlete_id)
+        .outerjoin(Team, Team.id == totals.c.team_id)
+        .where(Athlete.status == AthleteStatus.active)
+    )
+    if gender:
+        statement = statement.where(Athlete.gender == gender.lower())
+    if age_category:
+        statement = statement.where(Team.age_category == age_category)
+    if team_id is not None:
+        statement = statement.where(totals.c.team_id == team_id)
 
-        rows = session.exec(grouped).all()
-        entries: list[LeaderboardEntry] = []
-
-        for row in rows:
-            (
-                athlete_id,
-                first_name,
-                last_name,
-                primary_position,
-                team_name,
-                team_age_category,
-                photo_url,
-                games_played,
-                clean_sheets,
-                goals_conceded,
-            ) = row
-
-            games_played = int(games_played or 0)
-            if games_played <= 0:
-                continue
-
-            clean_sheets = int(clean_sheets or 0)
-            goals_conceded = int(goals_conceded or 0)
-
-            entries.append(
-                LeaderboardEntry(
-                    athlete_id=athlete_id,
-                    full_name=f"{first_name} {last_name}",
-                    team=team_name,
-                    age_category=team_age_category,
-                    position=primary_position,
-                    photo_url=photo_url,
-                    goals=0,
-                    clean_sheets=clean_sheets,
-                    games_played=games_played,
-                    goals_conceded=goals_conceded,
-                )
-            )
-
-        entries.sort(
-            key=lambda entry: (
-                -entry.clean_sheets,
-                entry.goals_conceded / entry.games_played
-                if entry.games_played
-                else float("inf"),
-            ),
+    if leaderboard_type == "clean_sheets":
+        conceded_per_game = cast(totals.c.goals_conceded, Float) / (
+            totals.c.goalless_games
         )
-    else:
-        statement = (
-            select(
-                Athlete.id,
-                Athlete.first_name,
-                Athlete.last_name,
-                Athlete.primary_position,
-                Team.name,
-                Team.age_category,
-                Athlete.photo_url,
-                func.sum(MatchStat.goals).label("goals"),
-            )
-            .join(MatchStat, MatchStat.athlete_id == Athlete.id)
-            .outerjoin(Team, Team.id == MatchStat.team_id)
-            .where(Athlete.status == AthleteStatus.active)
+        statement = statement.where(totals.c.goalless_games > 0).order_by(
+            totals.c.clean_sheets.desc(),
+            conceded_per_game,
+            totals.c.athlete_id,
         )
-
-        if gender:
-            statement = statement.where(Athlete.gender == gender.lower())
-        if age_category:
-            statement = statement.where(Team.age_category == age_category)
-        if team_id is not None:
-            statement = statement.where(MatchStat.team_id == team_id)
-
-        grouped = statement.group_by(
-            Athlete.id,
-            Athlete.first_name,
-            Athlete.last_name,
-            Athlete.primary_position,
-            Team.name,
-            Team.age_category,
-            Athlete.photo_url,
+    else:
+        statement = statement.where(totals.c.goals > 0).order_by(
+            totals.c.goals.desc(), totals.c.athlete_id
         )
 
-        rows = session.exec(grouped).all()
-        entries = []
-
-        for row in rows:
-            (
-                athlete_id,
-                first_name,
-                last_name,
-                primary_position,
-                team_name,
-                team_age_category,
-                photo_url,
-                goals,
-            ) = row
-
-            goals = int(goals or 0)
-            if goals <= 0:
-                continue
-
-            entries.append(
-                LeaderboardEntry(
-                    athlete_id=athlete_id,
-                    full_name=f"{first_name} {last_name}",
-                    team=team_name,
-                    age_category=team_age_category,
-                    position=primary_position,
-                    photo_url=photo_url,
-                    goals=goals,
-                    clean_sheets=0,
-                )
+    entries: list[LeaderboardEntry] = []
+    for (
+        athlete_id,
+        goals,
+        goalless_games,
+        clean_sheets,
+        goals_conceded,
+        first_name,
+        last_name,
+        primary_position,
+        photo_url,
+        team_name,
+        team_age_category,
+    ) in session.exec(statement.limit(limit)).all():
+        if leaderboard_type == "clean_sheets":
+            counts = {
+                "clean_sheets": int(clean_sheets),
+                "games_played": int(goalless_games),
+                "goals_conceded": int(goals_conceded),
+            }
+        else:
+            counts = {"goals": int(goals)}
+        entries.append(
+            LeaderboardEntry(
+                athlete_id=athlete_id,
+                full_name=f"{first_name} {last_name}",
+                team=team_name,
+                age_category=team_age_category,
+                position=primary_position,
+                photo_url=photo_url,
+                **counts,
             )
-
-        entries.sort(key=lambda entry: entry.goals, reverse=True)
-
-    if len(entries) > limit:
-        entries = entries[:limit]
+        )
 
     return LeaderboardResponse(leaderboard_type=leaderboard_type, entries=entries)
 
@@ -280,8 +284,31 @@ def combine_leaderboard(
     ] = Query(default="split_35m_s"),
     team_id: int | None = Query(default=None),
     limit: int = Query(default=5, ge=1, le=50),
+    window: LeaderboardWindow = Query(default="all_time"),
+    days: int = Query(default=30, ge=1, le=366),
     session: Session = Depends(get_session),
     _current_user: User = Depends(get_current_active_user),
+) -> Response:
+    date_range = _window_range(window, days)
+    return cached_response(
+        session,
+        LEADERBOARD_COMBINE,
+        {
+            "metric": metric,
+            "team_id": team_id,
+            "limit": limit,
+            "date_range": date_range,
+        },
+        lambda: _combine_leaderboard(session, metric, team_id, limit, date_range),
+    )
+
+
+def _combine_leaderboard(
+    session: Session,
+    metric: str,
+    team_id: int | None,
+    limit: int,
+    date_range: DateRange | None,
 ) -> CombineLeaderboardResponse:
     config = COMBINE_METRIC_CONFIG.get(metric)
     if config is None:  # pragma: no cover - defensive
@@ -289,43 +316,30 @@ def combine_leaderboard(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid metric"
         )
 
-    metric_column = getattr(TeamCombineMetric, metric)
-    aggregate_fn = func.min if config["direction"] == "lower_is_better" else func.max
-    value_expression = aggregate_fn(metric_column)
-
+    bests = combine_bests(metric, date_range)
     statement = (
         select(
-            TeamCombineMetric.athlete_id,
+            bests.c.athlete_id,
             Athlete.first_name,
             Athlete.last_name,
             Athlete.photo_url,
             Team.name,
             Team.age_category,
-            value_expression.label("value"),
+            bests.c.value,
         )
-        .join(Athlete, Athlete.id == TeamCombineMetric.athlete_id)
-        .outerjoin(Team, Team.id == TeamCombineMetric.team_id)
-        .where(metric_column.isnot(None))
+        .join(Athlete, Athlete.id == bests.c.athlete_id)
+        .outerjoin(Team, Team.id == bests.c.team_id)
     )
 
     if team_id is not None:
-        statement = statement.where(TeamCombineMetric.team_id == team_id)
-
-    grouped = statement.group_by(
-        TeamCombineMetric.athlete_id,
-        Athlete.first_name,
-        Athlete.last_name,
-        Athlete.photo_url,
-        Team.name,
-        Team.age_category,
-    )
+        statement = statement.where(bests.c.team_id == team_id)
 
     order_clause = (
-        value_expression.asc()
+        bests.c.value.asc()
         if config["direction"] == "lower_is_better"
-        else value_expression.desc()
+        else bests.c.value.desc()
     )
-    ranked = grouped.order_by(order_clause).limit(limit)
+    ranked = statement.order_by(order_clause, bests.c.athlete_id).limit(limit)
     rows = session.exec(ranked).all()
 
     entries = [
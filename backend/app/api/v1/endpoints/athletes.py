@@ -9,15 +9,18 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, s
 from sqlmodel import Session, delete, select, func
 from sqlalchemy.orm import selectinload
 
+from app.analytics.cohorts import invalidate_cohort_distributions
 from app.api.deps import ensure_roles, get_current_active_user
 from app.core.config import settings
 from app.core.crypto import encrypt_text
+from app.core.response_cache import invalidate_responses
 from app.core.security import get_password_hash
 from app.core.security_token import security_token_manager
 from app.db.session import get_session
 from app.models.athlete import Athlete, AthleteGender
 from app.models.athlete_detail import AthleteDetail
 from app.models.athlete_document import AthleteDocument
+from app.models.athlete_metric_snapshot import AthleteMetricSnapshot
 from app.models.athlete_payment import AthletePayment
 from app.models.assessment_session import AssessmentSession
 from app.models.event_participant import EventParticipant
@@ -31,12 +34,24 @@ from app.models.password_setup_code import PasswordSetupCode
 # from app.core.security import create_signup_token # Removed F401
 from jose import jwt, JWTError
 from app.services.email_service import email_service
+from app.services.event_visibility_service import (
+    discard_event_visibility,
+    refresh_event_visibility,
+)
 from app.services.athlete_service import (
     build_athlete_query_for_user,
     MANAGE_ATHLETE_ROLES,
     approve_athlete as approve_athlete_service,
     reject_athlete as reject_athlete_service,
 )
+from app.services.peer_average_service import (
+    discard_athlete_peer_results,
+    invalidate_peer_averages,
+    restore_athlete_peer_results,
+)
+from app.services.combine_bucket_service import discard_athlete_combine_buckets
+from app.services.metric_snapshot_service import refresh_metric_snapshots
+from app.services.scoring_rollup_service import discard_athlete_rollups
 from app.services.storage_service import (
     StorageServiceError,
     athlete_document_key,
@@ -367,8 +382,16 @@ def _ensure_can_edit(current_user: User, athlete: Athlete, session: Session) ->
 
 def _cascade_delete_athlete(session: Session, athlete_id: int) -> None:
     """Remove dependent records before deleting the athlete to avoid FK errors."""
+    discard_athlete_peer_results(session, athlete_id)
     session.exec(delete(SessionResult).where(SessionResult.athlete_id == athlete_id))
     session.exec(delete(MatchStat).where(MatchStat.athlete_id == athlete_id))
+    discard_athlete_rollups(session, athlete_id)
+    discard_athlete_combine_buckets(session, athlete_id)
+    event_ids = session.exec(
+        select(EventParticipant.event_id).where(
+            EventParticipant.athlete_id == athlete_id
+        )
+    ).all()
     session.exec(
         delete(EventParticipant).where(EventParticipant.athlete_id == athlete_id)
     )
@@ -383,13 +406,20 @@ def _cascade_delete_athlete(session: Session, athlete_id: int) -> None:
     )
     session.exec(delete(AthletePayment).where(AthletePayment.athlete_id == athlete_id))
     session.exec(delete(AthleteDetail).where(AthleteDetail.athlete_id == athlete_id))
+    session.exec(
+        delete(AthleteMetricSnapshot).where(
+            AthleteMetricSnapshot.athlete_id == athlete_id
+        )
+    )
     user_ids = [
         row[0] if isinstance(row, tuple) else row
         for row in session.exec(select(User.id).where(User.athlete_id == athlete_id)).all()
     ]
     if user_ids:
         session.exec(delete(TeamPost).where(TeamPost.author_id.in_(tuple(user_ids))))
+    discard_event_visibility(session, user_ids=user_ids)
     session.exec(delete(User).where(User.athlete_id == athlete_id))
+    refresh_event_visibility(session, event_ids)
 
 
 @router.post(
@@ -903,11 +933,31 @@ def update_athlete(
     if "secondary_position" in update_data and update_data["secondary_position"]:
         update_data["secondary_position"] = update_data["secondary_position"].strip()
 
+    # Peer bands follow the athlete's age, so their results move band.
+    birth_date_changed = (
+        "birth_date" in update_data
+        and update_data["birth_date"] != athlete.birth_date
+    )
+    cohort_changed = birth_date_changed or (
+        "gender" in update_data and update_data["gender"] != athlete.gender
+    )
+    if birth_date_changed:
+        discard_athlete_peer_results(session, athlete_id)
+
     for field, value in update_data.items():
         setattr(athlete, field, value)
 
     session.add(athlete)
+    if birth_date_changed:
+        session.flush()
+        restore_athlete_peer_results(session, athlete_id)
+        refresh_metric_snapshots(session, [athlete_id])
     session.commit()
+    if birth_date_changed:
+        invalidate_peer_averages()
+    if cohort_changed:
+        invalidate_cohort_distributions()
+    invalidate_responses()
     session.refresh(athlete)
 
     # Notify user if they were moved to a different team
@@ -943,6 +993,9 @@ def delete_athlete(
     _cascade_delete_athlete(session, athlete_id)
     session.delete(athlete)
     session.commit()
+    invalidate_cohort_distributions()
+    invalidate_peer_averages()
+    invalidate_responses()
     return None
 
 
@@ -1015,6 +1068,7 @@ async def upload_photo(
         session.add(linked_user)
     session.add(athlete)
     session.commit()
+    invalidate_responses()
     session.refresh(athlete)
     return athlete
 
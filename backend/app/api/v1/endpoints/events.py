@@ -1,10 +1,17 @@
 """API endpoints for events management."""
 
-from datetime import date as date_type, datetime, time as time_type, timezone
+from datetime import date as date_type, datetime, time as time_type, timedelta, timezone
 import logging
 from typing import Iterable, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
 from fastapi.responses import RedirectResponse
 from sqlalchemy import delete, or_
 from sqlmodel import Session, select
@@ -15,7 +22,6 @@ from app.core.security_token import security_token_manager
 from app.models.event import Event, EventStatus, Notification
 from app.models.event_participant import EventParticipant, ParticipantStatus
 from app.models.event_team_link import EventTeamLink
-from app.models.athlete import Athlete
 from app.models.team import CoachTeamLink
 from app.models.user import User, UserRole
 from app.schemas.event import (
@@ -27,17 +33,29 @@ from app.schemas.event import (
     EventUpdate,
 )
 from app.services.notification_service import notification_service
+from app.services.event_query_service import (
+    ALL_EVENTS_ROLES,
+    list_visible_events,
+    newest_first,
+)
 from app.services.event_team_service import (
     attach_team_ids,
     ensure_roster_participants,
+    ensure_user_participants,
     get_event_athlete_ids,
     get_team_roster_athlete_ids,
+    invite_event_participants,
     persist_event_team_links,
     resolve_event_team_ids,
 )
+from app.services.event_visibility_service import can_view_event
 
 router = APIRouter()
 MANAGE_EVENT_ROLES = {UserRole.ADMIN, UserRole.STAFF, UserRole.COACH}
+MY_EVENTS_LOOKBACK_DAYS = 31
+MY_EVENTS_MAX_WINDOW_DAYS = 400
+MY_EVENTS_PAGE_DEFAULT_SIZE = 200
+MY_EVENTS_PAGE_MAX_SIZE = 500
 logger = logging.getLogger(__name__)
 
 
@@ -78,37 +96,12 @@ def _coach_team_ids(db: Session, coach_id: int) -> set[int]:
     }
 
 
-def _ensure_user_participants(
-    db: Session, event: Event, user_ids: Iterable[int]
-) -> None:
-    normalized = {user_id for user_id in user_ids if user_id is not None}
-    if not normalized or not event.id:
-        return
-    existing_rows = db.exec(
-        select(EventParticipant.user_id).where(
-            EventParticipant.event_id == event.id,
-            EventParticipant.user_id is not None, # Changed != None to is not None
-        )
-    ).all()
-    existing = {row[0] for row in existing_rows if row and row[0] is not None}
-    missing = normalized - existing
-    for user_id in missing:
-        db.add(
-            EventParticipant(
-                event_id=event.id,
-                user_id=user_id,
-                status=ParticipantStatus.INVITED,
-            )
-        )
-
-
 @router.post("/", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
 async def create_event(
     *,
     db: SessionDep,
     current_user: User = Depends(get_current_active_user),
     event_in: EventCreate,
-    background_tasks: BackgroundTasks,
 ) -> Event:
     """Create a new event and notify invitees."""
     ensure_roles(current_user, MANAGE_EVENT_ROLES)
@@ -157,36 +150,14 @@ async def create_event(
     }
     invitee_user_ids.update(athlete_user_map.values())
 
-    _ensure_user_participants(db, event, invitee_user_ids)
-
-    existing_participants = db.exec(
-        select(EventParticipant).where(
-            EventParticipant.event_id == event.id, EventParticipant.user_id is not None # Changed != None to is not None
-        )
-    ).all()
-    participants_by_user: dict[int, EventParticipant] = {
-        ep.user_id: ep for ep in existing_participants if ep.user_id is not None
-    }
-
-    # Create or update participants for athletes (link user_id when available)
-    for athlete_id in all_athlete_ids:
-        linked_user_id = athlete_user_map.get(athlete_id)
-        if linked_user_id and linked_user_id in participants_by_user:
-            participant = participants_by_user[linked_user_id]
-            if participant.athlete_id is None:
-                participant.athlete_id = athlete_id
-            if participant.status is None:
-                participant.status = ParticipantStatus.INVITED
-            db.add(participant)
-            continue
-        db.add(
-            EventParticipant(
-                event_id=event.id,
-                user_id=linked_user_id,
-                athlete_id=athlete_id,
-                status=ParticipantStatus.INVITED,
-            )
-        )
+    # Linked athletes are invited once with both ids; everyone else by user id.
+    linked_user_ids = set(athlete_user_map.values())
+    invite_event_participants(
+        db,
+        event.id,
+        [(athlete_user_map.get(athlete_id), athlete_id) for athlete_id in all_athlete_ids]
+        + [(user_id, None) for user_id in sorted(invitee_user_ids - linked_user_ids)],
+    )
 
     db.commit()
     db.refresh(event)
@@ -202,7 +173,6 @@ async def create_event(
             invitee_ids=user_invitees_list,
             send_email=event_in.send_email,
             send_push=event_in.send_push,
-            background_tasks=background_tasks,
         )
 
     # Refresh to get participants
@@ -223,6 +193,7 @@ def list_events(
     size: int = 50,
 ) -> List[Event]:
     """List all events, optionally filtered."""
+    allowed_team_ids: set[int] = set()
     if current_user.role == UserRole.COACH:
         allowed_team_ids = _coach_team_ids(db, current_user.id)
         if team_id is not None and team_id not in allowed_team_ids:
@@ -246,13 +217,11 @@ def list_events(
             EventTeamLink.team_id == team_id
         )
         stmt = stmt.where(Event.id.in_(linked_event_ids))
-    elif current_user.role == UserRole.COACH:
-        allowed_team_ids = _coach_team_ids(db, current_user.id)
-        if allowed_team_ids:
-            linked_event_ids = select(EventTeamLink.event_id).where(
-                EventTeamLink.team_id.in_(allowed_team_ids)
-            )
-            stmt = stmt.where(Event.id.in_(linked_event_ids))
+    elif allowed_team_ids:
+        linked_event_ids = select(EventTeamLink.event_id).where(
+            EventTeamLink.team_id.in_(allowed_team_ids)
+        )
+        stmt = stmt.where(Event.id.in_(linked_event_ids))
 
     # Filter by date range
     parsed_from = _parse_date_str(date_from)
@@ -267,7 +236,7 @@ def list_events(
             EventParticipant.athlete_id == athlete_id
         )
 
-    stmt = stmt.order_by(Event.event_date.desc(), Event.start_time.desc())
+    stmt = newest_first(stmt)
     offset = (page - 1) * size
     stmt = stmt.offset(offset).limit(size)
 
@@ -281,130 +250,64 @@ def list_my_events(
     *,
     db: SessionDep,
     current_user: User = Depends(get_current_active_user),
+    response: Response,
+    date_from: Optional[date_type] = None,
+    date_to: Optional[date_type] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(
+        default=MY_EVENTS_PAGE_DEFAULT_SIZE, ge=1, le=MY_EVENTS_PAGE_MAX_SIZE
+    ),
 ) -> List[Event]:
-    """List events where current user deve ter visibilidade confiável."""
-    log_payload: dict[str, object] = {
-        "user_id": current_user.id,
-        "role": getattr(current_user, "role", None),
-    }
+    """List events where current user deve ter visibilidade confiável.
 
-    def _add(store: dict[int, Event], items: list[Event]) -> None:
-        for event in items:
-            if event.id is None:
-                continue
-            store.setdefault(event.id, event)
-
-    # Admin/Staff: veem tudo ordenado
-    if current_user.role in {UserRole.ADMIN, UserRole.STAFF}:
-        events = db.exec(select(Event)).all()
-        events = sorted(
-            events,
-            key=lambda e: (e.event_date or date_type.min, e.start_time or time_type.min),
-            reverse=True,
+    Results are limited to a date window (by default from a month ago to about
+    a year ahead) and paginated newest first; the cursor of the next page is
+    returned in the ``X-Next-Cursor`` header.
+    """
+    if date_from is None:
+        date_from = (
+            date_to - timedelta(days=MY_EVENTS_MAX_WINDOW_DAYS)
+            if date_to
+            else date_type.today() - timedelta(days=MY_EVENTS_LOOKBACK_DAYS)
         )
-        log_payload["mode"] = "admin_staff_all"
-        log_payload["total_returned"] = len(events)
-        logger.info("my-events lookup: %s", log_payload)
-        attach_team_ids(db, events)
-        return events
-
-    all_events: dict[int, Event] = {}
-
-    created_events = db.exec(
-        select(Event).where(Event.created_by_id == current_user.id)
-    ).all()
-    _add(all_events, created_events)
-    log_payload["created_count"] = len(created_events)
-
-    invited_events = db.exec(
-        select(Event)
-        .join(EventParticipant)
-        .where(EventParticipant.user_id == current_user.id)
-    ).all()
-    _add(all_events, invited_events)
-    log_payload["invited_count"] = len(invited_events)
-
-    # Athlete: eventos pelo participant.athlete_id e pelo time associado
-    athlete_events: list[Event] = []
-    team_roster_events: list[Event] = []
-    if current_user.role == UserRole.ATHLETE and current_user.athlete_id is not None:
-        athlete_events = db.exec(
-            select(Event)
-            .join(EventParticipant)
-            .where(EventParticipant.athlete_id == current_user.athlete_id)
-        ).all()
-        _add(all_events, athlete_events)
-
-        # eventos do time do atleta (via Event.team_id ou EventTeamLink)
-        athlete_team_id = None
-        athlete = db.get(Athlete, current_user.athlete_id)
-        if athlete is not None:
-            athlete_team_id = athlete.team_id
-        if athlete_team_id is not None:
-            team_roster_events = db.exec(
-                select(Event)
-                .join(EventTeamLink)
-                .where(EventTeamLink.team_id == athlete_team_id)
-            ).all()
-            _add(all_events, team_roster_events)
-
-    # Coach: eventos por times vinculados, coach_id e convites diretos
-    coach_team_ids: set[int] = set()
-    team_events: list[Event] = []
-    linked_team_events: list[Event] = []
-    coach_owned_events: list[Event] = []
-    if current_user.role == UserRole.COACH:
-        coach_owned_events = db.exec(
-            select(Event).where(Event.coach_id == current_user.id)
-        ).all()
-        _add(all_events, coach_owned_events)
-
-        coach_team_ids = _coach_team_ids(db, current_user.id)
-        if coach_team_ids:
-            linked_team_events = db.exec(
-                select(Event)
-                .join(EventTeamLink)
-                .where(EventTeamLink.team_id.in_(coach_team_ids))
-            ).all()
-            _add(all_events, linked_team_events)
-
-    events = sorted(
-        all_events.values(),
-        key=lambda e: (e.event_date or date_type.min, e.start_time or time_type.min),
-        reverse=True,
-    )
-    log_payload.update(
+    if date_to is None:
+        date_to = date_from + timedelta(days=MY_EVENTS_MAX_WINDOW_DAYS)
+    if date_to < date_from or (date_to - date_from).days > MY_EVENTS_MAX_WINDOW_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date window must span 0-{MY_EVENTS_MAX_WINDOW_DAYS} days",
+        )
+    try:
+        events, next_cursor = list_visible_events(
+            db,
+            current_user,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from exc
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    logger.info(
+        "my-events lookup: %s",
         {
-            "athlete_count": len(athlete_events),
-            "team_roster_count": len(team_roster_events),
-            "coach_owned_count": len(coach_owned_events),
-            "team_events_count": len(team_events),
-            "linked_team_events_count": len(linked_team_events),
-            "coach_team_ids": sorted(coach_team_ids),
+            "user_id": current_user.id,
+            "role": getattr(current_user, "role", None),
+            "mode": (
+                "admin_staff_all"
+                if current_user.role in ALL_EVENTS_ROLES
+                else "visibility_query"
+            ),
+            "date_from": date_from.isoformat(),
+            "date_to": date_to.isoformat(),
             "total_returned": len(events),
-            "query_summary": {
-                "created_by": f"Event.created_by_id == {current_user.id}",
-                "invited": "JOIN EventParticipant.user_id",
-                "athlete": (
-                    f"JOIN EventParticipant.athlete_id == {current_user.athlete_id}"
-                    if current_user.athlete_id is not None
-                    else None
-                ),
-                "coach_id": f"Event.coach_id == {current_user.id}",
-                "team_id": (
-                    f"Event.team_id IN {sorted(coach_team_ids)}"
-                    if coach_team_ids
-                    else None
-                ),
-                "event_team_link": (
-                    f"EventTeamLink.team_id IN {sorted(coach_team_ids)}"
-                    if coach_team_ids
-                    else None
-                ),
-            },
-        }
+            "has_more": next_cursor is not None,
+        },
     )
-    logger.info("my-events lookup: %s", log_payload)
     attach_team_ids(db, events)
     return events
 
@@ -420,29 +323,12 @@ def get_event(
     event = db.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    if current_user.role == UserRole.COACH:
-        allowed_team_ids = _coach_team_ids(db, current_user.id)
-        linked_team_ids = db.exec(
-            select(EventTeamLink.team_id).where(EventTeamLink.event_id == event.id)
-        ).all()
-        linked_set = {
-            row[0] if isinstance(row, tuple) else row
-            for row in linked_team_ids
-            if row is not None
-        }
-        if linked_set.intersection(allowed_team_ids):
-            pass
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed"
-            )
-    if current_user.role == UserRole.ATHLETE:
-        is_participant = db.exec(
-            select(EventParticipant).where(
-                EventParticipant.event_id == event.id,
-                EventParticipant.athlete_id == current_user.athlete_id,
-            )
-        ).first()
+    if current_user.role == UserRole.COACH and not can_view_event(
+        db, current_user, event.id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed"
+        )
     attach_team_ids(db, [event])
     return event
 
@@ -451,7 +337,6 @@ def get_event(
 async def handle_rsvp_from_token(
     token: str,
     db: SessionDep,
-    background_tasks: BackgroundTasks,
 ) -> RedirectResponse:
     """
     Handles one-click RSVP confirmation from email links.
@@ -502,19 +387,7 @@ async def handle_rsvp_from_token(
 
     if not participant:
         # Create participant if not already existing (e.g., direct RSVP link)
-        allowed = False
-        if user.role == UserRole.COACH:
-            allowed_team_ids = _coach_team_ids(db, user.id)
-            event_team_ids = _event_team_ids(db, event_id)
-            allowed = bool(event_team_ids.intersection(allowed_team_ids))
-        elif user.role == UserRole.ATHLETE:
-            event_team_ids = _event_team_ids(db, event_id)
-            athlete_team_id = _athlete_team_id(db, user)
-            allowed = bool(athlete_team_id and athlete_team_id in event_team_ids)
-        else:
-            allowed = True
-
-        if not allowed:
+        if not can_view_event(db, user, event_id):
             return RedirectResponse(
                 url=f"{settings.FRONTEND_URL}/rsvp-error?message=not_allowed",
                 status_code=status.HTTP_302_FOUND,
@@ -540,7 +413,6 @@ async def handle_rsvp_from_token(
         event=event,
         participant=participant,
         status=new_status.value,  # Pass the enum value
-        background_tasks=background_tasks,
     )
 
     return RedirectResponse(
@@ -556,7 +428,6 @@ async def update_event(
     current_user: User = Depends(get_current_active_user),
     event_id: int,
     event_in: EventUpdate,
-    background_tasks: BackgroundTasks,
 ) -> Event:
     """Update an event and notify participants if requested."""
     ensure_roles(current_user, MANAGE_EVENT_ROLES)
@@ -640,7 +511,7 @@ async def update_event(
         requested_user_ids=None,
         coach_id=event.coach_id,
     )
-    _ensure_user_participants(db, event, auto_invitees)
+    ensure_user_participants(db, event, auto_invitees)
 
     db.commit()
     db.refresh(event)
@@ -653,7 +524,6 @@ async def update_event(
             event=event,
             changes=", ".join(changes),
             send_notification=True,
-            background_tasks=background_tasks,
         )
 
     return event
@@ -694,7 +564,6 @@ async def send_event_reminder(
     current_user: User = Depends(get_current_active_user),
     event_id: int,
     hours_until: int = 24,
-    background_tasks: BackgroundTasks,
 ) -> dict[str, int]:
     """Send reminder emails to confirmed participants for a specific event."""
     ensure_roles(current_user, MANAGE_EVENT_ROLES)
@@ -705,7 +574,6 @@ async def send_event_reminder(
         db=db,
         event=event,
         hours_until=hours_until,
-        background_tasks=background_tasks,
     )
     return {"reminders_sent": sent}
 
@@ -717,7 +585,6 @@ async def add_event_participants(
     current_user: User = Depends(get_current_active_user),
     event_id: int,
     payload: EventParticipantsAdd,
-    background_tasks: BackgroundTasks,
 ) -> Event:
     """Add manual participants to an existing event."""
     ensure_roles(current_user, MANAGE_EVENT_ROLES)
@@ -730,16 +597,17 @@ async def add_event_participants(
     requested_user_ids = {
         user_id for user_id in payload.user_ids if user_id is not None
     }
-    existing_rows = db.exec(
-        select(EventParticipant.user_id).where(
-            EventParticipant.event_id == event.id,
-            EventParticipant.user_id is not None, # Changed != None to is not None
-        )
-    ).all()
-    existing_user_ids = {row[0] for row in existing_rows if row and row[0] is not None}
+    existing_user_ids = set(
+        db.exec(
+            select(EventParticipant.user_id).where(
+                EventParticipant.event_id == event.id,
+                EventParticipant.user_id.is_not(None),
+            )
+        ).all()
+    )
     new_user_ids = sorted(requested_user_ids - existing_user_ids)
 
-    _ensure_user_participants(db, event, requested_user_ids)
+    ensure_user_participants(db, event, requested_user_ids)
     if payload.athlete_ids:
         ensure_roster_participants(db, event, payload.athlete_ids)
 
@@ -754,7 +622,6 @@ async def add_event_participants(
             invitee_ids=new_user_ids,
             send_email=True,
             send_push=False,
-            background_tasks=background_tasks,
         )
         db.refresh(event)
 
@@ -801,7 +668,6 @@ async def confirm_event_attendance(
     current_user: User = Depends(get_current_active_user),
     event_id: int,
     confirmation: EventConfirmation,
-    background_tasks: BackgroundTasks,
 ) -> EventParticipant:
     """Confirm, decline, or mark maybe for event attendance."""
     event = db.get(Event, event_id)
@@ -825,17 +691,9 @@ async def confirm_event_attendance(
             participant.user_id = current_user.id
 
     # Permission check: must be invited or linked to the event
-    if current_user.role == UserRole.COACH:
-        allowed_team_ids = _coach_team_ids(db, current_user.id)
-        event_team_ids = _event_team_ids(db, event_id)
-        if not participant and not (allowed_team_ids and event_team_ids.intersection(allowed_team_ids)):
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to RSVP")
-    if current_user.role == UserRole.ATHLETE:
-        event_team_ids = _event_team_ids(db, event_id)
-        if not participant:
-            athlete_team_id = _athlete_team_id(db, current_user)
-            if not (athlete_team_id and athlete_team_id in event_team_ids):
-                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not invited")
+    if not participant and not can_view_event(db, current_user, event_id):
+        detail = "Not invited" if current_user.role == UserRole.ATHLETE else "Not allowed to RSVP"
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
 
     status_enum = ParticipantStatus(confirmation.status.upper())
 
@@ -862,7 +720,6 @@ async def confirm_event_attendance(
         event=event,
         participant=participant,
         status=status_enum.value,  # Pass the enum value
-        background_tasks=background_tasks,
     )
 
     return participant
@@ -886,21 +743,6 @@ def get_event_participants(
     return participants
 
 
-def _event_team_ids(db: SessionDep, event_id: int) -> set[int]:
-    rows = db.exec(
-        select(EventTeamLink.team_id).where(EventTeamLink.event_id == event_id)
-    ).all()
-    return {row for row in rows if row is not None}
-
-
-def _athlete_team_id(db: SessionDep, user: User) -> int | None:
-    if user.athlete_id:
-        athlete = db.get(Athlete, user.athlete_id)
-        if athlete:
-            return athlete.team_id
-    return None
-
-
 def _parse_date_str(value: Optional[str]) -> Optional[date_type]:
     if not value:
         return None
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session, select
 
 from app.api.deps import get_current_active_user
+from app.core.response_cache import LEADERBOARD_SCORING, invalidate_responses
 from app.db.session import get_session
 from app.models.athlete import Athlete
 from app.models.match_stat import MatchStat
@@ -17,6 +18,7 @@ from app.models.report_submission import (
     ReportSubmissionType,
 )
 from app.schemas.match_reports import GameReportCreate, GameReportResponse
+from app.services.scoring_rollup_service import record_match_stats
 
 router = APIRouter()
 
@@ -111,7 +113,7 @@ def create_match_report(
     session.commit()
     session.refresh(submission)
 
-    created_entries = 0
+    stats: list[MatchStat] = []
 
     for entry in report.goal_scorers:
         stat = MatchStat(
@@ -126,8 +128,7 @@ def create_match_report(
             shootout_goals=entry.shootout_goals,
             goals_conceded=0,
         )
-        session.add(stat)
-        created_entries += 1
+        stats.append(stat)
 
     for entry in report.goalkeepers:
         stat = MatchStat(
@@ -142,8 +143,10 @@ def create_match_report(
             shootout_goals=0,
             goals_conceded=entry.conceded,
         )
-        session.add(stat)
-        created_entries += 1
+        stats.append(stat)
 
+    session.add_all(stats)
+    record_match_stats(session, stats)
     session.commit()
-    return GameReportResponse(created_entries=created_entries)
+    invalidate_responses(LEADERBOARD_SCORING)
+    return GameReportResponse(created_entries=len(stats))
@@ -1,9 +1,14 @@
-from collections import defaultdict
-from datetime import date
-
-from fastapi import APIRouter, Depends, HTTPException, status
+import base64
+import json
+from datetime import date, datetime
+from typing import Iterable, Iterator
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, func, or_
 from sqlmodel import Session, select
 
+from app.analytics.cohorts import age_band, age_on
 from app.api.deps import get_current_active_user
 from app.db.session import get_session
 from app.models.assessment_session import AssessmentSession
@@ -12,65 +17,115 @@ from app.models.session_result import SessionResult
 from app.models.test_definition import TestDefinition
 from app.models.user import User, UserRole
 from app.schemas.athlete import AthleteRead
-from app.schemas.report import AthleteReport, MetricResult, SessionReport
+from app.schemas.report import (
+    AthleteReport,
+    AthleteReportPage,
+    MetricResult,
+    SessionReport,
+)
+from app.services.peer_average_service import get_peer_averages
 
 router = APIRouter()
 
 
-def _calculate_age(birth_date: date | None, reference: date | None) -> int | None:
-    if birth_date is None:
-        return None
-    ref = reference or date.today()
-    age = ref.year - birth_date.year
-    if (ref.month, ref.day) < (birth_date.month, birth_date.day):
-        age -= 1
-    return age
+# Pages and streams need a non-null key; unscheduled sessions sort last, as
+# the full report's plain ``scheduled_at`` ordering does on PostgreSQL.
+_UNSCHEDULED = datetime.max
+REPORT_PAGE_DEFAULT_SIZE = 20
+REPORT_PAGE_MAX_SIZE = 100
+REPORT_STREAM_BATCH_SIZE = 500
 
+_session_sort_key = func.coalesce(AssessmentSession.scheduled_at, _UNSCHEDULED)
 
-def _age_band(age: int | None) -> int | None:
-    if age is None:
-        return None
-    return (age // 2) * 2
 
+def _get_report_athlete(session: Session, athlete_id: int, user: User) -> Athlete:
+    athlete = session.get(Athlete, athlete_id)
+    if not athlete:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Athlete not found"
+        )
+    if user.role == UserRole.ATHLETE and user.athlete_id != athlete.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed")
+    return athlete
 
-def _compute_peer_averages(
-    db: Session,
-    test_ids: set[int],
-    target_band: int | None,
-) -> dict[int, float]:
-    if not test_ids or target_band is None:
-        return {}
 
-    statement = (
-        select(
-            SessionResult.test_id,
-            SessionResult.value,
-            Athlete.birth_date,
-            AssessmentSession.scheduled_at,
-        )
+def _encode_cursor(scheduled_at: datetime | None, session_id: int) -> str:
+    key = (scheduled_at or _UNSCHEDULED).isoformat()
+    raw = json.dumps([key, session_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        key, session_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(key), int(session_id)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from exc
+
+
+def _results_statement(athlete_id: int):
+    return (
+        select(SessionResult, AssessmentSession, TestDefinition)
         .join(AssessmentSession, AssessmentSession.id == SessionResult.session_id)
-        .join(Athlete, Athlete.id == SessionResult.athlete_id)
-        .where(SessionResult.test_id.in_(tuple(test_ids)))
+        .join(TestDefinition, TestDefinition.id == SessionResult.test_id)
+        .where(SessionResult.athlete_id == athlete_id)
+        .order_by(_session_sort_key, AssessmentSession.id, SessionResult.recorded_at)
+    )
+
+
+def _metric_result(
+    result: SessionResult,
+    test_definition: TestDefinition,
+    peer_averages: dict[int, float],
+) -> MetricResult:
+    return MetricResult(
+        test_id=test_definition.id,
+        test_name=test_definition.name,
+        category=test_definition.category,
+        value=result.value,
+        unit=result.unit or test_definition.unit,
+        recorded_at=result.recorded_at,
+        notes=result.notes,
+        peer_average=peer_averages.get(test_definition.id),
     )
 
-    aggregates: dict[int, list[float]] = {}
-    for test_id, value, birth_date, scheduled_at in db.exec(statement).all():
-        if value is None:
-            continue
-        age = _calculate_age(
-            birth_date,
-            scheduled_at.date() if scheduled_at is not None else None,
-        )
-        if _age_band(age) != target_band:
-            continue
-        bucket = aggregates.setdefault(test_id, [])
-        bucket.append(float(value))
 
-    return {
-        test_id: sum(values) / len(values)
-        for test_id, values in aggregates.items()
-        if values
-    }
+def _athlete_peer_averages(
+    session: Session, athlete: Athlete, test_ids: Iterable[int]
+) -> dict[int, float]:
+    target_band = age_band(age_on(athlete.birth_date, date.today()))
+    return get_peer_averages(session, test_ids, target_band)
+
+
+def _iter_session_reports(
+    rows: Iterable[tuple[SessionResult, AssessmentSession, TestDefinition]],
+    peer_averages: dict[int, float],
+) -> Iterator[SessionReport]:
+    """Group rows ordered by session into reports, one session at a time."""
+    current: AssessmentSession | None = None
+    results: list[MetricResult] = []
+    for result, assessment_session, test_definition in rows:
+        if current is not None and assessment_session.id != current.id:
+            yield _session_report(current, results)
+            results = []
+        current = assessment_session
+        results.append(_metric_result(result, test_definition, peer_averages))
+    if current is not None:
+        yield _session_report(current, results)
+
+
+def _session_report(
+    assessment_session: AssessmentSession, results: list[MetricResult]
+) -> SessionReport:
+    return SessionReport(
+        session_id=assessment_session.id,
+        session_name=assessment_session.name,
+        scheduled_at=assessment_session.scheduled_at,
+        location=assessment_session.location,
+        results=results,
+    )
 
 
 @router.get("/athletes/{athlete_id}", response_model=AthleteReport)
@@ -79,13 +134,7 @@ def athlete_report(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
 ) -> AthleteReport:
-    athlete = session.get(Athlete, athlete_id)
-    if not athlete:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Athlete not found"
-        )
-    if current_user.role == UserRole.ATHLETE and current_user.athlete_id != athlete.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed")
+    athlete = _get_report_athlete(session, athlete_id, current_user)
 
     statement = (
         select(SessionResult, AssessmentSession, TestDefinition)
@@ -94,46 +143,113 @@ def athlete_report(
         .where(SessionResult.athlete_id == athlete_id)
         .order_by(AssessmentSession.scheduled_at, SessionResult.recorded_at)
     )
-
     rows = session.exec(statement).all()
-
     test_ids = {test_definition.id for _, _, test_definition in rows}
-    target_band = _age_band(_calculate_age(athlete.birth_date, date.today()))
-    peer_averages = _compute_peer_averages(session, test_ids, target_band)
-
-    grouped: dict[int, dict[str, object]] = defaultdict(
-        lambda: {"session": None, "results": []}
-    )
+    peer_averages = _athlete_peer_averages(session, athlete, test_ids)
 
+    grouped: dict[int, tuple[AssessmentSession, list[MetricResult]]] = {}
     for result, assessment_session, test_definition in rows:
-        data = grouped[result.session_id]
-        if data["session"] is None:
-            data["session"] = assessment_session
-        metric = MetricResult(
-            test_id=test_definition.id,
-            test_name=test_definition.name,
-            category=test_definition.category,
-            value=result.value,
-            unit=result.unit or test_definition.unit,
-            recorded_at=result.recorded_at,
-            notes=result.notes,
-            peer_average=peer_averages.get(test_definition.id),
+        _, results = grouped.setdefault(
+            assessment_session.id, (assessment_session, [])
         )
-        data["results"].append(metric)
+        results.append(_metric_result(result, test_definition, peer_averages))
+    sessions = [
+        _session_report(assessment_session, results)
+        for assessment_session, results in grouped.values()
+    ]
 
-    sessions: list[SessionReport] = []
-    for session_id, item in grouped.items():
-        assessment_session = item["session"]
-        results = item["results"]
-        sessions.append(
-            SessionReport(
-                session_id=session_id,
-                session_name=assessment_session.name,
-                scheduled_at=assessment_session.scheduled_at,
-                location=assessment_session.location,
-                results=results,
+    athlete_schema = AthleteRead.model_validate(athlete)
+    return AthleteReport(athlete=athlete_schema, sessions=sessions)
+
+
+@router.get("/athletes/{athlete_id}/sessions", response_model=AthleteReportPage)
+def athlete_report_page(
+    athlete_id: int,
+    cursor: str | None = None,
+    limit: int = Query(
+        default=REPORT_PAGE_DEFAULT_SIZE, ge=1, le=REPORT_PAGE_MAX_SIZE
+    ),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user),
+) -> AthleteReportPage:
+    """Return the athlete report one page of sessions at a time."""
+    athlete = _get_report_athlete(session, athlete_id, current_user)
+
+    page_statement = (
+        select(AssessmentSession.id, AssessmentSession.scheduled_at)
+        .where(
+            select(SessionResult.id)
+            .where(
+                SessionResult.session_id == AssessmentSession.id,
+                SessionResult.athlete_id == athlete_id,
+            )
+            .exists()
+        )
+        .order_by(_session_sort_key, AssessmentSession.id)
+        .limit(limit + 1)
+    )
+    if cursor:
+        after_key, after_id = _decode_cursor(cursor)
+        page_statement = page_statement.where(
+            or_(
+                _session_sort_key > after_key,
+                and_(_session_sort_key == after_key, AssessmentSession.id > after_id),
             )
         )
+    page = session.exec(page_statement).all()
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        last_id, last_scheduled_at = page[-1]
+        next_cursor = _encode_cursor(last_scheduled_at, last_id)
 
-    athlete_schema = AthleteRead.model_validate(athlete)
-    return AthleteReport(athlete=athlete_schema, sessions=sessions)
+    sessions: list[SessionReport] = []
+    if page:
+        statement = _results_statement(athlete_id).where(
+            SessionResult.session_id.in_([session_id for session_id, _ in page])
+        )
+        rows = session.exec(statement).all()
+        test_ids = {test_definition.id for _, _, test_definition in rows}
+        peer_averages = _athlete_peer_averages(session, athlete, test_ids)
+        sessions = list(_iter_session_reports(rows, peer_averages))
+
+    return AthleteReportPage(
+        athlete=AthleteRead.model_validate(athlete),
+        sessions=sessions,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/athletes/{athlete_id}/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+def athlete_report_stream(
+    athlete_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user),
+) -> StreamingResponse:
+    """Stream the athlete report as NDJSON, one SessionReport per line."""
+    athlete = _get_report_athlete(session, athlete_id, current_user)
+    test_ids = session.exec(
+        select(SessionResult.test_id)
+        .where(SessionResult.athlete_id == athlete_id)
+        .distinct()
+    ).all()
+    peer_averages = _athlete_peer_averages(session, athlete, test_ids)
+    bind = session.get_bind()
+
+    def _lines() -> Iterator[bytes]:
+        # The request session is closed once the endpoint returns, so the
+        # stream reads through its own session on the same engine.
+        with Session(bind) as stream_session:
+            rows = stream_session.exec(
+                _results_statement(athlete_id).execution_options(
+                    yield_per=REPORT_STREAM_BATCH_SIZE
+                )
+            )
+            for report in _iter_session_reports(rows, peer_averages):
+                yield (report.model_dump_json() + "\n").encode()
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
@@ -2,9 +2,11 @@ from collections.abc import Sequence
 from datetime import date
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select, func
+from sqlmodel import Session, delete, select, func
 
+from app.analytics.cohorts import invalidate_cohort_distributions
 from app.api.deps import ensure_roles, get_current_active_user
+from app.core.response_cache import METRIC_RANKINGS, invalidate_responses
 from app.db.session import get_session
 from app.models.assessment_session import AssessmentSession
 from app.models.session_result import SessionResult
@@ -18,6 +20,13 @@ from app.schemas.assessment_session import (
     AssessmentSessionUpdate,
 )
 from app.schemas.session_result import SessionResultCreate, SessionResultRead
+from app.services.metric_snapshot_service import refresh_metric_snapshots
+from app.services.peer_average_service import (
+    discard_session_peer_results,
+    invalidate_peer_averages,
+    rebuild_peer_averages,
+    record_peer_results,
+)
 
 router = APIRouter()
 MANAGE_SESSION_ROLES = {UserRole.ADMIN, UserRole.STAFF}
@@ -40,7 +49,7 @@ def ensure_related_entities(
     if athlete_ids:
         athlete_query = select(Athlete.id).where(Athlete.id.in_(athlete_ids))
         found_athletes = session.exec(athlete_query).all()
-        found_ids = {row[0] for row in found_athletes}
+        found_ids = set(found_athletes)
         missing_athletes = athlete_ids.difference(found_ids)
         if missing_athletes:
             raise HTTPException(
@@ -50,7 +59,7 @@ def ensure_related_entities(
     if test_ids:
         test_query = select(TestDefinition.id).where(TestDefinition.id.in_(test_ids))
         found_tests = session.exec(test_query).all()
-        found_test_ids = {row[0] for row in found_tests}
+        found_test_ids = set(found_tests)
         missing_tests = test_ids.difference(found_test_ids)
         if missing_tests:
             raise HTTPException(
@@ -138,9 +147,27 @@ def update_session(
     _ensure_can_edit(current_user)
 
     update_data = payload.model_dump(exclude_unset=True)
+    reschedule = (
+        "scheduled_at" in update_data
+        and update_data["scheduled_at"] != assessment_session.scheduled_at
+    )
     assessment_session.sqlmodel_update(update_data)
     session.add(assessment_session)
+    test_ids: set[int] = set()
+    if reschedule:
+        # Ages are taken on the session date, so peer bands may shift.
+        session.flush()
+        test_ids = set(
+            session.exec(
+                select(SessionResult.test_id)
+                .where(SessionResult.session_id == session_id)
+                .distinct()
+            ).all()
+        )
+        rebuild_peer_averages(session, test_ids)
     session.commit()
+    if test_ids:
+        invalidate_peer_averages(test_ids)
     session.refresh(assessment_session)
     return assessment_session
 
@@ -158,8 +185,21 @@ def delete_session(
         )
     _ensure_can_edit(current_user)
 
+    affected = session.exec(
+        select(SessionResult.test_id, SessionResult.athlete_id)
+        .where(SessionResult.session_id == session_id)
+        .distinct()
+    ).all()
+    test_ids = {test_id for test_id, _ in affected}
+    discard_session_peer_results(session, session_id)
+    session.exec(delete(SessionResult).where(SessionResult.session_id == session_id))
     session.delete(assessment_session)
+    refresh_metric_snapshots(session, (athlete_id for _, athlete_id in affected))
     session.commit()
+    if test_ids:
+        invalidate_cohort_distributions(test_ids)
+        invalidate_peer_averages(test_ids)
+    invalidate_responses(METRIC_RANKINGS)
 
 
 @router.post("/{session_id}/results", response_model=list[SessionResultRead])
@@ -191,7 +231,14 @@ def add_results(
         session.add(entity)
         created.append(entity)
 
+    session.flush()
+    refresh_metric_snapshots(session, (entity.athlete_id for entity in created))
+    record_peer_results(session, created)
     session.commit()
+    test_ids = {result.test_id for result in payload}
+    invalidate_cohort_distributions(test_ids)
+    invalidate_peer_averages(test_ids)
+    invalidate_responses(METRIC_RANKINGS)
     for entity in created:
         session.refresh(entity)
 
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 
 from app.api.deps import SessionDep, get_current_active_user
+from app.core.response_cache import LEADERBOARD_COMBINE, invalidate_responses
 from app.models.athlete import Athlete
 from app.models.team import CoachTeamLink, Team
 from app.models.team_combine_metric import TeamCombineMetric
@@ -12,6 +13,7 @@ from app.schemas.team_combine_metric import (
     TeamCombineMetricCreate,
     TeamCombineMetricRead,
 )
+from app.services.combine_bucket_service import record_combine_metrics
 
 router = APIRouter()
 
@@ -81,7 +83,9 @@ def create_team_combine_metric(
         recorded_at=recorded_at,
     )
     session.add(metric)
+    record_combine_metrics(session, [metric])
     session.commit()
+    invalidate_responses(LEADERBOARD_COMBINE)
     session.refresh(metric)
     return TeamCombineMetricRead.model_validate(metric)
 
@@ -12,6 +12,11 @@ from sqlalchemy.exc import OperationalError
 from sqlmodel import Session
 
 from app.api.deps import ensure_roles, get_current_active_user
+from app.core.response_cache import (
+    LEADERBOARD_COMBINE,
+    LEADERBOARD_SCORING,
+    invalidate_responses,
+)
 from app.core.security import get_password_hash
 from app.db.session import get_session
 from app.models.athlete import Athlete
@@ -24,6 +29,7 @@ from app.models.team import CoachTeamLink, Team
 from app.models.team_post import TeamPost
 from app.models.user import User, UserRole
 from app.services.email_service import email_service
+from app.services.event_visibility_service import refresh_event_visibility
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.report_submission import ReportSubmissionItem
 from app.schemas.team import TeamCoachCreate, TeamCreate, TeamRead
@@ -313,6 +319,7 @@ def update_team(
 
     session.add(team)
     session.commit()
+    invalidate_responses(LEADERBOARD_SCORING, LEADERBOARD_COMBINE)
     session.refresh(team)
 
     # Get athlete count
@@ -652,8 +659,16 @@ def delete_team(
         session.add(athlete)
 
     # Remove any coach links and event associations for this team
+    linked_event_ids = (
+        session.exec(
+            select(EventTeamLink.event_id).where(EventTeamLink.team_id == team_id)
+        )
+        .scalars()
+        .all()
+    )
     session.exec(delete(CoachTeamLink).where(CoachTeamLink.team_id == team_id))
     session.exec(delete(EventTeamLink).where(EventTeamLink.team_id == team_id))
+    refresh_event_visibility(session, linked_event_ids)
 
     # Delete team feed posts to satisfy FK constraints
     session.exec(delete(TeamPost).where(TeamPost.team_id == team_id))
@@ -666,3 +681,4 @@ def delete_team(
 
     session.delete(team)
     session.commit()
+    invalidate_responses(LEADERBOARD_SCORING, LEADERBOARD_COMBINE)
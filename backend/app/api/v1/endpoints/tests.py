@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session, select
 
+from app.analytics.catalog import invalidate_test_catalog
 from app.api.deps import ensure_roles, get_current_active_user
+from app.core.response_cache import METRIC_RANKINGS, invalidate_responses
 from app.db.session import get_session
 from app.models.test_definition import TestDefinition
 from app.models.user import User, UserRole
 from app.schemas.test_definition import TestDefinitionCreate, TestDefinitionRead
+from app.services.metric_snapshot_service import rebuild_metric_snapshots
 
 router = APIRouter()
 
@@ -30,7 +33,10 @@ def create_test(
     ensure_roles(current_user, {UserRole.ADMIN, UserRole.STAFF})
     test_definition = TestDefinition.model_validate(payload.model_dump())
     session.add(test_definition)
+    rebuild_metric_snapshots(session)
     session.commit()
+    invalidate_test_catalog()
+    invalidate_responses(METRIC_RANKINGS)
     session.refresh(test_definition)
     return test_definition
 
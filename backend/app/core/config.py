@@ -45,6 +45,13 @@ class Settings(BaseSettings):
     MEDIA_ROOT: str = "media"
     AUTO_SEED_DATABASE: bool = False
     LOG_LEVEL: str = "INFO"
+    SEASON_START_MONTH: int = Field(default=8, ge=1, le=12)  # leaderboard seasons
+
+    # Leaderboard/ranking response cache: memory (in-process LRU), redis, or none
+    RESPONSE_CACHE_BACKEND: str = "memory"
+    RESPONSE_CACHE_TTL_SECONDS: float = 30.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    RESPONSE_CACHE_REDIS_URL: str | None = None
 
     # Google OAuth settings
     GOOGLE_CLIENT_ID: str | None = None
@@ -58,12 +65,36 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str | None = None
     SMTP_FROM_EMAIL: str | None = None
     SMTP_FROM_NAME: str | None = "StatCat - No Reply"
+    SMTP_POOL_SIZE: int = Field(default=4, ge=1)
+    SMTP_POOL_IDLE_SECONDS: float = 60.0
+    SMTP_POOL_MAX_MESSAGES: int = Field(default=100, ge=1)
+    SMTP_TIMEOUT_SECONDS: float = 30.0
     RESEND_API_KEY: str | None = None
     RESEND_FROM_EMAIL: str | None = None
     SENDGRID_API_KEY: str | None = None
     SENDGRID_FROM_EMAIL: str | None = None
     SENDGRID_FROM_NAME: str | None = "StatCat - No Reply"
 
+    # Email outbox worker (python -m app.workers.email_worker)
+    # Also drain the outbox inside the API process; turn off where a separate
+    # worker is deployed against the same database.
+    EMAIL_OUTBOX_IN_PROCESS: bool = True
+    EMAIL_WORKER_CONCURRENCY: int = Field(default=8, ge=1)
+    EMAIL_WORKER_BATCH_SIZE: int = Field(default=500, ge=1)
+    EMAIL_WORKER_POLL_SECONDS: float = 2.0
+    EMAIL_MAX_ATTEMPTS: int = Field(default=5, ge=1)
+    EMAIL_RETRY_BASE_SECONDS: float = 30.0
+    EMAIL_RETRY_MAX_SECONDS: float = 3600.0
+    EMAIL_LEASE_SECONDS: float = 300.0
+
+    # Shared outbound HTTP client (email providers, Supabase Storage)
+    HTTP_CLIENT_MAX_CONNECTIONS: int = Field(default=20, ge=1)
+    HTTP_CLIENT_MAX_KEEPALIVE: int = Field(default=10, ge=0)
+    HTTP_CLIENT_KEEPALIVE_SECONDS: float = 30.0
+    HTTP_CLIENT_TIMEOUT_SECONDS: float = 10.0
+    HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_CLIENT_HTTP2: bool = True
+
     # Supabase Storage
     SUPABASE_URL: str | None = None
     SUPABASE_SERVICE_ROLE_KEY: str | None = None
@@ -120,6 +151,8 @@ class Settings(BaseSettings):
     OTEL_EXPORTER_OTLP_HEADERS: str | None = None
     OTEL_SERVICE_NAME: str | None = None
     OTEL_TRACES_SAMPLER_RATIO: float = 0.2
+    # Warn when a request executes more SQL statements than this (None disables).
+    DB_QUERY_BUDGET_PER_REQUEST: int | None = None
 
     @model_validator(mode="after")
     def _validate_security_basics(self) -> "Settings":
@@ -0,0 +1,68 @@
+"""Shared outbound HTTP client for email providers and Supabase Storage.
+
+One pooled ``httpx.AsyncClient`` keeps keep-alive (and, when ``h2`` is
+installed, HTTP/2) connections open across requests instead of paying a TCP
+and TLS handshake per email or upload.  Connections belong to the event loop
+that opened them, so a client is created per running loop; the API closes it
+on shutdown and the email worker when it exits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import httpx
+
+from app.core.config import settings
+
+try:
+    import h2  # noqa: F401 - only needed to enable HTTP/2 in httpx
+except ImportError:
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+logger = logging.getLogger(__name__)
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    http2 = settings.HTTP_CLIENT_HTTP2 and HTTP2_AVAILABLE
+    if settings.HTTP_CLIENT_HTTP2 and not HTTP2_AVAILABLE:
+        logger.warning(
+            "HTTP/2 requested but `h2` is not installed; using HTTP/1.1. Run `pip install httpx[http2]`."
+        )
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE,
+            keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_SECONDS,
+        ),
+        timeout=httpx.Timeout(
+            settings.HTTP_CLIENT_TIMEOUT_SECONDS,
+            connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS,
+        ),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The pooled client for the running event loop, created on first use."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        # A client from a finished loop cannot be reused (or closed) here.
+        _client, _client_loop = _build_client(), loop
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the pooled client if it belongs to the running loop."""
+    global _client, _client_loop
+    client, loop = _client, _client_loop
+    _client = _client_loop = None
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
@@ -4,13 +4,18 @@ import logging
 import logging.config
 import time
 import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 
 from fastapi import FastAPI, Request
 from pythonjsonlogger import jsonlogger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
+from prometheus_client import Histogram
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from opentelemetry import trace
@@ -85,13 +90,96 @@ def configure_logging(level: str = "INFO") -> None:
     )
 
 
+@dataclass
+class RequestDbStats:
+    """Database work done while serving one request."""
+
+    queries: int = 0
+    db_time_ms: float = 0.0
+    # Rows as reported by the driver's ``cursor.rowcount``.  psycopg2 reports
+    # fetched rows for SELECTs; SQLite only reports rows touched by writes.
+    rows: int = 0
+
+    def as_log_fields(self) -> dict[str, Any]:
+        return {
+            "db_queries": self.queries,
+            "db_time_ms": round(self.db_time_ms, 3),
+            "db_rows": self.rows,
+        }
+
+
+_request_db_stats: ContextVar[RequestDbStats | None] = ContextVar(
+    "request_db_stats", default=None
+)
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request.",
+    ["method", "handler"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent executing SQL per request.",
+    ["method", "handler"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+DB_ROWS_PER_REQUEST = Histogram(
+    "http_request_db_rows",
+    "Rows reported by the database driver per request.",
+    ["method", "handler"],
+    buckets=(0, 10, 100, 1_000, 10_000, 100_000, 1_000_000),
+)
+
+
+# The start time lives on the statement's execution context, so a statement
+# that raises (and never reaches after_cursor_execute) leaves nothing behind.
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _request_db_stats.get() is not None:
+        context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_db_stats.get()
+    started = getattr(context, "_query_start_time", None)
+    if stats is None or started is None:
+        return
+    stats.queries += 1
+    stats.db_time_ms += (time.perf_counter() - started) * 1000
+    if cursor.rowcount and cursor.rowcount > 0:
+        stats.rows += cursor.rowcount
+
+
+def setup_db_instrumentation() -> None:
+    """Count statements, DB time and rows for the request being served.
+
+    Listens on the ``Engine`` class so every engine (including test and
+    benchmark engines) reports into the current request's stats.
+    """
+
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _route_template(request: Request) -> str | None:
+    route = request.scope.get("route")
+    return getattr(route, "path", None)
+
+
 class RequestContextMiddleware(BaseHTTPMiddleware):
-    """Attach request id, trace id, and emit access log."""
+    """Attach request id, trace id, and emit access log with DB stats."""
+
+    def __init__(self, app, query_budget: int | None = None) -> None:
+        super().__init__(app)
+        self.query_budget = query_budget
 
     async def dispatch(self, request: Request, call_next) -> Response:
         request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
         start = time.perf_counter()
         trace_id: str | None = None
+        db_stats = RequestDbStats()
+        token = _request_db_stats.set(db_stats)
 
         try:
             response = await call_next(request)
@@ -107,9 +195,12 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
                     "path": request.url.path,
                     "method": request.method,
                     "duration_ms": duration_ms,
+                    **db_stats.as_log_fields(),
                 },
             )
             raise
+        finally:
+            _request_db_stats.reset(token)
 
         span = trace.get_current_span()
         span_context = span.get_span_context()
@@ -118,6 +209,7 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
 
         duration_ms = round((time.perf_counter() - start) * 1000, 3)
         response.headers["X-Request-ID"] = request_id
+        route = _route_template(request)
 
         logger = logging.getLogger("app.access")
         logger.info(
@@ -126,13 +218,34 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
                 "request_id": request_id,
                 "trace_id": trace_id,
                 "path": request.url.path,
+                "route": route,
                 "method": request.method,
                 "status_code": response.status_code,
                 "duration_ms": duration_ms,
                 "client_ip": request.client.host if request.client else None,
                 "user_agent": request.headers.get("user-agent"),
+                **db_stats.as_log_fields(),
             },
         )
+
+        if route is not None:
+            labels = {"method": request.method, "handler": route}
+            DB_QUERIES_PER_REQUEST.labels(**labels).observe(db_stats.queries)
+            DB_TIME_PER_REQUEST.labels(**labels).observe(db_stats.db_time_ms / 1000)
+            DB_ROWS_PER_REQUEST.labels(**labels).observe(db_stats.rows)
+
+        if self.query_budget is not None and db_stats.queries > self.query_budget:
+            logger.warning(
+                "query_budget_exceeded",
+                extra={
+                    "request_id": request_id,
+                    "trace_id": trace_id,
+                    "route": route,
+                    "method": request.method,
+                    "query_budget": self.query_budget,
+                    **db_stats.as_log_fields(),
+                },
+            )
         return response
 
 
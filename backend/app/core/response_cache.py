@@ -0,0 +1,203 @@
+"""Short-TTL cache for read-heavy JSON endpoints shared by all users.
+
+Entries are keyed on a namespace, the namespace's generation, the database
+and the normalised query parameters.  Writers call
+:func:`invalidate_responses` after commit, which bumps the generation so
+every cached variant of the namespace is skipped at once (and simply ages
+out of the backend).  The in-process LRU backend is the default; a shared
+backend such as Redis keeps generations and entries consistent across worker
+processes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Mapping, Protocol
+
+from fastapi.responses import Response
+from prometheus_client import Counter
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+LEADERBOARD_SCORING = "leaderboards.scoring"
+LEADERBOARD_COMBINE = "leaderboards.combine"
+METRIC_RANKINGS = "rankings.metrics"
+ALL_NAMESPACES = (LEADERBOARD_SCORING, LEADERBOARD_COMBINE, METRIC_RANKINGS)
+
+RESPONSE_CACHE_REQUESTS = Counter(
+    "response_cache_requests_total",
+    "Response cache lookups by namespace and result.",
+    ["namespace", "result"],
+)
+
+
+class CacheBackend(Protocol):
+    """Storage for cached response bodies and namespace generations."""
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    def generation(self, namespace: str) -> int: ...
+
+    def bump_generation(self, namespace: str) -> None: ...
+
+
+class LRUCacheBackend:
+    """Thread-safe in-process LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def generation(self, namespace: str) -> int:
+        with self._lock:
+            return self._generations.get(namespace, 0)
+
+    def bump_generation(self, namespace: str) -> None:
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            # Entries of older generations can never be read again.
+            prefix = f"{namespace}:"
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+
+class RedisCacheBackend:
+    """Shared backend storing entries and generations in Redis."""
+
+    def __init__(self, url: str, prefix: str = "statcat:response-cache:") -> None:
+        try:
+            import redis
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "RESPONSE_CACHE_BACKEND=redis requires the 'redis' package"
+            ) from exc
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key: str) -> bytes | None:
+        return self._client.get(self._prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._client.set(self._prefix + key, value, px=max(int(ttl * 1000), 1))
+
+    def generation(self, namespace: str) -> int:
+        value = self._client.get(f"{self._prefix}generation:{namespace}")
+        return int(value or 0)
+
+    def bump_generation(self, namespace: str) -> None:
+        self._client.incr(f"{self._prefix}generation:{namespace}")
+
+
+def _build_backend() -> CacheBackend | None:
+    kind = settings.RESPONSE_CACHE_BACKEND.lower()
+    if kind in {"", "none", "off"}:
+        return None
+    if kind == "redis":
+        if not settings.RESPONSE_CACHE_REDIS_URL:
+            raise RuntimeError("RESPONSE_CACHE_REDIS_URL is required for redis")
+        return RedisCacheBackend(settings.RESPONSE_CACHE_REDIS_URL)
+    return LRUCacheBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+
+
+_backend: CacheBackend | None = _build_backend()
+
+
+def set_cache_backend(backend: CacheBackend | None) -> None:
+    """Swap the backend (``None`` disables caching)."""
+    global _backend
+    _backend = backend
+
+
+def get_cache_backend() -> CacheBackend | None:
+    return _backend
+
+
+def _cache_key(
+    db: Session, namespace: str, generation: int, params: Mapping[str, Any]
+) -> str:
+    database = db.get_bind().url.render_as_string(hide_password=True)
+    normalized = {
+        name: sorted(value) if isinstance(value, (list, tuple, set)) else value
+        for name, value in params.items()
+        if value is not None
+    }
+    encoded = json.dumps(normalized, sort_keys=True, default=str)
+    return f"{namespace}:{generation}:{database}:{encoded}"
+
+
+def cached_response(
+    db: Session,
+    namespace: str,
+    params: Mapping[str, Any],
+    build: Callable[[], BaseModel],
+    ttl: float | None = None,
+) -> Response:
+    """Serve the JSON body for ``params`` from cache, building it on a miss."""
+    backend = _backend
+    if backend is None:
+        return Response(build().model_dump_json(), media_type="application/json")
+
+    try:
+        key = _cache_key(db, namespace, backend.generation(namespace), params)
+        body = backend.get(key)
+    except Exception:  # pragma: no cover - a broken cache must not break reads
+        logger.warning("Response cache lookup failed", exc_info=True)
+        key, body = None, None
+
+    if body is not None:
+        RESPONSE_CACHE_REQUESTS.labels(namespace=namespace, result="hit").inc()
+        return Response(body, media_type="application/json")
+
+    RESPONSE_CACHE_REQUESTS.labels(namespace=namespace, result="miss").inc()
+    body = build().model_dump_json().encode()
+    if key is not None:
+        try:
+            backend.set(
+                key, body, settings.RESPONSE_CACHE_TTL_SECONDS if ttl is None else ttl
+            )
+        except Exception:  # pragma: no cover - a broken cache must not break reads
+            logger.warning("Response cache store failed", exc_info=True)
+    return Response(body, media_type="application/json")
+
+
+def invalidate_responses(*namespaces: str) -> None:
+    """Drop cached responses for the namespaces (all when none given); call after commit."""
+    backend = _backend
+    if backend is None:
+        return
+    for namespace in namespaces or ALL_NAMESPACES:
+        try:
+            backend.bump_generation(namespace)
+        except Exception:  # pragma: no cover - TTL still bounds staleness
+            logger.warning("Response cache invalidation failed", exc_info=True)
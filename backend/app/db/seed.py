@@ -30,6 +30,7 @@ from app.models.report_submission import (
 )
 from app.models.user import UserRole, UserAthleteApprovalStatus
 from app.models.team_combine_metric import CombineMetricStatus
+from app.services.combine_bucket_service import rebuild_combine_buckets
 
 
 TEST_DEFINITIONS = [
@@ -489,6 +490,8 @@ def seed_bulk_teams_and_athletes(
                     )
                 )
 
+    # As métricas entram direto na tabela; os buckets do leaderboard não.
+    rebuild_combine_buckets(session)
     session.commit()
     print(
         f"Seed concluído: {team_count} times, {team_count * athletes_per_team} atletas."
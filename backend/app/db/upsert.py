@@ -0,0 +1,24 @@
+"""Dialect-aware INSERT ... ON CONFLICT helpers for PostgreSQL and SQLite."""
+
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.sql.dml import Insert
+from sqlmodel import Session
+
+_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def conflict_insert(db: Session, table: Any) -> Insert | None:
+    """Return an insert supporting ``on_conflict_*`` for the session's dialect.
+
+    ``None`` means the backend has no ON CONFLICT support and callers must
+    fall back to a read-then-write path.
+    """
+    factory = _INSERTS.get(db.get_bind().dialect.name)
+    if factory is None:
+        return None
+    return factory(table)
@@ -1,9 +1,13 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from datetime import datetime, date, time
 import json
 import logging
+from typing import AsyncIterator
 
 from app.core.config import settings
+from app.core.http_client import close_http_client
 from alembic.config import Config
 from alembic.script import ScriptDirectory
 from alembic.runtime.migration import MigrationContext
@@ -20,18 +24,52 @@ from app.api.v1.router import api_router
 from app.core.observability import (
     RequestContextMiddleware,
     configure_logging,
+    setup_db_instrumentation,
     setup_metrics,
     setup_sentry,
     setup_tracing,
 )
 from app.db.session import engine, init_db
+from app.services.email_service import email_service
+from app.workers import email_worker
 
 configure_logging(settings.LOG_LEVEL)
 setup_sentry(settings)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title=settings.PROJECT_NAME, version=settings.VERSION)
-app.add_middleware(RequestContextMiddleware)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Evite criar/migrar DB automaticamente em produção; use alembic upgrade no deploy.
+    if settings.AUTO_SEED_DATABASE:
+        init_db()
+    _check_migration_drift()
+    drain = None
+    if settings.EMAIL_OUTBOX_IN_PROCESS:
+        # Deploys without the email worker still send queued emails.
+        drain = asyncio.create_task(
+            email_worker.run(
+                concurrency=settings.EMAIL_WORKER_CONCURRENCY,
+                batch_size=settings.EMAIL_WORKER_BATCH_SIZE,
+            )
+        )
+    try:
+        yield
+    finally:
+        if drain is not None:
+            drain.cancel()
+            with suppress(asyncio.CancelledError):
+                await drain
+        await close_http_client()
+        email_service.close()
+
+
+app = FastAPI(title=settings.PROJECT_NAME, version=settings.VERSION, lifespan=lifespan)
+app.add_middleware(
+    RequestContextMiddleware, query_budget=settings.DB_QUERY_BUDGET_PER_REQUEST
+)
+setup_db_instrumentation()
 setup_metrics(app)
 setup_tracing(app, settings, engine=engine)
 
@@ -76,6 +114,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 if (
     settings.ENVIRONMENT.lower() not in {"dev", "development", "local"}
@@ -93,14 +132,6 @@ media_path.mkdir(parents=True, exist_ok=True)
 app.mount("/media", StaticFiles(directory=media_path), name="media")
 
 
-@app.on_event("startup")
-def on_startup() -> None:
-    # Evite criar/migrar DB automaticamente em produção; use alembic upgrade no deploy.
-    if settings.AUTO_SEED_DATABASE:
-        init_db()
-    _check_migration_drift()
-
-
 @app.get("/sentry-debug", include_in_schema=False)
 async def trigger_sentry_error() -> None:
     """Endpoint to generate a test error for Sentry/observability checks."""
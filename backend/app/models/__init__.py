@@ -1,14 +1,21 @@
 from app.models.assessment_session import AssessmentSession
 from app.models.athlete import Athlete
+from app.models.athlete_metric_snapshot import AthleteMetricSnapshot
 from app.models.athlete_detail import AthleteDetail
 from app.models.athlete_document import AthleteDocument
 from app.models.athlete_payment import AthletePayment
+from app.models.combine_metric_bucket import CombineMetricBucket
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
 from app.models.event import Event, Notification, PushSubscription
 from app.models.event_team_link import EventTeamLink
 from app.models.event_participant import EventParticipant
+from app.models.event_visibility import EventVisibility
 from app.models.group import Group, GroupMembership
 from app.models.session_result import SessionResult
 from app.models.match_stat import MatchStat
+from app.models.peer_average import PeerAverage
+from app.models.scoring_bucket import ScoringBucket
+from app.models.scoring_rollup import ScoringRollup
 from app.models.team import Team
 from app.models.team_post import TeamPost
 from app.models.team_combine_metric import TeamCombineMetric
@@ -23,11 +30,16 @@ from app.models.report_submission import (
 __all__ = [
     "Athlete",
     "AthleteDetail",
+    "AthleteMetricSnapshot",
     "AthleteDocument",
     "AthletePayment",
+    "CombineMetricBucket",
+    "EmailOutbox",
+    "EmailOutboxStatus",
     "Event",
     "EventParticipant",
     "EventTeamLink",
+    "EventVisibility",
     "Notification",
     "PushSubscription",
     "Group",
@@ -39,6 +51,9 @@ __all__ = [
     "ReportSubmissionStatus",
     "ReportSubmissionType",
     "MatchStat",
+    "PeerAverage",
+    "ScoringBucket",
+    "ScoringRollup",
     "TestDefinition",
     "AssessmentSession",
     "SessionResult",
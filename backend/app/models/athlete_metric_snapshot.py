@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+from typing import Any
+
+import sqlalchemy as sa
+from sqlmodel import Field, SQLModel
+
+
+class AthleteMetricSnapshot(SQLModel, table=True):
+    """Materialized MetricEngine score for one athlete and metric.
+
+    A row with a null ``score`` records that the metric was evaluated but the
+    athlete has no usable results for it.
+    """
+
+    __tablename__ = "athlete_metric_snapshot"
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "athlete_id", "metric_id", name="uq_athlete_metric_snapshot_metric"
+        ),
+        # Rankings read one metric ordered by value.
+        sa.Index("ix_athlete_metric_snapshot_metric_value", "metric_id", "value"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    athlete_id: int = Field(foreign_key="athlete.id", index=True)
+    metric_id: str = Field(index=True)
+    value: float | None = Field(default=None)
+    unit: str | None = None
+    score: dict[str, Any] | None = Field(default=None, sa_column=sa.Column(sa.JSON))
+    computed_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), nullable=False
+    )
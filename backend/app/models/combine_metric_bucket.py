@@ -0,0 +1,33 @@
+from datetime import date, datetime, timezone
+
+import sqlalchemy as sa
+from sqlmodel import Field, SQLModel
+
+
+class CombineMetricBucket(SQLModel, table=True):
+    """Best combine result per metric for one athlete, team and day.
+
+    Timed splits keep the fastest (lowest) value; the other metrics keep the
+    highest.  Windowed combine leaderboards aggregate these daily bests.
+    """
+
+    __tablename__ = "combine_metric_bucket"
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "athlete_id", "team_id", "bucket_date", name="uq_combine_metric_bucket_day"
+        ),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    athlete_id: int = Field(foreign_key="athlete.id", index=True)
+    team_id: int = Field(foreign_key="team.id", index=True)
+    bucket_date: date = Field(index=True)
+    split_10m_s: float | None = Field(default=None)
+    split_20m_s: float | None = Field(default=None)
+    split_35m_s: float | None = Field(default=None)
+    jump_cm: float | None = Field(default=None)
+    max_power_kmh: float | None = Field(default=None)
+    yoyo_distance_m: float | None = Field(default=None)
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), nullable=False
+    )
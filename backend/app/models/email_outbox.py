@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Optional
+
+import sqlalchemy as sa
+from sqlmodel import Field, Relationship, SQLModel
+
+if TYPE_CHECKING:
+    from .event import Notification
+
+
+class EmailOutboxStatus(str, Enum):
+    PENDING = "PENDING"
+    SENDING = "SENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+
+class EmailOutbox(SQLModel, table=True):
+    """An email waiting for (or done with) delivery by the email worker.
+
+    ``template`` names the ``EmailService`` method to call and ``payload``
+    holds its JSON-encoded ``args``/``kwargs``.
+    """
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # The worker polls for due rows by status and time.
+        sa.Index("ix_email_outbox_status_due", "status", "next_attempt_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    template: str
+    payload: dict[str, Any] = Field(sa_column=sa.Column(sa.JSON, nullable=False))
+    notification_id: Optional[int] = Field(
+        default=None, foreign_key="notification.id", index=True, ondelete="CASCADE"
+    )
+    status: EmailOutboxStatus = Field(default=EmailOutboxStatus.PENDING)
+    attempts: int = Field(default=0)
+    next_attempt_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), nullable=False
+    )
+    claim_token: Optional[str] = None
+    locked_until: Optional[datetime] = None
+    last_error: Optional[str] = None
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), nullable=False
+    )
+    sent_at: Optional[datetime] = None
+
+    notification: Optional["Notification"] = Relationship()
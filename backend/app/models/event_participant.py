@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
+import sqlalchemy as sa
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -19,6 +20,15 @@ class ParticipantStatus(str, Enum):
 
 class EventParticipant(SQLModel, table=True):
     __tablename__ = "event_participant"
+    __table_args__ = (
+        # Bulk invites skip users/athletes already on the event via ON CONFLICT.
+        sa.Index(
+            "uq_event_participant_event_user", "event_id", "user_id", unique=True
+        ),
+        sa.Index(
+            "uq_event_participant_event_athlete", "event_id", "athlete_id", unique=True
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     event_id: int = Field(foreign_key="event.id", index=True)
@@ -0,0 +1,17 @@
+from sqlmodel import Field, SQLModel
+
+
+class EventVisibility(SQLModel, table=True):
+    """One event a non-admin user may see.
+
+    Derived from events, participants, team links and team membership by
+    ``event_visibility_service``; admins and staff see every event and need
+    no rows of their own.
+    """
+
+    __tablename__ = "event_visibility"
+
+    user_id: int = Field(foreign_key="user.id", primary_key=True, ondelete="CASCADE")
+    event_id: int = Field(
+        foreign_key="event.id", primary_key=True, index=True, ondelete="CASCADE"
+    )
@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+from sqlmodel import Field, SQLModel
+
+
+class PeerAverage(SQLModel, table=True):
+    """Running total of results for one test within a two-year age band.
+
+    The band is the athlete's age on the session date, so rows only change
+    when results are added or removed.
+    """
+
+    __tablename__ = "peer_average"
+    __table_args__ = (
+        sa.UniqueConstraint("test_id", "age_band", name="uq_peer_average_test_band"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    test_id: int = Field(foreign_key="testdefinition.id", index=True)
+    age_band: int
+    value_sum: float = Field(default=0.0)
+    sample_count: int = Field(default=0)
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+    @property
+    def average(self) -> float | None:
+        if self.sample_count <= 0:
+            return None
+        return self.value_sum / self.sample_count
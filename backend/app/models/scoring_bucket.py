@@ -0,0 +1,34 @@
+from datetime import date, datetime, timezone
+
+import sqlalchemy as sa
+from sqlmodel import Field, SQLModel
+
+
+class ScoringBucket(SQLModel, table=True):
+    """Daily match totals for one athlete and team.
+
+    Same counters as ``ScoringRollup`` split by match day, so windowed
+    leaderboards sum a handful of buckets instead of scanning ``match_stat``.
+    Only days with matches have rows.
+    """
+
+    __tablename__ = "scoring_bucket"
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "athlete_id", "team_key", "bucket_date", name="uq_scoring_bucket_day"
+        ),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    athlete_id: int = Field(foreign_key="athlete.id", index=True)
+    team_id: int | None = Field(default=None, foreign_key="team.id", index=True)
+    team_key: int = Field(default=0)
+    bucket_date: date = Field(index=True)
+    goals: int = Field(default=0)
+    games_played: int = Field(default=0)
+    goalless_games: int = Field(default=0)
+    clean_sheets: int = Field(default=0)
+    goals_conceded: int = Field(default=0)
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), nullable=False
+    )
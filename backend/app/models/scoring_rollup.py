@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+from sqlmodel import Field, SQLModel
+
+
+class ScoringRollup(SQLModel, table=True):
+    """Match totals for one athlete while playing for one team.
+
+    ``team_key`` mirrors ``team_id`` with ``0`` for stats recorded without a
+    team, so the pair stays unique (NULLs never conflict).  The clean sheet
+    leaderboard only counts appearances without goals or shootout goals;
+    ``goalless_games``, ``clean_sheets`` and ``goals_conceded`` are totals
+    over those appearances.
+    """
+
+    __tablename__ = "scoring_rollup"
+    __table_args__ = (
+        sa.UniqueConstraint("athlete_id", "team_key", name="uq_scoring_rollup_team"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    athlete_id: int = Field(foreign_key="athlete.id", index=True)
+    team_id: int | None = Field(default=None, foreign_key="team.id", index=True)
+    team_key: int = Field(default=0)
+    goals: int = Field(default=0, index=True)
+    games_played: int = Field(default=0)
+    goalless_games: int = Field(default=0)
+    clean_sheets: int = Field(default=0, index=True)
+    goals_conceded: int = Field(default=0)
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), nullable=False
+    )
@@ -29,6 +29,23 @@ class AthleteMetricsResponse(BaseModel):
     metrics: list[MetricScore]
 
 
+class TestPercentile(BaseModel):
+    test_id: int
+    test_name: str
+    unit: str | None = None
+    value: float
+    percentile: float | None = None
+    z_score: float | None = None
+    cohort_size: int = 0
+
+
+class AthletePercentilesResponse(BaseModel):
+    athlete_id: int
+    age_band: int | None = None
+    gender: str | None = None
+    percentiles: list[TestPercentile]
+
+
 class RankingEntry(BaseModel):
     athlete_id: int
     full_name: str
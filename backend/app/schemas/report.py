@@ -27,3 +27,9 @@ class SessionReport(BaseModel):
 class AthleteReport(BaseModel):
     athlete: AthleteRead
     sessions: list[SessionReport]
+
+
+class AthleteReportPage(BaseModel):
+    athlete: AthleteRead
+    sessions: list[SessionReport]
+    next_cursor: str | None = None
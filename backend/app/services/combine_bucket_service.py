@@ -0,0 +1,175 @@
+"""Daily best combine results backing the windowed combine leaderboards.
+
+``create_team_combine_metric`` calls :func:`record_combine_metrics` in the
+same transaction as the insert; a bucket keeps the best value per metric for
+an athlete, team and day, so any window is a min/max over a few buckets.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import Iterable
+
+from sqlalchemy import case, delete, func
+from sqlalchemy.sql import FromClause
+from sqlmodel import Session, select
+
+from app.analytics.windows import DateRange, bucket_date
+from app.db.upsert import conflict_insert
+from app.models.combine_metric_bucket import CombineMetricBucket
+from app.models.team_combine_metric import TeamCombineMetric
+
+COMBINE_METRIC_CONFIG: dict[str, dict[str, str | None]] = {
+    "split_10m_s": {"direction": "lower_is_better", "unit": "s"},
+    "split_20m_s": {"direction": "lower_is_better", "unit": "s"},
+    "split_35m_s": {"direction": "lower_is_better", "unit": "s"},
+    "jump_cm": {"direction": "higher_is_better", "unit": "cm"},
+    "max_power_kmh": {"direction": "higher_is_better", "unit": "km/h"},
+    "yoyo_distance_m": {"direction": "higher_is_better", "unit": "m"},
+}
+
+# Rows per multi-VALUES upsert, well inside SQLite's bound-parameter limit.
+UPSERT_BATCH_SIZE = 500
+
+BucketKey = tuple[int, int, date]
+
+
+def _lower_is_better(metric: str) -> bool:
+    return COMBINE_METRIC_CONFIG[metric]["direction"] == "lower_is_better"
+
+
+def _better(metric: str, current: float | None, candidate: float | None) -> float | None:
+    if candidate is None:
+        return current
+    if current is None:
+        return candidate
+    return min(current, candidate) if _lower_is_better(metric) else max(current, candidate)
+
+
+def _merge_bests(bests: dict[BucketKey, dict[str, float | None]], key, values) -> None:
+    merged = bests.setdefault(key, dict.fromkeys(COMBINE_METRIC_CONFIG))
+    for metric in COMBINE_METRIC_CONFIG:
+        merged[metric] = _better(metric, merged[metric], values.get(metric))
+
+
+def _apply_bests(db: Session, bests: dict[BucketKey, dict[str, float | None]]) -> None:
+    """Merge daily bests into the buckets with batched upserts."""
+    if not bests:
+        return
+    now = datetime.now(timezone.utc)
+    table = CombineMetricBucket.__table__
+    insert = conflict_insert(db, table)
+    if insert is None:
+        for (athlete_id, team_id, day), values in bests.items():
+            row = db.exec(
+                select(CombineMetricBucket).where(
+                    CombineMetricBucket.athlete_id == athlete_id,
+                    CombineMetricBucket.team_id == team_id,
+                    CombineMetricBucket.bucket_date == day,
+                )
+            ).first()
+            if row is None:
+                row = CombineMetricBucket(
+                    athlete_id=athlete_id, team_id=team_id, bucket_date=day
+                )
+            for metric, value in values.items():
+                setattr(row, metric, _better(metric, getattr(row, metric), value))
+            row.updated_at = now
+            db.add(row)
+        return
+
+    rows = [
+        {
+            "athlete_id": athlete_id,
+            "team_id": team_id,
+            "bucket_date": day,
+            **values,
+            "updated_at": now,
+        }
+        for (athlete_id, team_id, day), values in sorted(bests.items())
+    ]
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        statement = insert.values(rows[start : start + UPSERT_BATCH_SIZE])
+        merged = {}
+        for metric in COMBINE_METRIC_CONFIG:
+            current, candidate = table.c[metric], statement.excluded[metric]
+            improves = (
+                candidate < current if _lower_is_better(metric) else candidate > current
+            )
+            merged[metric] = case(
+                (current.is_(None), candidate), (improves, candidate), else_=current
+            )
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.athlete_id, table.c.team_id, table.c.bucket_date],
+            set_={**merged, "updated_at": statement.excluded.updated_at},
+        )
+        db.exec(statement)
+
+
+def record_combine_metrics(db: Session, metrics: Iterable[TeamCombineMetric]) -> None:
+    """Fold freshly inserted combine metrics into the buckets (caller commits)."""
+    bests: dict[BucketKey, dict[str, float | None]] = {}
+    for metric in metrics:
+        if metric.athlete_id is None:
+            continue
+        key = (metric.athlete_id, metric.team_id, bucket_date(metric.recorded_at))
+        _merge_bests(
+            bests, key, {name: getattr(metric, name) for name in COMBINE_METRIC_CONFIG}
+        )
+    _apply_bests(db, bests)
+
+
+def discard_athlete_combine_buckets(db: Session, athlete_id: int) -> None:
+    """Remove an athlete's buckets before the athlete is deleted (caller commits)."""
+    db.exec(
+        delete(CombineMetricBucket).where(CombineMetricBucket.athlete_id == athlete_id)
+    )
+
+
+def rebuild_combine_buckets(db: Session) -> None:
+    """Recompute every bucket from ``team_combine_metric`` (caller commits)."""
+    day = func.date(TeamCombineMetric.recorded_at)
+    statement = (
+        select(
+            TeamCombineMetric.athlete_id,
+            TeamCombineMetric.team_id,
+            day,
+            *(
+                (func.min if _lower_is_better(name) else func.max)(
+                    getattr(TeamCombineMetric, name)
+                )
+                for name in COMBINE_METRIC_CONFIG
+            ),
+        )
+        .where(TeamCombineMetric.athlete_id.isnot(None))
+        .group_by(TeamCombineMetric.athlete_id, TeamCombineMetric.team_id, day)
+    )
+    db.exec(delete(CombineMetricBucket))
+    bests: dict[BucketKey, dict[str, float | None]] = {}
+    for athlete_id, team_id, recorded_day, *values in db.exec(statement).all():
+        _merge_bests(
+            bests,
+            (athlete_id, team_id, bucket_date(recorded_day)),
+            dict(zip(COMBINE_METRIC_CONFIG, values)),
+        )
+    _apply_bests(db, bests)
+
+
+def combine_bests(metric: str, date_range: DateRange | None = None) -> FromClause:
+    """Best value of ``metric`` per athlete and team within the window.
+
+    The result exposes ``athlete_id``, ``team_id`` and ``value``.
+    """
+    column = getattr(CombineMetricBucket, metric)
+    aggregate = func.min if _lower_is_better(metric) else func.max
+    statement = select(
+        CombineMetricBucket.athlete_id,
+        CombineMetricBucket.team_id,
+        aggregate(column).label("value"),
+    ).where(column.isnot(None))
+    if date_range is not None:
+        start, end = date_range
+        statement = statement.where(CombineMetricBucket.bucket_date.between(start, end))
+    return statement.group_by(
+        CombineMetricBucket.athlete_id, CombineMetricBucket.team_id
+    ).subquery("combine_window")
@@ -1,27 +1,265 @@
+"""Durable email outbox.
+
+Requests record emails with :func:`enqueue_email` in the same transaction as
+their notifications; the worker in ``app.workers.email_worker`` claims due
+rows, sends them with bounded concurrency and writes the outcome back to the
+row and its ``Notification``.  Templates the service can batch (event
+invitations, updates and reminders) go out in provider batch requests.
+"""
+
+import asyncio
+import json
 import logging
-from typing import Any, Callable
+import secrets
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, Sequence
 
-from fastapi import BackgroundTasks
+import anyio
+from sqlalchemy import and_, insert, or_, update
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
+from app.models.event import Notification
+from app.services.email_service import EmailService, email_service
 
 logger = logging.getLogger(__name__)
 
 
+def _json_ready(value: Any) -> Any:
+    # Dates and times are stored as their str() form, which is how the
+    # templates render and parse them.
+    return json.loads(json.dumps(value, default=str))
+
+
+def _outbox_message(
+    template: str,
+    args: Sequence[Any],
+    kwargs: dict[str, Any],
+    notification_id: int | None = None,
+) -> EmailOutbox:
+    if template.startswith("_") or not callable(getattr(EmailService, template, None)):
+        raise ValueError(f"Unknown email template: {template}")
+    return EmailOutbox(
+        template=template,
+        payload={"args": _json_ready(list(args)), "kwargs": _json_ready(kwargs)},
+        notification_id=notification_id,
+    )
+
+
 def enqueue_email(
-    background_tasks: BackgroundTasks | None,
-    fn: Callable[..., Any],
+    db: Session,
+    template: str,
     *args: Any,
+    notification: Notification | None = None,
     **kwargs: Any,
+) -> EmailOutbox:
+    """Record an ``EmailService.<template>(*args, **kwargs)`` send (caller commits)."""
+    message = _outbox_message(template, args, kwargs)
+    message.notification = notification
+    db.add(message)
+    logger.info("email_enqueued", extra={"task": template, "args_count": len(args)})
+    return message
+
+
+def enqueue_emails(
+    db: Session,
+    template: str,
+    messages: Sequence[tuple[Sequence[Any], int | None]],
 ) -> None:
-    """Enqueue an email send operation; fallback to sync if BackgroundTasks is not provided."""
-    if background_tasks:
-        logger.info(
-            "email_enqueued",
-            extra={"task": getattr(fn, "__name__", "unknown"), "args_count": len(args)},
+    """Record many ``template`` sends in one INSERT (caller commits).
+
+    ``messages`` holds each send's positional arguments and notification id.
+    """
+    if not messages:
+        return
+    rows = [
+        _outbox_message(template, args, {}, notification_id).model_dump(
+            exclude={"id"}
+        )
+        for args, notification_id in messages
+    ]
+    db.exec(insert(EmailOutbox).values(rows))
+    logger.info("email_enqueued", extra={"task": template, "count": len(rows)})
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff after ``attempts`` failed sends."""
+    seconds = settings.EMAIL_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, settings.EMAIL_RETRY_MAX_SECONDS))
+
+
+def claim_due_emails(
+    db: Session, *, limit: int, now: datetime | None = None
+) -> Sequence[EmailOutbox]:
+    """Lease up to ``limit`` due emails to this worker and commit the claim.
+
+    Rows left in ``SENDING`` by a worker that died are claimable again once
+    their lease expires.
+    """
+    now = now or datetime.now(timezone.utc)
+    due = or_(
+        and_(
+            EmailOutbox.status == EmailOutboxStatus.PENDING,
+            EmailOutbox.next_attempt_at <= now,
+        ),
+        and_(
+            EmailOutbox.status == EmailOutboxStatus.SENDING,
+            EmailOutbox.locked_until < now,
+        ),
+    )
+    ids = db.exec(
+        select(EmailOutbox.id)
+        .where(due)
+        .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+        .limit(limit)
+    ).all()
+    if not ids:
+        return []
+    token = secrets.token_hex(16)
+    # Re-checking ``due`` makes the claim atomic against concurrent workers.
+    db.exec(
+        update(EmailOutbox)
+        .where(EmailOutbox.id.in_(ids), due)
+        .values(
+            status=EmailOutboxStatus.SENDING,
+            claim_token=token,
+            locked_until=now + timedelta(seconds=settings.EMAIL_LEASE_SECONDS),
         )
-        background_tasks.add_task(fn, *args, **kwargs)
+    )
+    db.commit()
+    return db.exec(
+        select(EmailOutbox)
+        .where(EmailOutbox.claim_token == token)
+        .options(selectinload(EmailOutbox.notification))
+    ).all()
+
+
+async def deliver_email(message: EmailOutbox, service: Any = email_service) -> str | None:
+    """Send one outbox email; returns the error, or ``None`` when delivered."""
+    send = getattr(service, message.template)
+    try:
+        delivered = await send(
+            *message.payload.get("args", []), **message.payload.get("kwargs", {})
+        )
+    except Exception as exc:  # a failing provider must not stop the batch
+        logger.exception("email_send_failed", extra={"task": message.template})
+        return f"{type(exc).__name__}: {exc}"
+    return None if delivered else "Email was not accepted for delivery"
+
+
+def record_delivery(
+    db: Session,
+    message: EmailOutbox,
+    error: str | None,
+    *,
+    now: datetime | None = None,
+) -> None:
+    """Store a send outcome, scheduling a retry or giving up (caller commits)."""
+    now = now or datetime.now(timezone.utc)
+    message.attempts += 1
+    message.claim_token = None
+    message.locked_until = None
+    message.last_error = error
+    notification = message.notification
+    if error is None:
+        message.status = EmailOutboxStatus.SENT
+        message.sent_at = now
+        if notification is not None:
+            notification.sent = True
+            notification.sent_at = now
+            notification.error = None
+    elif message.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+        message.status = EmailOutboxStatus.FAILED
+        if notification is not None:
+            notification.sent = False
+            notification.error = error
     else:
-        logger.info(
-            "email_enqueued",
-            extra={"task": getattr(fn, "__name__", "unknown"), "args_count": len(args)},
+        message.status = EmailOutboxStatus.PENDING
+        message.next_attempt_at = now + retry_delay(message.attempts)
+    db.add(message)
+    if notification is not None:
+        db.add(notification)
+
+
+async def deliver_email_batch(
+    messages: Sequence[EmailOutbox], service: Any = email_service
+) -> list[str | None]:
+    """Send same-template emails through the provider batch API."""
+    try:
+        delivered = await service.send_batch(
+            messages[0].template,
+            [
+                (message.payload.get("args", []), message.payload.get("kwargs", {}))
+                for message in messages
+            ],
         )
-        fn(*args, **kwargs)
+    except Exception as exc:  # a failing provider must not stop the batch
+        logger.exception("email_send_failed", extra={"task": messages[0].template})
+        return [f"{type(exc).__name__}: {exc}"] * len(messages)
+    return [
+        None if sent else "Email was not accepted for delivery" for sent in delivered
+    ]
+
+
+def _record_deliveries(
+    db: Session, outcomes: Sequence[tuple[EmailOutbox, str | None]]
+) -> None:
+    for message, error in outcomes:
+        record_delivery(db, message, error)
+    db.commit()
+
+
+async def drain_outbox(
+    db: Session,
+    *,
+    concurrency: int,
+    batch_size: int,
+    service: Any = email_service,
+) -> int:
+    """Send one batch of due emails, at most ``concurrency`` at a time.
+
+    Database work runs in a worker thread so the drain can share an event
+    loop with the API without blocking its requests.
+    """
+    messages = await anyio.to_thread.run_sync(
+        partial(claim_due_emails, db, limit=batch_size)
+    )
+    if not messages:
+        return 0
+    # Batchable templates share one provider call; the rest go one by one.
+    can_batch = getattr(service, "can_batch", None)
+    batches: dict[str, list[EmailOutbox]] = {}
+    groups: list[list[EmailOutbox]] = []
+    for message in messages:
+        if can_batch is not None and can_batch(message.template):
+            batches.setdefault(message.template, []).append(message)
+        else:
+            groups.append([message])
+    groups.extend(batches.values())
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _send(group: list[EmailOutbox]) -> list[str | None]:
+        async with semaphore:
+            if group[0].template in batches:
+                return await deliver_email_batch(group, service)
+            return [await deliver_email(group[0], service)]
+
+    results = await asyncio.gather(*(_send(group) for group in groups))
+    outcomes = [
+        (message, error)
+        for group, group_errors in zip(groups, results)
+        for message, error in zip(group, group_errors)
+    ]
+    await anyio.to_thread.run_sync(_record_deliveries, db, outcomes)
+    errors = [error for _, error in outcomes]
+    logger.info(
+        "email_outbox_drained",
+        extra={
+            "claimed": len(messages),
+            "failed": sum(error is not None for error in errors),
+        },
+    )
+    return len(messages)
@@ -1,16 +1,21 @@
 "Email service for sending professional, feature-rich notifications."
 
 import base64
+import inspect
+import json
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from enum import Enum
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 from urllib.parse import quote
 
 import anyio
 import httpx
 
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.core.security_token import security_token_manager
+from app.services.smtp_pool import SMTPConnectionPool
 
 # Attempt to import ics, but allow the app to run without it.
 try:
@@ -21,6 +26,72 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Batchable templates and the method that renders each without sending.
+BATCH_TEMPLATES = {
+    "send_event_invitation": "_render_event_invitation",
+    "send_event_update": "_render_event_update",
+    "send_event_reminder": "_render_event_reminder",
+}
+SENDGRID_BATCH_LIMIT = 1000  # personalizations per mail/send request
+RESEND_BATCH_LIMIT = 100  # emails per /emails/batch request
+
+# Placeholders for per-recipient values in a batch-rendered email.
+RECIPIENT_NAME_TAG = "-recipient_name-"
+RSVP_CONFIRM_TAG = "-rsvp_confirm_url-"
+RSVP_DECLINE_TAG = "-rsvp_decline_url-"
+
+
+class SendOutcome(Enum):
+    """Result of one provider request."""
+
+    SENT = "sent"
+    # Refused before delivery; another provider may send it.
+    REJECTED = "rejected"
+    # Timed out or failed after the request went out and may have been
+    # accepted; sending again elsewhere risks a duplicate.
+    UNKNOWN = "unknown"
+
+
+def _response_outcome(response: httpx.Response, accepted: bool) -> SendOutcome:
+    if accepted:
+        return SendOutcome.SENT
+    if response.status_code >= 500:
+        return SendOutcome.UNKNOWN
+    return SendOutcome.REJECTED
+
+
+def _error_outcome(exc: Exception) -> SendOutcome:
+    # Errors raised before the request was written never reached the provider.
+    if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return SendOutcome.REJECTED
+    if isinstance(exc, httpx.TransportError):
+        return SendOutcome.UNKNOWN
+    return SendOutcome.REJECTED
+
+
+class RenderedEmail(NamedTuple):
+    subject: str
+    text_body: str
+    html_body: Optional[str]
+    attachments: List[Dict[str, Any]]
+
+
+def substitute_recipient(
+    email: RenderedEmail, substitutions: Mapping[str, str]
+) -> RenderedEmail:
+    """Fill a batch-rendered email's recipient tags for one recipient."""
+
+    def _fill(text: Optional[str]) -> Optional[str]:
+        for tag, value in substitutions.items():
+            text = text.replace(tag, value) if text else text
+        return text
+
+    return email._replace(
+        subject=_fill(email.subject),
+        text_body=_fill(email.text_body),
+        html_body=_fill(email.html_body),
+    )
+
 
 class EmailService:
     """Service for sending email notifications with HTML, deep links, and calendar invites."""
@@ -49,6 +120,8 @@ class EmailService:
         )
         self.api_url = f"{self.frontend_url}/api/v1"
 
+        self._smtp_pool: Optional[SMTPConnectionPool] = None
+
         self.is_configured = self.use_sendgrid or self.use_resend or bool(
             self.smtp_user and self.smtp_password
         )
@@ -169,7 +242,52 @@ class EmailService:
     ) -> bool:
         if not self._require_configured("send event invitation"):
             return False
+        return await self._send_rendered(
+            to_email,
+            self._render_event_invitation(
+                to_name,
+                event_name,
+                event_date,
+                event_time,
+                event_location,
+                event_notes,
+                organizer_name,
+                self._rsvp_urls(user_id, event_id),
+                event_id,
+                event_end_date,
+                event_end_time,
+            ),
+        )
+
+    def _rsvp_urls(
+        self, user_id: Optional[int], event_id: Optional[int]
+    ) -> Optional[Tuple[str, str]]:
+        """One-click confirm/decline links for an invitee, if both ids are known."""
+        if not (user_id and event_id):
+            return None
+        urls = []
+        for status in ("confirmed", "declined"):
+            token = security_token_manager.generate_token(
+                {"user_id": user_id, "event_id": event_id, "status": status},
+                salt="rsvp-event",
+            )
+            urls.append(f"{self.api_url}/events/rsvp?token={token}")
+        return urls[0], urls[1]
 
+    def _render_event_invitation(
+        self,
+        to_name: str,
+        event_name: str,
+        event_date: str,
+        event_time: Optional[str],
+        event_location: Optional[str],
+        event_notes: Optional[str],
+        organizer_name: str,
+        rsvp_urls: Optional[Tuple[str, str]] = None,
+        event_id: Optional[int] = None,
+        event_end_date: Optional[str] = None,
+        event_end_time: Optional[str] = None,
+    ) -> RenderedEmail:
         subject = f"Invitation: {event_name}"
         event_url = (
             f"{self.frontend_url}/events/{event_id}" if event_id else self.frontend_url
@@ -177,20 +295,12 @@ class EmailService:
 
         # Build text body with conditional RSVP links
         text_body_rsvp_links = ""
-        if user_id and event_id:
-            rsvp_salt = "rsvp-event"
-            confirm_token = security_token_manager.generate_token(
-                {"user_id": user_id, "event_id": event_id, "status": "confirmed"},
-                salt=rsvp_salt,
-            )
-            decline_token = security_token_manager.generate_token(
-                {"user_id": user_id, "event_id": event_id, "status": "declined"},
-                salt=rsvp_salt,
-            )
+        if rsvp_urls:
+            confirm_url, decline_url = rsvp_urls
             text_body_rsvp_links = (
                 f"\nOne-Click RSVP:\n"
-                f"- I'll be there: {self.api_url}/events/rsvp?token={confirm_token}\n"
-                f"- I can't make it: {self.api_url}/events/rsvp?token={decline_token}\n"
+                f"- I'll be there: {confirm_url}\n"
+                f"- I can't make it: {decline_url}\n"
             )
 
         location_line = f" Location: {event_location}." if event_location else ""
@@ -215,26 +325,18 @@ class EmailService:
         )
 
         buttons = []
-        if user_id and event_id:
-            rsvp_salt = "rsvp-event"
-            confirm_token = security_token_manager.generate_token(
-                {"user_id": user_id, "event_id": event_id, "status": "confirmed"},
-                salt=rsvp_salt,
-            )
-            decline_token = security_token_manager.generate_token(
-                {"user_id": user_id, "event_id": event_id, "status": "declined"},
-                salt=rsvp_salt,
-            )
+        if rsvp_urls:
+            confirm_url, decline_url = rsvp_urls
             buttons.extend(
                 [
                     {
                         "text": "✔ Yes, I'll be there",
-                        "url": f"{self.api_url}/events/rsvp?token={confirm_token}",
+                        "url": confirm_url,
                         "color": "#28a745",
                     },
                     {
                         "text": "✖ No, I can't make it",
-                        "url": f"{self.api_url}/events/rsvp?token={decline_token}",
+                        "url": decline_url,
                         "color": "#dc3545",
                     },
                 ]
@@ -279,9 +381,7 @@ class EmailService:
             else []
         )
 
-        return await self._send_email(
-            to_email, subject, text_body, html_body, attachments
-        )
+        return RenderedEmail(subject, text_body, html_body, attachments)
 
     async def send_event_update(
         self,
@@ -298,6 +398,33 @@ class EmailService:
     ) -> bool:
         if not self._require_configured("send event update"):
             return False
+        return await self._send_rendered(
+            to_email,
+            self._render_event_update(
+                to_name,
+                event_name,
+                changes,
+                event_date,
+                event_time,
+                event_location,
+                event_end_date,
+                event_end_time,
+                event_id,
+            ),
+        )
+
+    def _render_event_update(
+        self,
+        to_name: str,
+        event_name: str,
+        changes: str,
+        event_date: str,
+        event_time: Optional[str],
+        event_location: Optional[str],
+        event_end_date: Optional[str] = None,
+        event_end_time: Optional[str] = None,
+        event_id: Optional[int] = None,
+    ) -> RenderedEmail:
         subject = f"Event Updated: {event_name}"
         event_url = (
             f"{self.frontend_url}/events/{event_id}" if event_id else self.frontend_url
@@ -355,9 +482,7 @@ class EmailService:
             else []
         )
 
-        return await self._send_email(
-            to_email, subject, text_body, html_body, attachments
-        )
+        return RenderedEmail(subject, text_body, html_body, attachments)
 
     async def send_confirmation_receipt(
         self,
@@ -406,6 +531,33 @@ class EmailService:
     ) -> bool:
         if not self._require_configured("send event reminder"):
             return False
+        return await self._send_rendered(
+            to_email,
+            self._render_event_reminder(
+                to_name,
+                event_name,
+                event_date,
+                event_time,
+                event_location,
+                hours_until,
+                event_end_date,
+                event_end_time,
+                event_id,
+            ),
+        )
+
+    def _render_event_reminder(
+        self,
+        to_name: str,
+        event_name: str,
+        event_date: str,
+        event_time: Optional[str],
+        event_location: Optional[str],
+        hours_until: int,
+        event_end_date: Optional[str] = None,
+        event_end_time: Optional[str] = None,
+        event_id: Optional[int] = None,
+    ) -> RenderedEmail:
         subject = f"Reminder: {event_name} in {hours_until} hours"
         event_url = (
             f"{self.frontend_url}/events/{event_id}" if event_id else self.frontend_url
@@ -462,9 +614,7 @@ class EmailService:
             else []
         )
 
-        return await self._send_email(
-            to_email, subject, text_body, html_body, attachments
-        )
+        return RenderedEmail(subject, text_body, html_body, attachments)
 
     async def send_password_reset(
         self, to_email: str, to_name: str, reset_token: str, expires_minutes: int
@@ -752,6 +902,117 @@ class EmailService:
         )
         return await self._send_email(to_email, subject, text_body, html_body)
 
+    async def _send_rendered(self, to_email: str, email: RenderedEmail) -> bool:
+        return await self._send_email(
+            to_email,
+            email.subject,
+            email.text_body,
+            email.html_body,
+            email.attachments,
+        )
+
+    def can_batch(self, template: str) -> bool:
+        """Whether ``send_batch`` can use a provider batch API for ``template``."""
+        return template in BATCH_TEMPLATES and (self.use_sendgrid or self.use_resend)
+
+    async def send_batch(
+        self,
+        template: str,
+        calls: Sequence[Tuple[Sequence[Any], Mapping[str, Any]]],
+    ) -> List[bool]:
+        """Send many ``template`` emails with one provider request per event.
+
+        ``calls`` holds the ``(args, kwargs)`` of the equivalent ``template``
+        calls.  Calls that differ only in their recipient are rendered once
+        with recipient tags that the provider substitutes per recipient.
+        Returns whether each call was accepted.
+        """
+        if not self._require_configured("send batch email"):
+            return [False] * len(calls)
+        signature = inspect.signature(getattr(self, template))
+        render = getattr(self, BATCH_TEMPLATES[template])
+        groups: Dict[str, List[int]] = {}
+        shared_arguments: Dict[str, Dict[str, Any]] = {}
+        recipients: List[Tuple[str, Dict[str, str]]] = []
+        for index, (args, kwargs) in enumerate(calls):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            to_email, shared, substitutions = self._split_recipient(
+                template, dict(bound.arguments)
+            )
+            key = json.dumps(shared, sort_keys=True, default=str)
+            groups.setdefault(key, []).append(index)
+            shared_arguments[key] = shared
+            recipients.append((to_email, substitutions))
+
+        delivered = [False] * len(calls)
+        for key, indexes in groups.items():
+            results = await self._send_rendered_batch(
+                render(**shared_arguments[key]), [recipients[i] for i in indexes]
+            )
+            for index, result in zip(indexes, results):
+                delivered[index] = result
+        return delivered
+
+    def _split_recipient(
+        self, template: str, arguments: Dict[str, Any]
+    ) -> Tuple[str, Dict[str, Any], Dict[str, str]]:
+        """Swap per-recipient arguments for tags and return their substitutions."""
+        to_email = arguments.pop("to_email")
+        substitutions = {RECIPIENT_NAME_TAG: arguments["to_name"] or "there"}
+        arguments["to_name"] = RECIPIENT_NAME_TAG
+        if template == "send_event_invitation":
+            rsvp_urls = self._rsvp_urls(arguments.pop("user_id"), arguments["event_id"])
+            arguments["rsvp_urls"] = None
+            if rsvp_urls:
+                substitutions[RSVP_CONFIRM_TAG] = rsvp_urls[0]
+                substitutions[RSVP_DECLINE_TAG] = rsvp_urls[1]
+                arguments["rsvp_urls"] = (RSVP_CONFIRM_TAG, RSVP_DECLINE_TAG)
+        return to_email, arguments, substitutions
+
+    async def _send_rendered_batch(
+        self, email: RenderedEmail, recipients: Sequence[Tuple[str, Dict[str, str]]]
+    ) -> List[bool]:
+        """Send through each batch provider in turn, then one by one.
+
+        Recipients whose batch may have been accepted are left undelivered
+        for the outbox to retry instead of being sent again elsewhere.
+        """
+        outcomes = [SendOutcome.REJECTED] * len(recipients)
+        senders = []
+        if self.use_sendgrid:
+            senders.append((SENDGRID_BATCH_LIMIT, self._send_sendgrid))
+        # Resend's batch endpoint does not accept attachments.
+        batch_resend = self.use_resend and not email.attachments
+        if batch_resend:
+            senders.append((RESEND_BATCH_LIMIT, self._send_resend_batch))
+        for limit, send in senders:
+            pending = [
+                index
+                for index, outcome in enumerate(outcomes)
+                if outcome is SendOutcome.REJECTED
+            ]
+            for start in range(0, len(pending), limit):
+                chunk = pending[start : start + limit]
+                outcome = await send(email, [recipients[index] for index in chunk])
+                for index in chunk:
+                    outcomes[index] = outcome
+        # Rejected batches go out one message at a time, but only through
+        # providers the batch did not already try.
+        for index, outcome in enumerate(outcomes):
+            if outcome is not SendOutcome.REJECTED:
+                continue
+            to_email, substitutions = recipients[index]
+            single = substitute_recipient(email, substitutions)
+            if self.use_resend and not batch_resend:
+                outcome = await self._send_resend(single, to_email)
+            smtp_configured = bool(self.smtp_user and self.smtp_password)
+            if outcome is SendOutcome.REJECTED and smtp_configured:
+                sent = await anyio.to_thread.run_sync(self._send_smtp, to_email, single)
+                outcome = SendOutcome.SENT if sent else SendOutcome.REJECTED
+            outcomes[index] = outcome
+        return [outcome is SendOutcome.SENT for outcome in outcomes]
+
     async def _send_email(
         self,
         to_email: str,
@@ -762,174 +1023,218 @@ class EmailService:
     ) -> bool:
         if not self._require_configured("send email"):
             return False
-        # Prefer SendGrid if configured
+        email = RenderedEmail(subject, text_body, html_body, attachments or [])
+        # Prefer SendGrid, then Resend, then SMTP.  Only a rejected send moves
+        # on to the next provider; an ambiguous one may have been delivered,
+        # so it is left for the outbox to retry rather than sent twice.
         if self.use_sendgrid:
-            try:
-                payload: Dict[str, Any] = {
-                    "from": {
-                        "email": self.sendgrid_from_email,
-                        "name": self.sendgrid_from_name,
-                    },
-                    "personalizations": [{"to": [{"email": to_email}]}],
-                    "subject": subject,
-                    "content": [
-                        {"type": "text/plain", "value": text_body},
-                        *(
-                            [{"type": "text/html", "value": html_body}]
-                            if html_body
-                            else []
-                        ),
-                    ],
-                    "tracking_settings": {
-                        "click_tracking": {
-                            "enable": False,
-                            "enable_text": False,
-                        }
+            outcome = await self._send_sendgrid(email, [(to_email, {})])
+            if outcome is not SendOutcome.REJECTED:
+                return outcome is SendOutcome.SENT
+        if self.use_resend:
+            outcome = await self._send_resend(email, to_email)
+            if outcome is not SendOutcome.REJECTED:
+                return outcome is SendOutcome.SENT
+        if self.smtp_user and self.smtp_password:
+            return await anyio.to_thread.run_sync(self._send_smtp, to_email, email)
+        logger.error("Email service not configured for sending (no Resend or SMTP).")
+        return False
+
+    async def _send_sendgrid(
+        self, email: RenderedEmail, recipients: Sequence[Tuple[str, Dict[str, str]]]
+    ) -> SendOutcome:
+        """One SendGrid request with a personalization per recipient."""
+        personalizations: List[Dict[str, Any]] = []
+        for to_email, substitutions in recipients:
+            personalization: Dict[str, Any] = {"to": [{"email": to_email}]}
+            if substitutions:
+                personalization["substitutions"] = substitutions
+            personalizations.append(personalization)
+        try:
+            payload: Dict[str, Any] = {
+                "from": {
+                    "email": self.sendgrid_from_email,
+                    "name": self.sendgrid_from_name,
+                },
+                "personalizations": personalizations,
+                "subject": email.subject,
+                "content": [
+                    {"type": "text/plain", "value": email.text_body},
+                    *(
+                        [{"type": "text/html", "value": email.html_body}]
+                        if email.html_body
+                        else []
+                    ),
+                ],
+                "tracking_settings": {
+                    "click_tracking": {
+                        "enable": False,
+                        "enable_text": False,
+                    }
+                },
+            }
+            if email.attachments:
+                payload["attachments"] = [
+                    {
+                        "filename": attachment.get("filename", "attachment"),
+                        "content": attachment.get("content", ""),
+                        "type": attachment.get("mime_type", "application/octet-stream"),
+                        "disposition": "attachment",
+                    }
+                    for attachment in email.attachments
+                ]
+
+            resp = await get_http_client().post(
+                "https://api.sendgrid.com/v3/mail/send",
+                headers={
+                    "Authorization": f"Bearer {self.sendgrid_api_key}",
+                    "Content-Type": "application/json",
+                },
+                json=payload,
+            )
+            if resp.status_code == 202:
+                logger.info(
+                    "email_sent",
+                    extra={
+                        "provider": "sendgrid",
+                        "status": resp.status_code,
+                        "recipients": len(recipients),
                     },
-                }
-                if attachments:
-                    payload["attachments"] = [
-                        {
-                            "filename": attachment.get("filename", "attachment"),
-                            "content": attachment.get("content", ""),
-                            "type": attachment.get(
-                                "mime_type", "application/octet-stream"
-                            ),
-                            "disposition": "attachment",
-                        }
-                        for attachment in attachments
-                    ]
-
-                async with httpx.AsyncClient(timeout=10) as client:
-                    resp = await client.post(
-                        "https://api.sendgrid.com/v3/mail/send",
-                        headers={
-                            "Authorization": f"Bearer {self.sendgrid_api_key}",
-                            "Content-Type": "application/json",
-                        },
-                        json=payload,
-                    )
-                if resp.status_code == 202:
-                    logger.info(
-                        "email_sent",
-                        extra={"provider": "sendgrid", "status": resp.status_code},
-                    )
-                    return True
+                )
+            else:
                 logger.error(
                     "Failed to send email via SendGrid",
                     extra={"status": resp.status_code},
                 )
-            except Exception as exc:
-                logger.error(
-                    "Failed to send email via SendGrid", extra={"error": str(exc)}
+            return _response_outcome(resp, resp.status_code == 202)
+        except Exception as exc:
+            logger.error("Failed to send email via SendGrid", extra={"error": str(exc)})
+            return _error_outcome(exc)
+
+    def _resend_message(self, email: RenderedEmail, to_email: str) -> Dict[str, Any]:
+        return {
+            "from": f"{self.from_name} <{self.resend_from_email}>",
+            "to": [to_email],
+            "subject": email.subject,
+            "text": email.text_body,
+            "html": email.html_body,
+        }
+
+    async def _post_resend(
+        self, url: str, payload: Any, recipients: int
+    ) -> SendOutcome:
+        try:
+            resp = await get_http_client().post(
+                url,
+                headers={"Authorization": f"Bearer {self.resend_api_key}"},
+                json=payload,
+            )
+            if resp.status_code < 400:
+                logger.info(
+                    "email_sent",
+                    extra={
+                        "provider": "resend",
+                        "status": resp.status_code,
+                        "recipients": recipients,
+                    },
                 )
-        # If Resend is configured, try to use it first
-        if self.use_resend:
-            try:
-                json_payload = {
-                    "from": f"{self.from_name} <{self.resend_from_email}>",
-                    "to": [to_email],
-                    "subject": subject,
-                    "text": text_body,
-                    "html": html_body,
-                    "attachments": attachments or [],
-                }
-                async with httpx.AsyncClient(timeout=10) as client:
-                    resp = await client.post(
-                        "https://api.resend.com/emails",
-                        headers={"Authorization": f"Bearer {self.resend_api_key}"},
-                        json=json_payload,
-                    )
-                if resp.status_code < 400:
-                    logger.info(
-                        "email_sent",
-                        extra={"provider": "resend", "status": resp.status_code},
-                    )
-                    return True
+            else:
                 logger.error(
                     "Failed to send email via Resend",
                     extra={"status": resp.status_code},
                 )
-                # Fall through to SMTP if Resend fails
-            except Exception as exc:
-                logger.error(
-                    "Failed to send email via Resend", extra={"error": str(exc)}
-                )
-                # Fall through to SMTP if Resend fails
+            return _response_outcome(resp, resp.status_code < 400)
+        except Exception as exc:
+            logger.error("Failed to send email via Resend", extra={"error": str(exc)})
+            return _error_outcome(exc)
 
-        # Fallback to SMTP if configured or Resend failed
-        if self.smtp_user and self.smtp_password:
+    async def _send_resend(self, email: RenderedEmail, to_email: str) -> SendOutcome:
+        payload = self._resend_message(email, to_email)
+        payload["attachments"] = email.attachments
+        return await self._post_resend("https://api.resend.com/emails", payload, 1)
 
-            def _send_sync() -> bool:
-                try:
-                    import smtplib
-                    from email.mime.multipart import MIMEMultipart
-                    from email.mime.text import MIMEText
-                    from email.mime.application import (
-                        MIMEApplication,
-                    )  # Needed for non-text attachments
-
-                    msg_root = MIMEMultipart("related")
-                    msg_root["From"] = f"{self.from_name} <{self.from_email}>"
-                    msg_root["To"] = to_email
-                    msg_root["Subject"] = subject
-
-                    msg_alt = MIMEMultipart("alternative")
-                    msg_alt.attach(MIMEText(text_body, "plain", "utf-8"))
-                    if html_body:
-                        msg_alt.attach(MIMEText(html_body, "html", "utf-8"))
-                    msg_root.attach(msg_alt)
-
-                    if attachments:
-                        for attachment in attachments:
-                            _mime_type = attachment.get(
-                                "mime_type", "application/octet-stream"
-                            )
-
-                            if _mime_type.startswith("text/"):
-                                part = MIMEText(
-                                    base64.b64decode(attachment["content"]).decode(
-                                        "utf-8"
-                                    ),
-                                    _subtype=_mime_type.split("/", 1)[1],
-                                    _charset="utf-8",
-                                )
-                            else:
-                                part = MIMEApplication(
-                                    base64.b64decode(attachment["content"]),
-                                    _subtype=_mime_type.split("/", 1)[1]
-                                    if "/" in _mime_type
-                                    else "octet-stream",
-                                )
-
-                            part.add_header(
-                                "Content-Disposition",
-                                f'attachment; filename="{attachment["filename"]}"',
-                            )
-                            if attachment.get("content_id"):
-                                part.add_header(
-                                    "Content-ID", f"<{attachment['content_id']}>"
-                                )
-                            msg_root.attach(part)
-
-                    with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                        if self.smtp_port == 587:
-                            server.starttls()
-                        server.login(self.smtp_user, self.smtp_password)
-                        server.send_message(msg_root)
-                    logger.info(
-                        "email_sent", extra={"provider": "smtp", "status": 250}
+    async def _send_resend_batch(
+        self, email: RenderedEmail, recipients: Sequence[Tuple[str, Dict[str, str]]]
+    ) -> SendOutcome:
+        """One Resend batch request; Resend has no substitutions, so render each."""
+        payload = [
+            self._resend_message(substitute_recipient(email, substitutions), to_email)
+            for to_email, substitutions in recipients
+        ]
+        return await self._post_resend(
+            "https://api.resend.com/emails/batch", payload, len(recipients)
+        )
+
+    def smtp_pool(self) -> SMTPConnectionPool:
+        """The shared SMTP connection pool, created on first use."""
+        if self._smtp_pool is None:
+            self._smtp_pool = SMTPConnectionPool(
+                self.smtp_host,
+                self.smtp_port,
+                self.smtp_user,
+                self.smtp_password,
+                size=settings.SMTP_POOL_SIZE,
+                idle_seconds=settings.SMTP_POOL_IDLE_SECONDS,
+                max_messages=settings.SMTP_POOL_MAX_MESSAGES,
+                timeout=settings.SMTP_TIMEOUT_SECONDS,
+            )
+        return self._smtp_pool
+
+    def close(self) -> None:
+        """Close pooled SMTP connections."""
+        if self._smtp_pool is not None:
+            self._smtp_pool.close()
+
+    def _send_smtp(self, to_email: str, email: RenderedEmail) -> bool:
+        """Blocking SMTP send; run it in a worker thread."""
+        try:
+            from email.mime.multipart import MIMEMultipart
+            from email.mime.text import MIMEText
+            from email.mime.application import (
+                MIMEApplication,
+            )  # Needed for non-text attachments
+
+            msg_root = MIMEMultipart("related")
+            msg_root["From"] = f"{self.from_name} <{self.from_email}>"
+            msg_root["To"] = to_email
+            msg_root["Subject"] = email.subject
+
+            msg_alt = MIMEMultipart("alternative")
+            msg_alt.attach(MIMEText(email.text_body, "plain", "utf-8"))
+            if email.html_body:
+                msg_alt.attach(MIMEText(email.html_body, "html", "utf-8"))
+            msg_root.attach(msg_alt)
+
+            for attachment in email.attachments:
+                _mime_type = attachment.get("mime_type", "application/octet-stream")
+
+                if _mime_type.startswith("text/"):
+                    part = MIMEText(
+                        base64.b64decode(attachment["content"]).decode("utf-8"),
+                        _subtype=_mime_type.split("/", 1)[1],
+                        _charset="utf-8",
                     )
-                    return True
-                except Exception as exc:
-                    logger.error(
-                        "Failed to send email via SMTP", extra={"error": str(exc)}
+                else:
+                    part = MIMEApplication(
+                        base64.b64decode(attachment["content"]),
+                        _subtype=_mime_type.split("/", 1)[1]
+                        if "/" in _mime_type
+                        else "octet-stream",
                     )
-                    return False
 
-            return await anyio.to_thread.run_sync(_send_sync)
-        logger.error("Email service not configured for sending (no Resend or SMTP).")
-        return False
+                part.add_header(
+                    "Content-Disposition",
+                    f'attachment; filename="{attachment["filename"]}"',
+                )
+                if attachment.get("content_id"):
+                    part.add_header("Content-ID", f"<{attachment['content_id']}>")
+                msg_root.attach(part)
 
+            self.smtp_pool().send_message(msg_root)
+            logger.info("email_sent", extra={"provider": "smtp", "status": 250})
+            return True
+        except Exception as exc:
+            logger.error("Failed to send email via SMTP", extra={"error": str(exc)})
+            return False
 
 email_service = EmailService()
@@ -0,0 +1,136 @@
+"""Event visibility queries shared by the calendar endpoints."""
+
+from __future__ import annotations
+
+import base64
+import json
+from datetime import date, time
+from typing import NamedTuple, Sequence
+
+from sqlalchemy import and_, exists, false, func, or_
+from sqlalchemy.sql import ColumnElement, Select
+from sqlmodel import Session, select
+
+from app.models.event import Event
+from app.models.event_visibility import EventVisibility
+from app.models.user import User
+from app.services.event_visibility_service import ALL_EVENTS_ROLES
+
+# Events without a start time sort after timed events on the same day.
+_start_time_key = func.coalesce(Event.start_time, time.min)
+
+
+class EventCursor(NamedTuple):
+    """Sort key of the last event on a page."""
+
+    event_date: date
+    start_time: time
+    event_id: int
+
+
+def encode_event_cursor(event: Event) -> str:
+    raw = json.dumps(
+        [
+            event.event_date.isoformat(),
+            (event.start_time or time.min).isoformat(),
+            event.id,
+        ]
+    ).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_event_cursor(cursor: str) -> EventCursor:
+    """Parse a cursor from :func:`encode_event_cursor` (``ValueError`` if bad)."""
+    try:
+        event_date, start_time, event_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode())
+        )
+        return EventCursor(
+            date.fromisoformat(event_date),
+            time.fromisoformat(start_time),
+            int(event_id),
+        )
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def event_visibility_clause(user: User) -> ColumnElement[bool] | None:
+    """Predicate on ``Event`` for the events ``user`` may see (``None`` = all).
+
+    Non-admin visibility is read from the ``event_visibility`` index kept by
+    ``event_visibility_service``.
+    """
+    if user.role in ALL_EVENTS_ROLES:
+        return None
+    if user.id is None:
+        return false()
+    return exists().where(
+        EventVisibility.user_id == user.id, EventVisibility.event_id == Event.id
+    )
+
+
+def newest_first(statement: Select) -> Select:
+    """Order events newest first with a unique tie-break so pages are stable."""
+    return statement.order_by(
+        Event.event_date.desc(), _start_time_key.desc(), Event.id.desc()
+    )
+
+
+def visible_events_statement(
+    user: User,
+    *,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    after: EventCursor | None = None,
+) -> Select:
+    """Distinct events visible to ``user`` within the window, newest first."""
+    statement = select(Event)
+    clause = event_visibility_clause(user)
+    if clause is not None:
+        statement = statement.where(clause)
+    if date_from is not None:
+        statement = statement.where(Event.event_date >= date_from)
+    if date_to is not None:
+        statement = statement.where(Event.event_date <= date_to)
+    if after is not None:
+        statement = statement.where(
+            or_(
+                Event.event_date < after.event_date,
+                and_(
+                    Event.event_date == after.event_date,
+                    or_(
+                        _start_time_key < after.start_time,
+                        and_(
+                            _start_time_key == after.start_time,
+                            Event.id < after.event_id,
+                        ),
+                    ),
+                ),
+            )
+        )
+    return newest_first(statement)
+
+
+def list_visible_events(
+    db: Session,
+    user: User,
+    *,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> tuple[Sequence[Event], str | None]:
+    """One page of visible events and the cursor of the next page, if any."""
+    statement = visible_events_statement(
+        user,
+        date_from=date_from,
+        date_to=date_to,
+        after=decode_event_cursor(cursor) if cursor else None,
+    )
+    if limit is None:
+        return db.exec(statement).all(), None
+    events = db.exec(statement.limit(limit + 1)).all()
+    if len(events) <= limit:
+        return events, None
+    events = events[:limit]
+    return events, encode_event_cursor(events[-1])
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from datetime import datetime, timezone
 from typing import Iterable, Sequence
 
 from sqlalchemy import delete
 from sqlmodel import Session, select
 
+from app.db.upsert import conflict_insert
 from app.models.athlete import Athlete
 from app.models.event import Event
 from app.models.event_participant import EventParticipant, ParticipantStatus
 from app.models.event_team_link import EventTeamLink
+from app.services.event_visibility_service import refresh_event_visibility
 
 
 def _normalize_ids(ids: Iterable[int | None] | None) -> set[int]:
@@ -61,6 +64,7 @@ def persist_event_team_links(
     for team_id in unique_ids:
         db.add(EventTeamLink(event_id=event.id, team_id=team_id))
     event.set_team_ids(unique_ids)
+    refresh_event_visibility(db, [event.id])
 
 
 def get_event_team_id_map(
@@ -97,7 +101,7 @@ def get_event_athlete_ids(db: Session, event_id: int) -> list[int]:
     rows = db.exec(
         select(EventParticipant.athlete_id).where(EventParticipant.event_id == event_id)
     ).all()
-    return [row[0] for row in rows if row and row[0] is not None]
+    return [athlete_id for athlete_id in rows if athlete_id is not None]
 
 
 def get_team_roster_athlete_ids(db: Session, team_ids: Iterable[int]) -> list[int]:
@@ -114,29 +118,83 @@ def get_team_roster_athlete_ids(db: Session, team_ids: Iterable[int]) -> list[in
     return normalized
 
 
-def ensure_roster_participants(
-    db: Session, event: Event, roster_athlete_ids: Iterable[int]
+def invite_event_participants(
+    db: Session,
+    event_id: int,
+    invitees: Iterable[tuple[int | None, int | None]],
 ) -> None:
-    """Add missing event participants for roster athletes."""
-    athlete_ids = {
-        athlete_id for athlete_id in roster_athlete_ids if athlete_id is not None
-    }
-    if not athlete_ids or not event.id:
+    """Invite ``(user_id, athlete_id)`` pairs in one statement.
+
+    Pairs whose user or athlete is already on the event are skipped by the
+    ``(event_id, user_id)``/``(event_id, athlete_id)`` unique indexes.
+    """
+    pairs = [
+        (user_id, athlete_id)
+        for user_id, athlete_id in dict.fromkeys(invitees)
+        if user_id is not None or athlete_id is not None
+    ]
+    if not pairs:
         return
-    existing_rows = db.exec(
-        select(EventParticipant.athlete_id).where(
-            EventParticipant.event_id == event.id,
-            EventParticipant.athlete_id.is_not(None),
-        )
-    ).all()
-    existing_ids = {row[0] for row in existing_rows if row and row[0] is not None}
-    missing = athlete_ids - existing_ids
-    for athlete_id in missing:
-        db.add(
-            EventParticipant(
-                event_id=event.id,
-                athlete_id=athlete_id,
-                user_id=None,
-                status=ParticipantStatus.INVITED,
+    table = EventParticipant.__table__
+    insert = conflict_insert(db, table)
+    if insert is None:
+        existing = db.exec(
+            select(EventParticipant.user_id, EventParticipant.athlete_id).where(
+                EventParticipant.event_id == event_id
+            )
+        ).all()
+        seen_users = {user_id for user_id, _ in existing}
+        seen_athletes = {athlete_id for _, athlete_id in existing}
+        for user_id, athlete_id in pairs:
+            if (user_id is not None and user_id in seen_users) or (
+                athlete_id is not None and athlete_id in seen_athletes
+            ):
+                continue
+            seen_users.add(user_id)
+            seen_athletes.add(athlete_id)
+            db.add(
+                EventParticipant(
+                    event_id=event_id,
+                    user_id=user_id,
+                    athlete_id=athlete_id,
+                    status=ParticipantStatus.INVITED,
+                )
             )
+        return
+    now = datetime.now(timezone.utc)
+    db.exec(
+        insert.values(
+            [
+                {
+                    "event_id": event_id,
+                    "user_id": user_id,
+                    "athlete_id": athlete_id,
+                    "status": ParticipantStatus.INVITED,
+                    "invited_at": now,
+                }
+                for user_id, athlete_id in pairs
+            ]
+        ).on_conflict_do_nothing()
+    )
+    # Core inserts bypass the flush listener that maintains visibility.
+    refresh_event_visibility(db, [event_id])
+
+
+def ensure_user_participants(
+    db: Session, event: Event, user_ids: Iterable[int | None]
+) -> None:
+    """Add missing event participants for users."""
+    if event.id:
+        invite_event_participants(
+            db, event.id, ((user_id, None) for user_id in user_ids)
+        )
+
+
+def ensure_roster_participants(
+    db: Session, event: Event, roster_athlete_ids: Iterable[int | None]
+) -> None:
+    """Add missing event participants for roster athletes."""
+    if event.id:
+        invite_event_participants(
+            db, event.id, ((None, athlete_id) for athlete_id in roster_athlete_ids)
         )
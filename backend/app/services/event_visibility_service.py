@@ -0,0 +1,214 @@
+"""Materialized (user, event) pairs behind every event visibility check.
+
+A non-admin user sees an event they created or were invited to; athletes also
+see events they participate in or that are linked to their team, and coaches
+see events they own or that are linked to a team they coach.
+
+Rows are kept current by a flush listener that refreshes the events and users
+touched by ORM writes.  Bulk ``delete()``/``update()`` statements bypass it, so
+their callers refresh the affected events or users explicitly.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any, Iterable
+
+from sqlalchemy import delete, event, exists, insert, inspect, union
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import ColumnElement, CompoundSelect
+from sqlmodel import Session, select
+
+from app.models.athlete import Athlete
+from app.models.event import Event
+from app.models.event_participant import EventParticipant
+from app.models.event_team_link import EventTeamLink
+from app.models.event_visibility import EventVisibility
+from app.models.team import CoachTeamLink
+from app.models.user import User, UserRole
+
+ALL_EVENTS_ROLES = {UserRole.ADMIN, UserRole.STAFF}
+
+
+def _normalize_ids(ids: Iterable[int | None]) -> list[int]:
+    return sorted({value for value in ids if value is not None})
+
+
+def _visibility_pairs(
+    *, event_ids: list[int] | None = None, user_ids: list[int] | None = None
+) -> CompoundSelect:
+    """``(user_id, event_id)`` for every visibility rule, optionally filtered."""
+    is_coach = User.role == UserRole.COACH
+    is_athlete = User.role == UserRole.ATHLETE
+    sources = [
+        (select(Event.created_by_id, Event.id), Event.created_by_id, Event.id),
+        (
+            select(Event.coach_id, Event.id)
+            .join(User, User.id == Event.coach_id)
+            .where(is_coach),
+            Event.coach_id,
+            Event.id,
+        ),
+        (
+            select(EventParticipant.user_id, EventParticipant.event_id).where(
+                EventParticipant.user_id.isnot(None)
+            ),
+            EventParticipant.user_id,
+            EventParticipant.event_id,
+        ),
+        (
+            select(User.id, EventParticipant.event_id)
+            .join(EventParticipant, EventParticipant.athlete_id == User.athlete_id)
+            .where(is_athlete),
+            User.id,
+            EventParticipant.event_id,
+        ),
+        (
+            select(User.id, EventTeamLink.event_id)
+            .join(Athlete, Athlete.id == User.athlete_id)
+            .join(EventTeamLink, EventTeamLink.team_id == Athlete.team_id)
+            .where(is_athlete),
+            User.id,
+            EventTeamLink.event_id,
+        ),
+        (
+            select(CoachTeamLink.user_id, EventTeamLink.event_id)
+            .join(EventTeamLink, EventTeamLink.team_id == CoachTeamLink.team_id)
+            .join(User, User.id == CoachTeamLink.user_id)
+            .where(is_coach),
+            CoachTeamLink.user_id,
+            EventTeamLink.event_id,
+        ),
+    ]
+    selects = []
+    for statement, user_column, event_column in sources:
+        if event_ids is not None:
+            statement = statement.where(event_column.in_(event_ids))
+        if user_ids is not None:
+            statement = statement.where(user_column.in_(user_ids))
+        selects.append(statement)
+    return union(*selects)
+
+
+def _replace(
+    connection: Connection,
+    stale: ColumnElement[bool] | None,
+    *,
+    event_ids: list[int] | None = None,
+    user_ids: list[int] | None = None,
+) -> None:
+    statement = delete(EventVisibility)
+    connection.execute(statement if stale is None else statement.where(stale))
+    connection.execute(
+        insert(EventVisibility).from_select(
+            ["user_id", "event_id"],
+            _visibility_pairs(event_ids=event_ids, user_ids=user_ids),
+        )
+    )
+
+
+def _refresh(
+    connection: Connection,
+    *,
+    event_ids: Iterable[int | None] = (),
+    user_ids: Iterable[int | None] = (),
+) -> None:
+    events, users = _normalize_ids(event_ids), _normalize_ids(user_ids)
+    if events:
+        _replace(connection, EventVisibility.event_id.in_(events), event_ids=events)
+    if users:
+        _replace(connection, EventVisibility.user_id.in_(users), user_ids=users)
+
+
+def refresh_event_visibility(db: Session, event_ids: Iterable[int | None]) -> None:
+    """Recompute visibility rows for the events (caller commits)."""
+    db.flush()
+    _refresh(db.connection(), event_ids=event_ids)
+
+
+def discard_event_visibility(
+    db: Session,
+    *,
+    event_ids: Iterable[int | None] = (),
+    user_ids: Iterable[int | None] = (),
+) -> None:
+    """Delete rows for events or users that are about to be deleted."""
+    events, users = _normalize_ids(event_ids), _normalize_ids(user_ids)
+    if events:
+        db.exec(delete(EventVisibility).where(EventVisibility.event_id.in_(events)))
+    if users:
+        db.exec(delete(EventVisibility).where(EventVisibility.user_id.in_(users)))
+
+
+def rebuild_event_visibility(db: Session) -> None:
+    """Recompute every visibility row (caller commits)."""
+    db.flush()
+    _replace(db.connection(), None)
+
+
+def can_view_event(db: Session, user: User, event_id: int) -> bool:
+    """Whether ``user`` may see the event; one primary-key lookup for non-admins."""
+    if user.role in ALL_EVENTS_ROLES:
+        return True
+    return bool(
+        db.exec(
+            select(
+                exists().where(
+                    EventVisibility.user_id == user.id,
+                    EventVisibility.event_id == event_id,
+                )
+            )
+        ).one()
+    )
+
+
+def _changed(db: Session, obj: Any, *attributes: str) -> bool:
+    if obj in db.new or obj in db.deleted:
+        return True
+    state = inspect(obj)
+    return any(state.attrs[name].history.has_changes() for name in attributes)
+
+
+def _previous(obj: Any, attribute: str) -> list[Any]:
+    return list(inspect(obj).attrs[attribute].history.deleted)
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_after_flush(db: Session, flush_context: Any) -> None:
+    """Refresh rows for events and users whose visibility inputs were flushed."""
+    event_ids: set[int | None] = set()
+    user_ids: set[int | None] = set()
+    athlete_ids: set[int | None] = set()
+    for obj in chain(db.new, db.dirty, db.deleted):
+        if isinstance(obj, Event):
+            if _changed(db, obj, "created_by_id", "coach_id"):
+                event_ids.add(obj.id)
+        elif isinstance(obj, EventParticipant):
+            if _changed(db, obj, "event_id", "user_id", "athlete_id"):
+                event_ids.add(obj.event_id)
+                event_ids.update(_previous(obj, "event_id"))
+        elif isinstance(obj, EventTeamLink):
+            if _changed(db, obj, "event_id", "team_id"):
+                event_ids.add(obj.event_id)
+                event_ids.update(_previous(obj, "event_id"))
+        elif isinstance(obj, CoachTeamLink):
+            if _changed(db, obj, "user_id", "team_id"):
+                user_ids.add(obj.user_id)
+                user_ids.update(_previous(obj, "user_id"))
+        elif isinstance(obj, User):
+            if _changed(db, obj, "role", "athlete_id"):
+                user_ids.add(obj.id)
+        elif isinstance(obj, Athlete):
+            if obj not in db.new and _changed(db, obj, "team_id"):
+                athlete_ids.add(obj.id)
+    if not (event_ids or user_ids or athlete_ids):
+        return
+    connection = db.connection()
+    athletes = _normalize_ids(athlete_ids)
+    if athletes:
+        user_ids.update(
+            connection.execute(
+                select(User.id).where(User.athlete_id.in_(athletes))
+            ).scalars()
+        )
+    _refresh(connection, event_ids=event_ids, user_ids=user_ids)
@@ -0,0 +1,207 @@
+"""Materialized per-athlete metric scores kept in sync with session results."""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+from sqlalchemy import delete, exists
+from sqlalchemy.sql import ColumnElement
+from sqlmodel import Session, select
+
+from app.analytics.metric_definitions import get_metric_by_id
+from app.analytics.metric_engine import DEFAULT_METRIC_IDS, MetricEngine, top_scores
+from app.models.athlete import Athlete
+from app.models.athlete_metric_snapshot import AthleteMetricSnapshot
+from app.schemas.analytics import AthleteMetricsResponse, MetricScore
+
+# Calculators that read the athlete's current age (resting_readiness uses
+# 220 - age) would go stale on birthdays, so they are always scored live.
+AGE_DEPENDENT_METRIC_IDS = frozenset({"resting_readiness"})
+
+SNAPSHOT_METRIC_IDS: tuple[str, ...] = tuple(
+    metric_id
+    for metric_id in DEFAULT_METRIC_IDS
+    if metric_id not in AGE_DEPENDENT_METRIC_IDS
+)
+
+
+def _materialize(
+    db: Session,
+    engine: MetricEngine,
+    athletes: Sequence[Athlete],
+    metric_ids: Iterable[str],
+) -> None:
+    """Compute the metrics for the athletes and stage one snapshot row per pair."""
+    computed = engine.score_cohort(athletes, list(metric_ids))
+    for metric_id, scores in computed.items():
+        for athlete in athletes:
+            score = scores.get(athlete.id)
+            db.add(
+                AthleteMetricSnapshot(
+                    athlete_id=athlete.id,
+                    metric_id=metric_id,
+                    value=score.value if score else None,
+                    unit=score.unit if score else None,
+                    score=score.model_dump(mode="json") if score else None,
+                )
+            )
+
+
+def refresh_metric_snapshots(db: Session, athlete_ids: Iterable[int | None]) -> None:
+    """Recompute stored snapshots for the given athletes (caller commits)."""
+    unique_ids = sorted({athlete_id for athlete_id in athlete_ids if athlete_id})
+    if not unique_ids:
+        return
+    athletes = db.exec(select(Athlete).where(Athlete.id.in_(unique_ids))).all()
+    db.exec(
+        delete(AthleteMetricSnapshot).where(
+            AthleteMetricSnapshot.athlete_id.in_(unique_ids)
+        )
+    )
+    _materialize(db, MetricEngine(db), athletes, SNAPSHOT_METRIC_IDS)
+
+
+def rebuild_metric_snapshots(db: Session, batch_size: int = 500) -> int:
+    """Recompute snapshots for every athlete (caller commits).
+
+    Used when scoring inputs change for everyone, such as a new test
+    definition, and by the deploy backfill.  Returns the number of athletes.
+    """
+    athlete_ids = list(db.exec(select(Athlete.id).order_by(Athlete.id)).all())
+    db.exec(delete(AthleteMetricSnapshot))
+    engine = MetricEngine(db)
+    for start in range(0, len(athlete_ids), batch_size):
+        batch = athlete_ids[start : start + batch_size]
+        athletes = db.exec(select(Athlete).where(Athlete.id.in_(batch))).all()
+        _materialize(db, engine, athletes, SNAPSHOT_METRIC_IDS)
+        db.flush()
+    return len(athlete_ids)
+
+
+def get_metric_scores(
+    db: Session,
+    metric_id: str,
+    athletes: Sequence[Athlete],
+    engine: MetricEngine | None = None,
+) -> dict[int, MetricScore]:
+    """Return one metric for many athletes, reading snapshots where available.
+
+    Athletes without a stored snapshot are scored live in a single batch;
+    reads never write, snapshots are only stored by the write paths.
+    """
+    engine = engine or MetricEngine(db)
+    if metric_id not in SNAPSHOT_METRIC_IDS:
+        return engine.score_athletes(metric_id, athletes)
+
+    athlete_ids = [athlete.id for athlete in athletes if athlete.id is not None]
+    if not athlete_ids:
+        return {}
+    rows = db.exec(
+        select(AthleteMetricSnapshot).where(
+            AthleteMetricSnapshot.metric_id == metric_id,
+            AthleteMetricSnapshot.athlete_id.in_(athlete_ids),
+        )
+    ).all()
+    scores: dict[int, MetricScore] = {}
+    stored_ids: set[int] = set()
+    for row in rows:
+        stored_ids.add(row.athlete_id)
+        if row.score is not None:
+            scores[row.athlete_id] = MetricScore.model_validate(row.score)
+
+    missing = [athlete for athlete in athletes if athlete.id not in stored_ids]
+    if missing:
+        scores.update(engine.score_athletes(metric_id, missing))
+    return scores
+
+
+def rank_metric_scores(
+    db: Session,
+    metric_id: str,
+    conditions: Sequence[ColumnElement[bool]],
+    limit: int,
+    engine: MetricEngine | None = None,
+) -> list[tuple[Athlete, MetricScore]]:
+    """Best ``limit`` athletes matching ``conditions`` for one metric, best first.
+
+    Snapshot-backed metrics are ranked by the database with a single ordered,
+    limited join.  Athletes still missing a snapshot are scored live and
+    merged in without being persisted.
+    """
+    engine = engine or MetricEngine(db)
+    definition = get_metric_by_id(metric_id)
+    descending = definition.direction != "lower_is_better"
+    if metric_id not in SNAPSHOT_METRIC_IDS:
+        athletes = db.exec(select(Athlete).where(*conditions)).all()
+        return top_scores(
+            athletes,
+            engine.score_athletes(metric_id, athletes),
+            limit,
+            descending=descending,
+        )
+
+    value = AthleteMetricSnapshot.value
+    order = value.desc() if descending else value.asc()
+    rows = db.exec(
+        select(Athlete, AthleteMetricSnapshot.score)
+        .join(
+            AthleteMetricSnapshot,
+            (AthleteMetricSnapshot.athlete_id == Athlete.id)
+            & (AthleteMetricSnapshot.metric_id == metric_id),
+        )
+        .where(*conditions, value.isnot(None))
+        .order_by(order, Athlete.id)
+        .limit(limit)
+    ).all()
+    ranked = [(athlete, MetricScore.model_validate(score)) for athlete, score in rows]
+
+    has_snapshot = exists().where(
+        AthleteMetricSnapshot.athlete_id == Athlete.id,
+        AthleteMetricSnapshot.metric_id == metric_id,
+    )
+    missing = db.exec(select(Athlete).where(*conditions, ~has_snapshot)).all()
+    if not missing:
+        return ranked
+    scores = {athlete.id: score for athlete, score in ranked}
+    scores.update(engine.score_athletes(metric_id, missing))
+    return top_scores(
+        [athlete for athlete, _ in ranked] + list(missing),
+        scores,
+        limit,
+        descending=descending,
+    )
+
+
+def build_snapshot_metric_response(
+    db: Session,
+    athlete: Athlete,
+    metric_ids: Sequence[str] | None = None,
+) -> AthleteMetricsResponse:
+    """Snapshot-backed equivalent of MetricEngine.build_metric_response."""
+    targets = list(metric_ids or DEFAULT_METRIC_IDS)
+    rows = db.exec(
+        select(AthleteMetricSnapshot).where(
+            AthleteMetricSnapshot.athlete_id == athlete.id
+        )
+    ).all()
+    stored = {row.metric_id: row for row in rows}
+
+    live = [
+        metric_id
+        for metric_id in targets
+        if metric_id not in SNAPSHOT_METRIC_IDS or metric_id not in stored
+    ]
+    computed: dict[str, MetricScore] = {}
+    if live:
+        response = MetricEngine(db).build_metric_response(athlete, live)
+        computed = {score.id: score for score in response.metrics}
+
+    metrics: list[MetricScore] = []
+    for metric_id in targets:
+        row = stored.get(metric_id)
+        if row is not None and metric_id in SNAPSHOT_METRIC_IDS:
+            if row.score is not None:
+                metrics.append(MetricScore.model_validate(row.score))
+        elif metric_id in computed:
+            metrics.append(computed[metric_id])
+    return AthleteMetricsResponse(athlete_id=athlete.id, metrics=metrics)
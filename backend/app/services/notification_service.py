@@ -1,22 +1,63 @@
 """Notification service for coordinating email and push notifications."""
 
 import logging
-from typing import List
+from typing import Iterable, List, Sequence
 from datetime import datetime, timezone
-from fastapi import BackgroundTasks
+from sqlalchemy import insert
 from sqlmodel import Session, select
 
 from app.models.event import Event, Notification
 from app.models.event_participant import EventParticipant, ParticipantStatus
 from app.models.user import User
-from app.services.email_service import email_service
-from app.services.email_queue import enqueue_email
+from app.services.email_queue import enqueue_email, enqueue_emails
 
 logger = logging.getLogger(__name__)
 
 
+def _users_by_id(db: Session, user_ids: Iterable[int]) -> List[User]:
+    """Users for ``user_ids`` in one query, in first-seen id order."""
+    ordered = list(dict.fromkeys(user_ids))
+    if not ordered:
+        return []
+    found = {
+        user.id: user for user in db.exec(select(User).where(User.id.in_(ordered)))
+    }
+    return [found[user_id] for user_id in ordered if user_id in found]
+
+
+def _confirmed_users(db: Session, event: Event) -> List[User]:
+    """Users with a confirmed RSVP for ``event``."""
+    return db.exec(
+        select(User)
+        .join(EventParticipant, EventParticipant.user_id == User.id)
+        .where(
+            EventParticipant.event_id == event.id,
+            EventParticipant.status == ParticipantStatus.CONFIRMED,
+        )
+        .order_by(EventParticipant.id)
+    ).all()
+
+
+def _insert_notifications(
+    db: Session, notifications: Sequence[Notification]
+) -> dict[int, int]:
+    """Insert one notification per user in one statement; ids by user id."""
+    if not notifications:
+        return {}
+    rows = db.exec(
+        insert(Notification)
+        .values([n.model_dump(exclude={"id"}) for n in notifications])
+        .returning(Notification.id, Notification.user_id)
+    ).all()
+    return {user_id: notification_id for notification_id, user_id in rows}
+
+
 class NotificationService:
-    """Service for managing event notifications."""
+    """Service for managing event notifications.
+
+    Emails are recorded in the outbox with their notification and sent by the
+    email worker, which marks the notification sent (or failed).
+    """
 
     async def notify_event_created(
         self,
@@ -25,7 +66,6 @@ class NotificationService:
         invitee_ids: List[int],
         send_email: bool = True,
         send_push: bool = False,
-        background_tasks: BackgroundTasks | None = None,
     ) -> None:
         """Notify invitees about new event."""
         organizer = db.get(User, event.created_by_id)
@@ -33,41 +73,50 @@ class NotificationService:
             logger.error(f"Organizer not found for event {event.id}")
             return
 
-        for user_id in invitee_ids:
-            user = db.get(User, user_id)
-            if not user:
-                continue
-
-            # Send email
-            if send_email and user.email:
-                enqueue_email(
-                    background_tasks,
-                    email_service.send_event_invitation,
-                    user.email,
-                    user.full_name,
-                    event.name,
-                    event.event_date,
-                    event.start_time,
-                    event.location,
-                    event.notes,
-                    organizer.full_name,
-                    user.id,
-                    event.id,
-                    getattr(event, "end_date", None),
-                    getattr(event, "end_time", None),
-                )
-                notification = Notification(
-                    user_id=user_id,
-                    event_id=event.id,
-                    type="event_invite",
-                    channel="email" if not send_push else "both",
-                    title=f"You're invited: {event.name}",
-                    body=f"Event on {event.event_date}"
-                    + (f" at {event.start_time}" if event.start_time else ""),
-                    sent=None,
-                    sent_at=None,
-                )
-                db.add(notification)
+        # Send email
+        if send_email:
+            recipients = [
+                user for user in _users_by_id(db, invitee_ids) if user.email
+            ]
+            notification_ids = _insert_notifications(
+                db,
+                [
+                    Notification(
+                        user_id=user.id,
+                        event_id=event.id,
+                        type="event_invite",
+                        channel="email" if not send_push else "both",
+                        title=f"You're invited: {event.name}",
+                        body=f"Event on {event.event_date}"
+                        + (f" at {event.start_time}" if event.start_time else ""),
+                    )
+                    for user in recipients
+                ],
+            )
+            enqueue_emails(
+                db,
+                "send_event_invitation",
+                [
+                    (
+                        (
+                            user.email,
+                            user.full_name,
+                            event.name,
+                            event.event_date,
+                            event.start_time,
+                            event.location,
+                            event.notes,
+                            organizer.full_name,
+                            user.id,
+                            event.id,
+                            getattr(event, "end_date", None),
+                            getattr(event, "end_time", None),
+                        ),
+                        notification_ids[user.id],
+                    )
+                    for user in recipients
+                ],
+            )
 
         # Mark event as notified
         event.email_sent = send_email
@@ -76,7 +125,7 @@ class NotificationService:
         db.commit()
 
         logger.info(
-            f"Sent event invitations for event {event.id} to {len(invitee_ids)} users"
+            f"Queued event invitations for event {event.id} to {len(invitee_ids)} users"
         )
 
     async def notify_event_updated(
@@ -85,57 +134,55 @@ class NotificationService:
         event: Event,
         changes: str,
         send_notification: bool = True,
-        background_tasks: BackgroundTasks | None = None,
     ) -> None:
         """Notify confirmed participants about event update."""
         if not send_notification:
             return
 
-        # Get confirmed participants
-        stmt = select(EventParticipant).where(
-            EventParticipant.event_id == event.id,
-            EventParticipant.status == ParticipantStatus.CONFIRMED,
+        recipients = [user for user in _confirmed_users(db, event) if user.email]
+        notification_ids = _insert_notifications(
+            db,
+            [
+                Notification(
+                    user_id=user.id,
+                    event_id=event.id,
+                    type="event_update",
+                    channel="email",
+                    title=f"Event Updated: {event.name}",
+                    body=f"Changes: {changes}",
+                )
+                for user in recipients
+            ],
+        )
+        enqueue_emails(
+            db,
+            "send_event_update",
+            [
+                (
+                    (
+                        user.email,
+                        user.full_name,
+                        event.name,
+                        changes,
+                        event.event_date,
+                        event.start_time,
+                        event.location,
+                        getattr(event, "end_date", None),
+                        getattr(event, "end_time", None),
+                        event.id,
+                    ),
+                    notification_ids[user.id],
+                )
+                for user in recipients
+            ],
         )
-        participants = db.exec(stmt).all()
-
-        for participant in participants:
-            user = db.get(User, participant.user_id)
-            if not user or not user.email:
-                continue
-
-            # NOTE: Assumes send_event_update has a similar updated signature
-            enqueue_email(
-                background_tasks,
-                email_service.send_event_update,
-                user.email,
-                user.full_name,
-                event.name,
-                changes,
-                event.event_date,
-                event.start_time,
-                event.location,
-                getattr(event, "end_date", None),
-                getattr(event, "end_time", None),
-                event.id,
-            )
-            notification = Notification(
-                user_id=user.id,
-                event_id=event.id,
-                type="event_update",
-                channel="email",
-                title=f"Event Updated: {event.name}",
-                body=f"Changes: {changes}",
-                sent=None,
-                sent_at=None,
-            )
-            db.add(notification)
 
         event.updated_at = datetime.now(timezone.utc)
         db.add(event)
         db.commit()
 
         logger.info(
-            f"Sent event update for event {event.id} to {len(participants)} confirmed participants"
+            f"Queued event update for event {event.id} to {len(recipients)} confirmed participants"
         )
 
     async def send_event_reminders(
@@ -143,47 +190,48 @@ class NotificationService:
         db: Session,
         event: Event,
         hours_until: int = 24,
-        background_tasks: BackgroundTasks | None = None,
     ) -> int:
-        """Send reminder emails to confirmed participants."""
-        stmt = select(EventParticipant).where(
-            EventParticipant.event_id == event.id,
-            EventParticipant.status == ParticipantStatus.CONFIRMED,
+        """Queue reminder emails to confirmed participants."""
+        recipients = [user for user in _confirmed_users(db, event) if user.email]
+        notification_ids = _insert_notifications(
+            db,
+            [
+                Notification(
+                    user_id=user.id,
+                    event_id=event.id,
+                    type="event_reminder",
+                    channel="email",
+                    title=f"Reminder: {event.name}",
+                    body=f"Starts in {hours_until}h",
+                )
+                for user in recipients
+            ],
+        )
+        enqueue_emails(
+            db,
+            "send_event_reminder",
+            [
+                (
+                    (
+                        user.email,
+                        user.full_name,
+                        event.name,
+                        event.event_date,
+                        event.start_time,
+                        event.location,
+                        hours_until,
+                        getattr(event, "end_date", None),
+                        getattr(event, "end_time", None),
+                        event.id,
+                    ),
+                    notification_ids[user.id],
+                )
+                for user in recipients
+            ],
         )
-        participants = db.exec(stmt).all()
-        sent = 0
-        for participant in participants:
-            user = db.get(User, participant.user_id)
-            if not user or not user.email:
-                continue
-
-            # NOTE: Assumes send_event_reminder has a similar updated signature
-            enqueue_email(
-                background_tasks,
-                email_service.send_event_reminder,
-                user.email,
-                user.full_name,
-                event.name,
-                event.event_date,
-                event.start_time,
-                event.location,
-                hours_until,
-                event.id,
-            )
-            sent += 1
-            notification = Notification(
-                user_id=user.id,
-                event_id=event.id,
-                type="event_reminder",
-                channel="email",
-                title=f"Reminder: {event.name}",
-                body=f"Starts in {hours_until}h",
-                sent=None,
-                sent_at=None,
-            )
-            db.add(notification)
         db.commit()
-        logger.info("Sent %s reminders for event %s", sent, event.id)
+        sent = len(recipients)
+        logger.info("Queued %s reminders for event %s", sent, event.id)
         return sent
 
     async def notify_confirmation_received(
@@ -192,7 +240,6 @@ class NotificationService:
         event: Event,
         participant: EventParticipant,
         status: str,
-        background_tasks: BackgroundTasks | None = None,
     ) -> None:
         """Notify organizer that someone confirmed/declined."""
         organizer = db.get(User, event.created_by_id)
@@ -201,17 +248,6 @@ class NotificationService:
         if not organizer or not organizer.email or not participant_user:
             return
 
-        enqueue_email(
-            background_tasks,
-            email_service.send_confirmation_receipt,
-            organizer.email,
-            organizer.full_name,
-            participant_user.full_name,
-            event.name,
-            status,
-            event.id,
-        )
-
         status_enum = (
             ParticipantStatus(status.upper()) if isinstance(status, str) else status
         )
@@ -226,6 +262,17 @@ class NotificationService:
             sent_at=None,
         )
         db.add(notification)
+        enqueue_email(
+            db,
+            "send_confirmation_receipt",
+            organizer.email,
+            organizer.full_name,
+            participant_user.full_name,
+            event.name,
+            status,
+            event.id,
+            notification=notification,
+        )
         db.commit()
 
         logger.info(
@@ -0,0 +1,242 @@
+"""Peer averages per test and two-year age band, maintained incrementally.
+
+Each result contributes to the band the athlete was in on the session date
+(or on the insert date for unscheduled sessions).  Writers adjust the running
+totals in ``peer_average`` inside their own transaction; readers are served
+from a short-lived in-process cache that writers invalidate after commit.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Iterable
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import delete, func
+from sqlmodel import Session, select
+
+from app.analytics.cohorts import age_band, age_on
+from app.db.upsert import conflict_insert
+from app.models.assessment_session import AssessmentSession
+from app.models.athlete import Athlete
+from app.models.peer_average import PeerAverage
+from app.models.session_result import SessionResult
+
+PEER_AVERAGE_CACHE_TTL_SECONDS = 300
+
+PeerKey = tuple[int, int]
+Deltas = dict[PeerKey, list[float]]
+
+
+def _result_band(birth_date: date | None, scheduled_at: datetime | None) -> int | None:
+    return age_band(
+        age_on(birth_date, scheduled_at.date() if scheduled_at is not None else None)
+    )
+
+
+def _apply_deltas(db: Session, deltas: Deltas) -> None:
+    """Add ``[sum, count]`` deltas to the running totals in one statement."""
+    if not deltas:
+        return
+    now = datetime.now(timezone.utc)
+    table = PeerAverage.__table__
+    insert = conflict_insert(db, table)
+    if insert is None:
+        for (test_id, band), (total, count) in deltas.items():
+            row = db.exec(
+                select(PeerAverage).where(
+                    PeerAverage.test_id == test_id, PeerAverage.age_band == band
+                )
+            ).first()
+            if row is None:
+                row = PeerAverage(test_id=test_id, age_band=band)
+            row.value_sum += total
+            row.sample_count += int(count)
+            row.updated_at = now
+            db.add(row)
+        return
+
+    statement = insert.values(
+        [
+            {
+                "test_id": test_id,
+                "age_band": band,
+                "value_sum": total,
+                "sample_count": int(count),
+                "updated_at": now,
+            }
+            for (test_id, band), (total, count) in sorted(deltas.items())
+        ]
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.test_id, table.c.age_band],
+        set_={
+            "value_sum": table.c.value_sum + statement.excluded.value_sum,
+            "sample_count": table.c.sample_count + statement.excluded.sample_count,
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+    db.exec(statement)
+
+
+def record_peer_results(db: Session, results: Iterable[SessionResult]) -> None:
+    """Add freshly inserted results to the peer totals (caller commits)."""
+    results = list(results)
+    if not results:
+        return
+    athlete_ids = {result.athlete_id for result in results}
+    session_ids = {result.session_id for result in results}
+    birth_dates = dict(
+        db.exec(
+            select(Athlete.id, Athlete.birth_date).where(Athlete.id.in_(athlete_ids))
+        ).all()
+    )
+    scheduled = dict(
+        db.exec(
+            select(AssessmentSession.id, AssessmentSession.scheduled_at).where(
+                AssessmentSession.id.in_(session_ids)
+            )
+        ).all()
+    )
+
+    deltas: Deltas = defaultdict(lambda: [0.0, 0])
+    for result in results:
+        band = _result_band(
+            birth_dates.get(result.athlete_id), scheduled.get(result.session_id)
+        )
+        if band is None or result.value is None:
+            continue
+        delta = deltas[(result.test_id, band)]
+        delta[0] += float(result.value)
+        delta[1] += 1
+    _apply_deltas(db, deltas)
+
+
+def _grouped_contributions(db: Session, *conditions) -> Deltas:
+    statement = (
+        select(
+            SessionResult.test_id,
+            Athlete.birth_date,
+            AssessmentSession.scheduled_at,
+            func.sum(SessionResult.value),
+            func.count(SessionResult.value),
+        )
+        .join(Athlete, Athlete.id == SessionResult.athlete_id)
+        .join(AssessmentSession, AssessmentSession.id == SessionResult.session_id)
+        .where(*conditions)
+        .group_by(
+            SessionResult.test_id,
+            SessionResult.athlete_id,
+            SessionResult.session_id,
+            Athlete.birth_date,
+            AssessmentSession.scheduled_at,
+        )
+    )
+    deltas: Deltas = defaultdict(lambda: [0.0, 0])
+    for test_id, birth_date, scheduled_at, total, count in db.exec(statement).all():
+        band = _result_band(birth_date, scheduled_at)
+        if band is None or not count:
+            continue
+        delta = deltas[(test_id, band)]
+        delta[0] += float(total or 0.0)
+        delta[1] += int(count)
+    return deltas
+
+
+def _discard_contributions(db: Session, *conditions) -> None:
+    deltas = _grouped_contributions(db, *conditions)
+    _apply_deltas(db, {key: [-total, -count] for key, (total, count) in deltas.items()})
+
+
+def discard_athlete_peer_results(db: Session, athlete_id: int) -> None:
+    """Subtract an athlete's results before they are deleted (caller commits)."""
+    _discard_contributions(db, SessionResult.athlete_id == athlete_id)
+
+
+def restore_athlete_peer_results(db: Session, athlete_id: int) -> None:
+    """Add an athlete's results back, e.g. after a birth date edit (caller commits)."""
+    _apply_deltas(
+        db, _grouped_contributions(db, SessionResult.athlete_id == athlete_id)
+    )
+
+
+def discard_session_peer_results(db: Session, session_id: int) -> None:
+    """Subtract a session's results before they are deleted (caller commits)."""
+    _discard_contributions(db, SessionResult.session_id == session_id)
+
+
+def rebuild_peer_averages(db: Session, test_ids: Iterable[int] | None = None) -> None:
+    """Recompute the totals from scratch for the tests (all when ``None``)."""
+    conditions = []
+    delete_statement = delete(PeerAverage)
+    if test_ids is not None:
+        wanted = sorted(set(test_ids))
+        if not wanted:
+            return
+        conditions.append(SessionResult.test_id.in_(wanted))
+        delete_statement = delete_statement.where(PeerAverage.test_id.in_(wanted))
+    db.exec(delete_statement)
+    _apply_deltas(db, _grouped_contributions(db, *conditions))
+
+
+_lock = threading.Lock()
+_generation = 0
+_caches: WeakKeyDictionary[object, dict[PeerKey, tuple[float | None, float]]] = (
+    WeakKeyDictionary()
+)
+
+
+def get_peer_averages(
+    db: Session, test_ids: Iterable[int], band: int | None
+) -> dict[int, float]:
+    """Return the average result per test for the age band."""
+    wanted = {test_id for test_id in test_ids if test_id is not None}
+    if not wanted or band is None:
+        return {}
+    bind = db.get_bind()
+    now = time.monotonic()
+    averages: dict[int, float | None] = {}
+    with _lock:
+        generation = _generation
+        cache = _caches.setdefault(bind, {})
+        for test_id in wanted:
+            cached = cache.get((test_id, band))
+            if cached is not None and now - cached[1] < PEER_AVERAGE_CACHE_TTL_SECONDS:
+                averages[test_id] = cached[0]
+
+    missing = wanted.difference(averages)
+    if missing:
+        rows = db.exec(
+            select(PeerAverage).where(
+                PeerAverage.test_id.in_(sorted(missing)), PeerAverage.age_band == band
+            )
+        ).all()
+        loaded: dict[int, float | None] = dict.fromkeys(missing)
+        loaded.update({row.test_id: row.average for row in rows})
+        with _lock:
+            if _generation == generation:
+                cache = _caches.setdefault(bind, {})
+                for test_id, average in loaded.items():
+                    cache[(test_id, band)] = (average, now)
+        averages.update(loaded)
+
+    return {
+        test_id: average for test_id, average in averages.items() if average is not None
+    }
+
+
+def invalidate_peer_averages(test_ids: Iterable[int] | None = None) -> None:
+    """Drop cached averages for the tests (all when ``None``); call after commit."""
+    global _generation
+    wanted = None if test_ids is None else set(test_ids)
+    with _lock:
+        _generation += 1
+        for cache in _caches.values():
+            if wanted is None:
+                cache.clear()
+                continue
+            for key in [key for key in cache if key[0] in wanted]:
+                del cache[key]
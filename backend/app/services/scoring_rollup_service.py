@@ -0,0 +1,181 @@
+"""Per-athlete, per-team match totals backing the scoring leaderboards.
+
+Writers add ``MatchStat`` rows and call :func:`record_match_stats` in the
+same transaction, so the all-time rollup and the daily buckets used by
+windowed leaderboards never disagree with committed stats.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Iterable
+
+from sqlalchemy import case, delete, func
+from sqlalchemy.sql import FromClause
+from sqlmodel import Session, SQLModel, select
+
+from app.analytics.windows import DateRange, bucket_date
+from app.db.upsert import conflict_insert
+from app.models.match_stat import MatchStat
+from app.models.scoring_bucket import ScoringBucket
+from app.models.scoring_rollup import ScoringRollup
+
+ROLLUP_COUNTERS = (
+    "goals",
+    "games_played",
+    "goalless_games",
+    "clean_sheets",
+    "goals_conceded",
+)
+
+# Rows per multi-VALUES upsert, well inside SQLite's bound-parameter limit.
+UPSERT_BATCH_SIZE = 500
+
+# (athlete_id, team_id) for the rollup, plus the day for buckets.
+Deltas = dict[tuple, dict[str, int]]
+
+
+def _stat_deltas(stat: MatchStat) -> dict[str, int]:
+    goalless = not stat.goals and not stat.shootout_goals
+    conceded = int(stat.goals_conceded or 0)
+    return {
+        "goals": int(stat.goals or 0),
+        "games_played": 1,
+        "goalless_games": int(goalless),
+        "clean_sheets": int(goalless and conceded == 0),
+        "goals_conceded": conceded if goalless else 0,
+    }
+
+
+def _key_values(model: type[SQLModel], key: tuple) -> dict:
+    values = {"athlete_id": key[0], "team_id": key[1], "team_key": key[1] or 0}
+    if model is ScoringBucket:
+        values["bucket_date"] = key[2]
+    return values
+
+
+def _apply_deltas(db: Session, model: type[SQLModel], deltas: Deltas) -> None:
+    """Add counter deltas to ``model`` rows with batched upserts."""
+    if not deltas:
+        return
+    now = datetime.now(timezone.utc)
+    table = model.__table__
+    conflict_columns = [table.c.athlete_id, table.c.team_key]
+    if model is ScoringBucket:
+        conflict_columns.append(table.c.bucket_date)
+
+    insert = conflict_insert(db, table)
+    if insert is None:
+        for key, counters in deltas.items():
+            values = _key_values(model, key)
+            row = db.exec(
+                select(model).where(
+                    *(column == values[column.name] for column in conflict_columns)
+                )
+            ).first()
+            if row is None:
+                row = model(**values)
+            for name, value in counters.items():
+                setattr(row, name, getattr(row, name) + value)
+            row.updated_at = now
+            db.add(row)
+        return
+
+    rows = [
+        {**_key_values(model, key), **counters, "updated_at": now}
+        for key, counters in sorted(
+            deltas.items(), key=lambda item: (item[0][0], item[0][1] or 0, *item[0][2:])
+        )
+    ]
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        statement = insert.values(rows[start : start + UPSERT_BATCH_SIZE])
+        statement = statement.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={
+                **{
+                    name: table.c[name] + statement.excluded[name]
+                    for name in ROLLUP_COUNTERS
+                },
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+        db.exec(statement)
+
+
+def _new_deltas() -> Deltas:
+    return defaultdict(lambda: dict.fromkeys(ROLLUP_COUNTERS, 0))
+
+
+def record_match_stats(db: Session, stats: Iterable[MatchStat]) -> None:
+    """Add freshly inserted match stats to the rollup and buckets (caller commits)."""
+    totals = _new_deltas()
+    buckets = _new_deltas()
+    for stat in stats:
+        match_day = bucket_date(stat.match_date)
+        for name, value in _stat_deltas(stat).items():
+            totals[(stat.athlete_id, stat.team_id)][name] += value
+            buckets[(stat.athlete_id, stat.team_id, match_day)][name] += value
+    _apply_deltas(db, ScoringRollup, totals)
+    _apply_deltas(db, ScoringBucket, buckets)
+
+
+def discard_athlete_rollups(db: Session, athlete_id: int) -> None:
+    """Remove an athlete's totals before the athlete is deleted (caller commits)."""
+    db.exec(delete(ScoringRollup).where(ScoringRollup.athlete_id == athlete_id))
+    db.exec(delete(ScoringBucket).where(ScoringBucket.athlete_id == athlete_id))
+
+
+def rebuild_scoring_rollups(db: Session) -> None:
+    """Recompute the rollup and buckets from ``match_stat`` (caller commits)."""
+    goalless = (MatchStat.goals == 0) & (MatchStat.shootout_goals == 0)
+    match_day = func.date(MatchStat.match_date)
+    statement = select(
+        MatchStat.athlete_id,
+        MatchStat.team_id,
+        match_day,
+        func.sum(MatchStat.goals),
+        func.count(MatchStat.id),
+        func.sum(case((goalless, 1), else_=0)),
+        func.sum(case((goalless & (MatchStat.goals_conceded == 0), 1), else_=0)),
+        func.sum(case((goalless, MatchStat.goals_conceded), else_=0)),
+    ).group_by(MatchStat.athlete_id, MatchStat.team_id, match_day)
+
+    db.exec(delete(ScoringRollup))
+    db.exec(delete(ScoringBucket))
+    totals = _new_deltas()
+    buckets: Deltas = {}
+    for athlete_id, team_id, day, *values in db.exec(statement).all():
+        counters = {
+            name: int(value or 0) for name, value in zip(ROLLUP_COUNTERS, values)
+        }
+        buckets[(athlete_id, team_id, bucket_date(day))] = counters
+        for name, value in counters.items():
+            totals[(athlete_id, team_id)][name] += value
+    _apply_deltas(db, ScoringRollup, totals)
+    _apply_deltas(db, ScoringBucket, buckets)
+
+
+def scoring_totals(date_range: DateRange | None = None) -> FromClause:
+    """Totals per athlete and team, all time or summed over the day buckets.
+
+    The result exposes ``athlete_id``, ``team_id`` and the rollup counters.
+    """
+    if date_range is None:
+        return ScoringRollup.__table__
+    start, end = date_range
+    return (
+        select(
+            ScoringBucket.athlete_id,
+            ScoringBucket.team_id,
+            *(
+                func.sum(getattr(ScoringBucket, name)).label(name)
+                for name in ROLLUP_COUNTERS
+            ),
+        )
+        .where(ScoringBucket.bucket_date.between(start, end))
+        .group_by(
+            ScoringBucket.athlete_id, ScoringBucket.team_key, ScoringBucket.team_id
+        )
+        .subquery("scoring_window")
+    )
@@ -0,0 +1,135 @@
+"""Pool of authenticated SMTP connections for the SMTP email fallback.
+
+Opening a connection, STARTTLS and logging in cost several round trips, so
+connections are kept open and reused across messages.  A connection that has
+sat idle is checked with ``NOOP`` before reuse, and a send that finds the
+server gone reconnects and retries once.  Sends block in worker threads, so
+the pool is thread-safe and caps open connections at ``size``.
+"""
+
+from __future__ import annotations
+
+import logging
+import smtplib
+import threading
+import time
+from dataclasses import dataclass, field
+from email.message import Message
+
+logger = logging.getLogger(__name__)
+
+# Connections idle for longer than this are checked with NOOP before reuse.
+NOOP_AFTER_SECONDS = 5.0
+
+# Errors that mean the connection is gone rather than the message rejected.
+_DISCONNECTED = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+@dataclass
+class _Connection:
+    smtp: smtplib.SMTP
+    last_used: float = field(default_factory=time.monotonic)
+    messages: int = 0
+
+
+class SMTPConnectionPool:
+    """At most ``size`` logged-in connections, each reused for ``max_messages``."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        *,
+        size: int,
+        idle_seconds: float,
+        max_messages: int,
+        timeout: float,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.idle_seconds = idle_seconds
+        self.max_messages = max_messages
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle: list[_Connection] = []
+
+    def send_message(self, message: Message) -> None:
+        """Send over a pooled connection, reconnecting once if it dropped."""
+        with self._slots:
+            connection = self._checkout()
+            try:
+                connection.smtp.send_message(message)
+            except _DISCONNECTED:
+                self._discard(connection)
+                logger.info("smtp_reconnect", extra={"host": self.host})
+                connection = self._connect()
+                try:
+                    connection.smtp.send_message(message)
+                except BaseException:
+                    self._discard(connection)
+                    raise
+            except BaseException:
+                self._discard(connection)
+                raise
+            self._checkin(connection)
+
+    def close(self) -> None:
+        """Close idle connections; the pool reconnects on the next send."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            self._discard(connection)
+
+    def _checkout(self) -> _Connection:
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                return self._connect()
+            idle_for = now - connection.last_used
+            if idle_for > self.idle_seconds:
+                self._discard(connection)
+            elif idle_for > NOOP_AFTER_SECONDS and not self._alive(connection):
+                self._discard(connection)
+            else:
+                return connection
+
+    def _checkin(self, connection: _Connection) -> None:
+        connection.messages += 1
+        connection.last_used = time.monotonic()
+        if connection.messages >= self.max_messages:
+            self._discard(connection)
+            return
+        with self._lock:
+            self._idle.append(connection)
+
+    def _connect(self) -> _Connection:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.port == 587:
+                smtp.starttls()
+            smtp.login(self.user, self.password)
+        except BaseException:
+            smtp.close()
+            raise
+        return _Connection(smtp)
+
+    @staticmethod
+    def _alive(connection: _Connection) -> bool:
+        try:
+            return connection.smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def _discard(connection: _Connection) -> None:
+        try:
+            connection.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.smtp.close()
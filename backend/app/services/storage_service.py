@@ -3,9 +3,8 @@ import mimetypes
 import uuid
 from typing import Optional
 
-import httpx
-
 from app.core.config import settings
+from app.core.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -45,8 +44,10 @@ class StorageService:
             "x-upsert": "true",
         }
 
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.post(url, content=data, headers=headers)
+        # Uploads get a longer timeout than the client default.
+        resp = await get_http_client().post(
+            url, content=data, headers=headers, timeout=15
+        )
         if resp.status_code >= 300:
             raise StorageServiceError(
                 f"Failed to upload to Supabase Storage ({resp.status_code}): {resp.text}"
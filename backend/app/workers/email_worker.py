@@ -0,0 +1,76 @@
+"""Email outbox worker.
+
+Run alongside the API with ``python -m app.workers.email_worker``; several
+workers may share one database since claims are leased per row.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.http_client import close_http_client
+from app.core.observability import configure_logging
+from app.db.session import engine
+from app.services.email_queue import drain_outbox
+from app.services.email_service import email_service
+
+logger = logging.getLogger(__name__)
+
+
+async def run(*, concurrency: int, batch_size: int, once: bool = False) -> None:
+    """Drain the outbox, polling while it is empty (or stop when ``once``)."""
+    logger.info(
+        "email_worker_started",
+        extra={"concurrency": concurrency, "batch_size": batch_size},
+    )
+    try:
+        await _poll(concurrency=concurrency, batch_size=batch_size, once=once)
+    finally:
+        await close_http_client()
+        email_service.close()
+
+
+async def _poll(*, concurrency: int, batch_size: int, once: bool) -> None:
+    while True:
+        try:
+            with Session(engine) as db:
+                processed = await drain_outbox(
+                    db, concurrency=concurrency, batch_size=batch_size
+                )
+        except Exception:
+            if once:
+                raise
+            logger.exception("email_worker_batch_failed")
+            processed = 0
+        if processed:
+            continue
+        if once:
+            return
+        await asyncio.sleep(settings.EMAIL_WORKER_POLL_SECONDS)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Send queued emails.")
+    parser.add_argument(
+        "--concurrency", type=int, default=settings.EMAIL_WORKER_CONCURRENCY
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.EMAIL_WORKER_BATCH_SIZE
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="Exit once the outbox is empty."
+    )
+    args = parser.parse_args()
+    configure_logging(settings.LOG_LEVEL)
+    asyncio.run(
+        run(concurrency=args.concurrency, batch_size=args.batch_size, once=args.once)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,9 @@ from app.db.session import engine  # noqa: E402
 from app.models.athlete import Athlete  # noqa: E402
 from app.models.event import Event, EventParticipant, ParticipantStatus  # noqa: E402
 from app.models.event_team_link import EventTeamLink  # noqa: E402
+from app.services.event_visibility_service import (  # noqa: E402
+    rebuild_event_visibility,
+)
 
 
 def gather_event_team_ids(session: Session, event_id: int) -> set[int]:
@@ -104,6 +107,7 @@ def run_backfill(attach_roster: bool) -> dict[str, int]:
                 )
                 stats["participants_added"] += added_participants
             session.add(event)
+        rebuild_event_visibility(session)
         session.commit()
     return stats
 
@@ -0,0 +1,42 @@
+"""Rebuild stored athlete metric snapshots; run on deploy after migrations."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from sqlmodel import Session
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from app.db.session import engine  # noqa: E402
+from app.services.metric_snapshot_service import (  # noqa: E402
+    rebuild_metric_snapshots,
+)
+
+
+def run_backfill(batch_size: int) -> int:
+    with Session(engine) as session:
+        athletes = rebuild_metric_snapshots(session, batch_size=batch_size)
+        session.commit()
+    return athletes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill athlete metric snapshots.")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Athletes scored per aggregation pass.",
+    )
+    args = parser.parse_args()
+    athletes = run_backfill(batch_size=args.batch_size)
+    print(f"Backfill complete: {athletes} athletes")
+
+
+if __name__ == "__main__":
+    main()
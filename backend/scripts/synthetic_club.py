@@ -0,0 +1,362 @@
+"""
+Synthetic club generator used by the analytics benchmarks.
+
+Creates a reproducible club (teams, athletes, combine sessions with realistic
+SessionResult histories, match stats and combine metrics) directly through
+bulk inserts, so 100k athletes can be seeded in minutes rather than hours.
+
+Usage:
+  python -m scripts.synthetic_club --athletes 10k --database-url sqlite:///./data/bench.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Iterable, Sequence
+
+from sqlalchemy import Engine, insert
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.core.security import get_password_hash
+from app.models.assessment_session import AssessmentSession
+from app.models.athlete import Athlete, AthleteGender, AthleteStatus
+from app.models.match_stat import MatchStat
+from app.models.session_result import SessionResult
+from app.models.team import Team
+from app.models.team_combine_metric import CombineMetricStatus, TeamCombineMetric
+from app.models.test_definition import TestDefinition
+from app.models.user import User, UserRole
+from app.services.combine_bucket_service import rebuild_combine_buckets
+from app.services.metric_snapshot_service import rebuild_metric_snapshots
+from app.services.peer_average_service import rebuild_peer_averages
+from app.services.scoring_rollup_service import rebuild_scoring_rollups
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+INSERT_CHUNK_SIZE = 5_000
+ATHLETES_PER_TEAM = 22
+ATHLETES_PER_SESSION = 60
+TESTS_PER_VISIT = 12
+AGE_CATEGORIES = ("U12", "U13", "U14", "U15", "U16", "U19")
+POSITIONS = ("Goalkeeper", "Defender", "Midfielder", "Forward")
+
+ValueFn = Callable[[random.Random, float], float]
+
+
+@dataclass(frozen=True)
+class SyntheticTest:
+    name: str
+    category: str
+    unit: str
+    target_direction: str
+    value: ValueFn
+
+
+def _normal(mean: float, spread: float, improves_with_age: float, digits: int = 2):
+    """Value centred on ``mean`` that shifts by ``improves_with_age`` per year."""
+
+    def sample(rng: random.Random, age: float) -> float:
+        centre = mean + improves_with_age * (age - 14)
+        return round(max(rng.gauss(centre, spread), 0.01), digits)
+
+    return sample
+
+
+def _hits(probability: float) -> ValueFn:
+    def sample(rng: random.Random, age: float) -> float:
+        return float(sum(rng.random() < probability for _ in range(5)))
+
+    return sample
+
+
+# Names match METRIC_DEFINITIONS so every metric has data to compute.
+SYNTHETIC_TESTS: tuple[SyntheticTest, ...] = (
+    SyntheticTest("Height", "General Info", "cm", "higher", _normal(165, 9, 4, 1)),
+    SyntheticTest("Body Weight", "General Info", "kg", "lower", _normal(55, 8, 4, 1)),
+    SyntheticTest(
+        "Resting Heart Rate (Seated)", "General Info", "bpm", "lower", _normal(68, 7, -1, 0)
+    ),
+    SyntheticTest("5 m Sprint", "Physical", "s", "lower", _normal(1.15, 0.08, -0.02)),
+    SyntheticTest("10 m Sprint", "Physical", "s", "lower", _normal(1.95, 0.12, -0.03)),
+    SyntheticTest("15 m Sprint", "Physical", "s", "lower", _normal(2.7, 0.15, -0.04)),
+    SyntheticTest("30 m Sprint", "Physical", "s", "lower", _normal(4.7, 0.25, -0.07)),
+    SyntheticTest("35 m Sprint", "Physical", "s", "lower", _normal(5.3, 0.3, -0.08)),
+    SyntheticTest("40 m Sprint", "Physical", "s", "lower", _normal(5.9, 0.3, -0.09)),
+    SyntheticTest(
+        "Vertical Jump (No Run-Up)", "Physical", "cm", "higher", _normal(38, 6, 2, 1)
+    ),
+    SyntheticTest(
+        "Vertical Jump (Run-Up)", "Physical", "cm", "higher", _normal(44, 7, 2, 1)
+    ),
+    SyntheticTest(
+        "Standing Long Jump (inches)", "Physical", "in", "higher", _normal(75, 8, 2, 1)
+    ),
+    SyntheticTest("T-Drill", "Physical", "s", "lower", _normal(10.8, 0.7, -0.15)),
+    SyntheticTest(
+        "Illinois Test (No Ball)", "Physical", "s", "lower", _normal(17.5, 1.0, -0.2)
+    ),
+    SyntheticTest("Plank (Max Time)", "Physical", "s", "higher", _normal(95, 30, 8, 0)),
+    SyntheticTest("Sit-Ups (1 min)", "Physical", "reps", "higher", _normal(38, 7, 1, 0)),
+    SyntheticTest("Beep Test", "Physical", "level", "higher", _normal(9.5, 1.5, 0.4, 1)),
+    SyntheticTest(
+        "Shot Power (Run-Up, Right Foot)", "Technical", "km/h", "higher", _normal(82, 10, 4, 1)
+    ),
+    SyntheticTest(
+        "Shot Power (Run-Up, Left Foot)", "Technical", "km/h", "higher", _normal(70, 12, 4, 1)
+    ),
+    SyntheticTest(
+        "10 m Accuracy Kick (Right Foot, 5 attempts)", "Technical", "", "higher", _hits(0.7)
+    ),
+    SyntheticTest(
+        "35 m Driven Shot (Right Foot, 5 attempts)", "Technical", "", "higher", _hits(0.35)
+    ),
+    SyntheticTest(
+        "35 m Driven Shot (Left Foot, 5 attempts)", "Technical", "", "higher", _hits(0.25)
+    ),
+)
+
+
+def parse_count(raw: str) -> int:
+    """Parse sizes such as ``1000``, ``10k`` or ``0.1m``."""
+    text = raw.strip().lower().replace("_", "")
+    multiplier = 1
+    if text.endswith("k"):
+        multiplier, text = 1_000, text[:-1]
+    elif text.endswith("m"):
+        multiplier, text = 1_000_000, text[:-1]
+    return int(float(text) * multiplier)
+
+
+def _chunks(rows: Sequence[dict], size: int = INSERT_CHUNK_SIZE) -> Iterable[Sequence[dict]]:
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def _bulk_insert(session: Session, model: type[SQLModel], rows: Sequence[dict]) -> None:
+    for chunk in _chunks(rows):
+        session.execute(insert(model.__table__), list(chunk))
+
+
+def _inserted_ids(session: Session, model: type[SQLModel], count: int) -> list[int]:
+    ids = session.exec(select(model.id).order_by(model.id.desc()).limit(count)).all()
+    return sorted(ids)
+
+
+def generate_club(
+    engine: Engine,
+    athletes: int,
+    *,
+    sessions_per_athlete: int = 3,
+    matches_per_team: int = 10,
+    seed: int = 1234,
+) -> dict[str, int]:
+    """Seed a synthetic club into an empty schema and return row counts."""
+    rng = random.Random(seed)
+    SQLModel.metadata.create_all(engine)
+    started = time.perf_counter()
+    now = datetime.now(timezone.utc)
+    today = date.today()
+    counts: dict[str, int] = {}
+
+    with Session(engine) as session:
+        admin = User(
+            email="bench.admin@statcat.local",
+            hashed_password=get_password_hash("Bench123!"),
+            full_name="Benchmark Admin",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        session.add(admin)
+        session.flush()
+        admin_id = admin.id
+
+        _bulk_insert(
+            session,
+            TestDefinition,
+            [
+                {
+                    "name": test.name,
+                    "category": test.category,
+                    "unit": test.unit,
+                    "target_direction": test.target_direction,
+                }
+                for test in SYNTHETIC_TESTS
+            ],
+        )
+        test_ids = _inserted_ids(session, TestDefinition, len(SYNTHETIC_TESTS))
+
+        team_count = max(athletes // ATHLETES_PER_TEAM, 1)
+        _bulk_insert(
+            session,
+            Team,
+            [
+                {
+                    "name": f"Bench FC {index:05d}",
+                    "age_category": AGE_CATEGORIES[index % len(AGE_CATEGORIES)],
+                    "created_by_id": admin_id,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for index in range(team_count)
+            ],
+        )
+        team_ids = _inserted_ids(session, Team, team_count)
+        counts["teams"] = team_count
+
+        athlete_rows: list[dict] = []
+        for index in range(athletes):
+            age = rng.randint(10, 19)
+            athlete_rows.append(
+                {
+                    "first_name": f"Bench{index:06d}",
+                    "last_name": rng.choice(("Silva", "Smith", "Garcia", "Okafor", "Kim")),
+                    "email": f"bench.athlete{index:06d}@statcat.local",
+                    "birth_date": date(today.year - age, rng.randint(1, 12), rng.randint(1, 28)),
+                    "gender": rng.choice(list(AthleteGender)).value,
+                    "status": AthleteStatus.active.value,
+                    "team_id": team_ids[index % team_count],
+                    "primary_position": rng.choice(POSITIONS),
+                    "club_affiliation": "Bench Club",
+                }
+            )
+        _bulk_insert(session, Athlete, athlete_rows)
+        athlete_ids = _inserted_ids(session, Athlete, athletes)
+        ages = {
+            athlete_id: today.year - row["birth_date"].year
+            for athlete_id, row in zip(athlete_ids, athlete_rows)
+        }
+        counts["athletes"] = athletes
+
+        session_count = max(athletes * sessions_per_athlete // ATHLETES_PER_SESSION, 4)
+        first_day = now - timedelta(days=3 * 365)
+        _bulk_insert(
+            session,
+            AssessmentSession,
+            [
+                {
+                    "name": f"Combine Day {index:05d}",
+                    "location": "Bench Stadium",
+                    "scheduled_at": (
+                        first_day + timedelta(days=index * 3 * 365 // session_count)
+                    ).replace(tzinfo=None),
+                }
+                for index in range(session_count)
+            ],
+        )
+        session_ids = _inserted_ids(session, AssessmentSession, session_count)
+        counts["sessions"] = session_count
+
+        tests = list(zip(test_ids, SYNTHETIC_TESTS))
+        results = 0
+        pending: list[dict] = []
+        for athlete_id in athlete_ids:
+            for session_id in rng.sample(session_ids, min(sessions_per_athlete, session_count)):
+                for test_id, test in rng.sample(tests, TESTS_PER_VISIT):
+                    for _ in range(rng.randint(1, 3)):
+                        pending.append(
+                            {
+                                "session_id": session_id,
+                                "athlete_id": athlete_id,
+                                "test_id": test_id,
+                                "value": test.value(rng, ages[athlete_id]),
+                                "unit": test.unit or None,
+                                "recorded_at": now,
+                            }
+                        )
+            if len(pending) >= INSERT_CHUNK_SIZE * 4:
+                _bulk_insert(session, SessionResult, pending)
+                results += len(pending)
+                pending = []
+        _bulk_insert(session, SessionResult, pending)
+        counts["results"] = results + len(pending)
+        # Fill the read-side tables the way the API keeps them in production.
+        rebuild_peer_averages(session)
+        rebuild_metric_snapshots(session)
+
+        roster: dict[int, list[int]] = {}
+        for athlete_id, row in zip(athlete_ids, athlete_rows):
+            roster.setdefault(row["team_id"], []).append(athlete_id)
+        stats: list[dict] = []
+        for team_id, members in roster.items():
+            for match in range(matches_per_team):
+                match_date = now - timedelta(days=7 * match)
+                keeper, *field_players = rng.sample(members, min(len(members), 11))
+                stats.append(
+                    {
+                        "athlete_id": keeper,
+                        "team_id": team_id,
+                        "match_date": match_date,
+                        "goals": 0,
+                        "goals_conceded": rng.choice((0, 0, 1, 1, 2, 3)),
+                    }
+                )
+                for athlete_id in field_players:
+                    stats.append(
+                        {
+                            "athlete_id": athlete_id,
+                            "team_id": team_id,
+                            "match_date": match_date,
+                            "goals": rng.choice((0, 0, 0, 0, 1, 1, 2)),
+                            "goals_conceded": 0,
+                        }
+                    )
+        _bulk_insert(session, MatchStat, stats)
+        rebuild_scoring_rollups(session)
+        counts["match_stats"] = len(stats)
+
+        combine_rows = [
+            {
+                "team_id": athlete_rows[position]["team_id"],
+                "athlete_id": athlete_id,
+                "status": CombineMetricStatus.APPROVED.value,
+                "recorded_by_id": admin_id,
+                "recorded_at": now - timedelta(days=rng.randrange(365)),
+                "split_10m_s": round(rng.gauss(1.95, 0.12), 2),
+                "split_35m_s": round(rng.gauss(5.3, 0.3), 2),
+                "jump_cm": round(rng.gauss(40, 6), 1),
+                "yoyo_distance_m": float(rng.randrange(800, 2400, 40)),
+            }
+            for position, athlete_id in enumerate(athlete_ids)
+            if rng.random() < 0.3
+        ]
+        _bulk_insert(session, TeamCombineMetric, combine_rows)
+        rebuild_combine_buckets(session)
+        counts["combine_metrics"] = len(combine_rows)
+
+        session.commit()
+
+    logger.info(
+        "Seeded synthetic club in %.1fs: %s",
+        time.perf_counter() - started,
+        ", ".join(f"{key}={value}" for key, value in counts.items()),
+    )
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed a synthetic benchmark club.")
+    parser.add_argument("--athletes", default="1k", help="Club size, e.g. 1k, 10k, 100k")
+    parser.add_argument("--database-url", required=True, help="Target database URL")
+    parser.add_argument("--sessions-per-athlete", type=int, default=3)
+    parser.add_argument("--matches-per-team", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    generate_club(
+        engine,
+        parse_count(args.athletes),
+        sessions_per_athlete=args.sessions_per_athlete,
+        matches_per_team=args.matches_per_team,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
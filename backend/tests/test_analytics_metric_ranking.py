@@ -0,0 +1,314 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.analytics.metric_definitions import get_metric_by_id
+from app.analytics.metric_engine import (
+    AGE_CATEGORY_BOUNDS,
+    MetricEngine,
+    athlete_filter_clauses,
+    filter_athletes,
+    top_scores,
+)
+from app.api.deps import get_current_active_user, get_session
+from app.main import app
+from app.models.assessment_session import AssessmentSession
+from app.models.athlete import Athlete, AthleteGender, AthleteStatus
+from app.models.session_result import SessionResult
+from app.models.test_definition import TestDefinition
+from app.models.user import User, UserRole
+from app.schemas.analytics import MetricScore
+
+
+@pytest.fixture
+def test_engine(tmp_path):
+    db_path = tmp_path / "metric_ranking.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(test_engine):
+    def _session_override():
+        with Session(test_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _session_override
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _user_override(engine, user_id: int):
+    def _dep():
+        with Session(engine) as session:
+            return session.get(User, user_id)
+
+    return _dep
+
+
+def _seed_sprint_results(session: Session, sprint_times: list[list[float]]) -> None:
+    """Create one athlete per entry in ``sprint_times`` with their 10m sprint trials."""
+    test = TestDefinition(
+        name="10m Sprint", category="Speed", unit="s", target_direction="lower"
+    )
+    assessment = AssessmentSession(name="Combine Day")
+    session.add_all([test, assessment])
+    session.commit()
+    session.refresh(test)
+    session.refresh(assessment)
+
+    for index, times in enumerate(sprint_times):
+        athlete = Athlete(
+            first_name=f"Runner{index}",
+            last_name="Tester",
+            email=f"runner{index}@example.com",
+            birth_date=date(2010, 1, 1),
+            gender=AthleteGender.male,
+            primary_position="Forward",
+            status=AthleteStatus.active,
+        )
+        session.add(athlete)
+        session.flush()
+        for value in times:
+            session.add(
+                SessionResult(
+                    session_id=assessment.id,
+                    athlete_id=athlete.id,
+                    test_id=test.id,
+                    value=value,
+                    unit="s",
+                )
+            )
+    session.commit()
+
+
+def _count_statements(engine, fn):
+    statements: list[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, *args):  # noqa: ANN001
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+    return result, statements
+
+
+def test_metric_ranking_orders_by_best_trial(test_engine, client):
+    with Session(test_engine) as session:
+        _seed_sprint_results(session, [[2.0, 1.9], [1.8, 2.2], [2.5]])
+        admin = User(
+            email="admin@example.com",
+            hashed_password="x",
+            full_name="Admin",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        session.add(admin)
+        session.commit()
+        session.refresh(admin)
+        admin_id = admin.id
+
+    app.dependency_overrides[get_current_active_user] = _user_override(
+        test_engine, admin_id
+    )
+
+    response = client.get("/api/v1/analytics/rankings/metrics/short_acceleration")
+    assert response.status_code == 200
+    body = response.json()
+    assert [entry["full_name"] for entry in body["entries"]] == [
+        "Runner1 Tester",
+        "Runner0 Tester",
+        "Runner2 Tester",
+    ]
+    assert body["entries"][0]["value"] == round(10.0 / 1.8, 2)
+    assert body["entries"][0]["unit"] == "m/s"
+
+
+def test_athlete_filter_clauses_match_filter_athletes(test_engine):
+    today = date.today()
+    with Session(test_engine) as session:
+        index = 0
+        for years in range(10, 22):
+            # Birthdays either side of an age boundary.
+            anniversary = today.replace(
+                year=today.year - years, day=min(today.day, 28)
+            )
+            for birth_date in (anniversary, anniversary + timedelta(days=1)):
+                for gender in (AthleteGender.male, AthleteGender.female, None):
+                    session.add(
+                        Athlete(
+                            first_name=f"Athlete{index}",
+                            last_name="Tester",
+                            email=f"athlete{index}@example.com",
+                            birth_date=birth_date,
+                            gender=gender,
+                            primary_position="Forward",
+                        )
+                    )
+                    index += 1
+        session.commit()
+
+        athletes = session.exec(select(Athlete)).all()
+        for age_category in (None, "U99", *AGE_CATEGORY_BOUNDS):
+            for gender in (None, "boys", "F"):
+                expected = {
+                    athlete.id
+                    for athlete in filter_athletes(
+                        athletes, age_category=age_category, gender=gender
+                    )
+                }
+                clauses = athlete_filter_clauses(
+                    age_category=age_category, gender=gender, today=today
+                )
+                selected = set(session.exec(select(Athlete.id).where(*clauses)).all())
+                assert selected == expected, (age_category, gender)
+
+
+def test_metric_ranking_filters_athletes_in_sql(test_engine, client):
+    with Session(test_engine) as session:
+        _seed_sprint_results(session, [[2.0], [1.8], [2.2], [1.7]])
+        runners = session.exec(select(Athlete).order_by(Athlete.id)).all()
+        runners[1].gender = AthleteGender.female
+        runners[2].gender = AthleteGender.female
+        runners[2].birth_date = date(date.today().year - 14, 1, 1)
+        runners[3].status = AthleteStatus.inactive
+        admin = User(
+            email="admin@example.com",
+            hashed_password="x",
+            full_name="Admin",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        session.add_all([*runners, admin])
+        session.commit()
+        app.dependency_overrides[get_current_active_user] = _user_override(
+            test_engine, admin.id
+        )
+
+    response = client.get(
+        "/api/v1/analytics/rankings/metrics/short_acceleration",
+        params={"gender": "female"},
+    )
+    assert [entry["full_name"] for entry in response.json()["entries"]] == [
+        "Runner1 Tester",
+        "Runner2 Tester",
+    ]
+
+    response = client.get(
+        "/api/v1/analytics/rankings/metrics/short_acceleration",
+        params={"gender": "female", "age_category": "U14", "limit": 1},
+    )
+    assert [entry["full_name"] for entry in response.json()["entries"]] == [
+        "Runner2 Tester"
+    ]
+
+
+def test_top_scores_matches_full_sort():
+    athletes = [Athlete(id=index, first_name="A", last_name="B") for index in range(12)]
+    values = [3.0, 1.0, None, 2.0, 1.0, 5.0, 2.0, 4.0, 1.0, 3.0, None, 0.5]
+    scores = {
+        athlete.id: MetricScore(
+            id="m",
+            name="m",
+            category="c",
+            description="",
+            direction="mixed",
+            value=value,
+        )
+        for athlete, value in zip(athletes, values)
+        if athlete.id != 6
+    }
+    scored = [
+        athlete
+        for athlete in athletes
+        if athlete.id in scores and scores[athlete.id].value is not None
+    ]
+    for descending in (False, True):
+        expected = sorted(
+            scored, key=lambda athlete: scores[athlete.id].value, reverse=descending
+        )
+        for limit in (1, 3, 5, 50):
+            winners = top_scores(athletes, scores, limit, descending=descending)
+            assert [athlete.id for athlete, _ in winners] == [
+                athlete.id for athlete in expected[:limit]
+            ]
+
+
+def test_metric_ranking_query_count_is_independent_of_cohort_size(test_engine):
+    with Session(test_engine) as session:
+        _seed_sprint_results(session, [[2.0 + index / 100] for index in range(40)])
+
+    with Session(test_engine) as session:
+        athletes = session.exec(select(Athlete).order_by(Athlete.id)).all()
+        engine = MetricEngine(session)
+
+        ranking, statements = _count_statements(
+            test_engine,
+            lambda: engine.metric_ranking(
+                "short_acceleration", athletes, limit=5
+            ),
+        )
+
+    assert len(ranking.entries) == 5
+    assert ranking.entries[0].full_name == "Runner0 Tester"
+    assert len(statements) == 1
+
+
+def test_best_values_are_aggregated_per_test_direction(test_engine):
+    with Session(test_engine) as session:
+        sprint = TestDefinition(
+            name="10m Sprint", category="Speed", unit="s", target_direction="lower"
+        )
+        jump = TestDefinition(
+            name="Vertical Jump (no run-up)",
+            category="Power",
+            unit="cm",
+            target_direction="higher",
+        )
+        assessment = AssessmentSession(name="Combine Day")
+        athlete = Athlete(
+            first_name="Mixed",
+            last_name="Tester",
+            email="mixed@example.com",
+            birth_date=date(2010, 1, 1),
+            primary_position="Forward",
+        )
+        session.add_all([sprint, jump, assessment, athlete])
+        session.commit()
+        for test, values in ((sprint, [2.1, 1.95, 2.3]), (jump, [38.0, 44.5, 41.0])):
+            for value in values:
+                session.add(
+                    SessionResult(
+                        session_id=assessment.id,
+                        athlete_id=athlete.id,
+                        test_id=test.id,
+                        value=value,
+                    )
+                )
+        session.commit()
+        athlete_id, sprint_id, jump_id = athlete.id, sprint.id, jump.id
+
+        engine = MetricEngine(session)
+        metric = get_metric_by_id("anthropometrics_profile")
+        tests = engine._resolve_tests(["10m Sprint", "Vertical Jump (no run-up)"])
+        best, statements = _count_statements(
+            test_engine,
+            lambda: engine._fetch_best_values(metric, [athlete_id], tests),
+        )
+
+        assert best == {athlete_id: {sprint_id: 1.95, jump_id: 44.5}}
+        assert len(statements) == 1
+        assert "GROUP BY" in statements[0]
+
+        response = engine.build_metric_response(athlete, ["lower_body_power"])
+        assert response.metrics[0].value == 44.5
@@ -0,0 +1,206 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.analytics.cohorts import CohortDistribution
+from app.api.deps import get_current_active_user, get_session
+from app.main import app
+from app.models.assessment_session import AssessmentSession
+from app.models.athlete import Athlete, AthleteGender
+from app.models.test_definition import TestDefinition
+from app.models.user import User, UserRole
+
+
+@pytest.fixture
+def test_engine(tmp_path):
+    db_path = tmp_path / "percentiles.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(test_engine):
+    def _session_override():
+        with Session(test_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _session_override
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _user_override(engine, user_id: int):
+    def _dep():
+        with Session(engine) as session:
+            return session.get(User, user_id)
+
+    return _dep
+
+
+def test_percentile_rank_uses_midpoint_for_ties():
+    cohort = CohortDistribution.from_values([1.0, 2.0, 2.0, 3.0])
+    assert cohort.percentile_rank(2.0) == 50.0
+    assert cohort.percentile_rank(0.5) == 0.0
+    assert cohort.percentile_rank(3.0) == 87.5
+    assert cohort.z_score(cohort.mean) == 0.0
+
+
+def test_athlete_percentiles_against_cohort(test_engine, client):
+    with Session(test_engine) as session:
+        sprint = TestDefinition(
+            name="10m Sprint", category="Speed", unit="s", target_direction="lower"
+        )
+        assessment = AssessmentSession(name="Combine Day")
+        admin = User(
+            email="admin@example.com",
+            hashed_password="x",
+            full_name="Admin",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        athletes = [
+            Athlete(
+                first_name=f"Runner{index}",
+                last_name="Tester",
+                email=f"runner{index}@example.com",
+                birth_date=date(2010, 1, 1),
+                gender=gender,
+                primary_position="Forward",
+            )
+            for index, gender in enumerate(
+                [AthleteGender.male] * 4 + [AthleteGender.female]
+            )
+        ]
+        session.add_all([sprint, assessment, admin, *athletes])
+        session.commit()
+        ids = {
+            "session": assessment.id,
+            "sprint": sprint.id,
+            "athletes": [athlete.id for athlete in athletes],
+        }
+        app.dependency_overrides[get_current_active_user] = _user_override(
+            test_engine, admin.id
+        )
+
+    times = [2.4, 2.2, 2.0, 1.8, 1.5]
+    response = client.post(
+        f"/api/v1/sessions/{ids['session']}/results",
+        json=[
+            {"athlete_id": athlete_id, "test_id": ids["sprint"], "value": value}
+            for athlete_id, value in zip(ids["athletes"], times)
+        ],
+    )
+    assert response.status_code == 200
+
+    fastest_male = ids["athletes"][3]
+    response = client.get(f"/api/v1/analytics/athletes/{fastest_male}/percentiles")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["gender"] == "male"
+    [entry] = body["percentiles"]
+    assert entry["value"] == 1.8
+    assert entry["cohort_size"] == 4
+    assert entry["percentile"] == 87.5
+
+    response = client.get(
+        f"/api/v1/analytics/athletes/{fastest_male}/percentiles",
+        params={"by_gender": False},
+    )
+    [entry] = response.json()["percentiles"]
+    assert entry["cohort_size"] == 5
+    assert entry["percentile"] == 70.0
+
+    # A faster trial is reflected immediately after it is recorded.
+    response = client.post(
+        f"/api/v1/sessions/{ids['session']}/results",
+        json=[{"athlete_id": fastest_male, "test_id": ids["sprint"], "value": 1.4}],
+    )
+    assert response.status_code == 200
+    response = client.get(
+        f"/api/v1/analytics/athletes/{fastest_male}/percentiles",
+        params={"by_gender": False},
+    )
+    [entry] = response.json()["percentiles"]
+    assert entry["value"] == 1.4
+    assert entry["percentile"] == 90.0
+    # Lower is better for a sprint, so the fastest runner scores above zero.
+    assert entry["z_score"] > 0
+
+
+def test_cohorts_follow_athlete_edits_and_deletes(test_engine, client):
+    with Session(test_engine) as session:
+        jump = TestDefinition(name="Vertical Jump", category="Power", unit="cm")
+        assessment = AssessmentSession(name="Combine Day")
+        retest = AssessmentSession(name="Retest")
+        admin = User(
+            email="admin@example.com",
+            hashed_password="x",
+            full_name="Admin",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        athletes = [
+            Athlete(
+                first_name=f"Jumper{index}",
+                last_name="Tester",
+                email=f"jumper{index}@example.com",
+                birth_date=date(2010, 1, 1),
+                gender=gender,
+                primary_position="Forward",
+            )
+            for index, gender in enumerate(
+                [AthleteGender.male] * 3 + [AthleteGender.female]
+            )
+        ]
+        session.add_all([jump, assessment, retest, admin, *athletes])
+        session.commit()
+        ids = {
+            "session": assessment.id,
+            "retest": retest.id,
+            "jump": jump.id,
+            "athletes": [athlete.id for athlete in athletes],
+        }
+        app.dependency_overrides[get_current_active_user] = _user_override(
+            test_engine, admin.id
+        )
+
+    def _record(session_id: int, results: list[tuple[int, float]]) -> None:
+        response = client.post(
+            f"/api/v1/sessions/{session_id}/results",
+            json=[
+                {"athlete_id": athlete_id, "test_id": ids["jump"], "value": value}
+                for athlete_id, value in results
+            ],
+        )
+        assert response.status_code == 200
+
+    def _entry() -> dict:
+        response = client.get(f"/api/v1/analytics/athletes/{top}/percentiles")
+        assert response.status_code == 200
+        [entry] = response.json()["percentiles"]
+        return entry
+
+    top = ids["athletes"][2]
+    _record(ids["session"], list(zip(ids["athletes"], [30.0, 40.0, 50.0, 45.0])))
+    assert _entry()["cohort_size"] == 3
+    assert _entry()["percentile"] == pytest.approx(83.3, abs=0.1)
+
+    response = client.patch(
+        f"/api/v1/athletes/{ids['athletes'][3]}", json={"gender": "male"}
+    )
+    assert response.status_code == 200
+    assert _entry()["cohort_size"] == 4
+
+    _record(ids["retest"], [(ids["athletes"][0], 60.0)])
+    assert _entry()["percentile"] == 62.5
+    assert client.delete(f"/api/v1/sessions/{ids['retest']}").status_code == 204
+    assert _entry()["percentile"] == 87.5
+
+    assert client.delete(f"/api/v1/athletes/{ids['athletes'][0]}").status_code == 204
+    assert _entry()["cohort_size"] == 3
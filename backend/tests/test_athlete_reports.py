@@ -0,0 +1,269 @@
+import json
+from datetime import date, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.api.deps import get_current_active_user, get_session
+from app.main import app
+from app.models.assessment_session import AssessmentSession
+from app.models.athlete import Athlete
+from app.models.peer_average import PeerAverage
+from app.models.session_result import SessionResult
+from app.models.test_definition import TestDefinition
+from app.models.user import User, UserRole
+from app.services.peer_average_service import rebuild_peer_averages
+
+
+@pytest.fixture
+def test_engine(tmp_path):
+    db_path = tmp_path / "peer_averages.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(test_engine):
+    def _session_override():
+        with Session(test_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _session_override
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _user_override(engine, user_id: int):
+    def _dep():
+        with Session(engine) as session:
+            return session.get(User, user_id)
+
+    return _dep
+
+
+def _athlete(index: int, birth_date: date) -> Athlete:
+    return Athlete(
+        first_name=f"Peer{index}",
+        last_name="Tester",
+        email=f"peer{index}@example.com",
+        birth_date=birth_date,
+        primary_position="Forward",
+    )
+
+
+def test_report_peer_average_is_maintained_on_insert(test_engine, client):
+    today = date.today()
+    with Session(test_engine) as session:
+        jump = TestDefinition(name="Jump", unit="cm")
+        assessment = AssessmentSession(
+            name="Combine Day", scheduled_at=datetime(today.year, today.month, 1)
+        )
+        admin = User(
+            email="admin@example.com",
+            hashed_password="x",
+            full_name="Admin",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        same_band = [_athlete(index, date(today.year - 14, 1, 1)) for index in range(2)]
+        older = _athlete(9, date(today.year - 18, 1, 1))
+        session.add_all([jump, assessment, admin, *same_band, older])
+        session.commit()
+        ids = {
+            "jump": jump.id,
+            "session": assessment.id,
+            "peers": [athlete.id for athlete in same_band],
+            "older": older.id,
+        }
+        app.dependency_overrides[get_current_active_user] = _user_override(
+            test_engine, admin.id
+        )
+
+    def _post(athlete_id: int, value: float) -> None:
+        response = client.post(
+            f"/api/v1/sessions/{ids['session']}/results",
+            json=[{"athlete_id": athlete_id, "test_id": ids["jump"], "value": value}],
+        )
+        assert response.status_code == 200
+
+    _post(ids["peers"][0], 40.0)
+    _post(ids["older"], 70.0)
+
+    def _peer_average() -> float | None:
+        response = client.get(f"/api/v1/reports/athletes/{ids['peers'][0]}")
+        assert response.status_code == 200
+        [session_report] = response.json()["sessions"]
+        return session_report["results"][0]["peer_average"]
+
+    assert _peer_average() == 40.0
+
+    _post(ids["peers"][1], 50.0)
+    assert _peer_average() == 45.0
+
+    with Session(test_engine) as session:
+        rows = session.exec(select(PeerAverage).order_by(PeerAverage.age_band)).all()
+        incremental = [(row.age_band, row.value_sum, row.sample_count) for row in rows]
+        rebuild_peer_averages(session)
+        session.commit()
+        rows = session.exec(select(PeerAverage).order_by(PeerAverage.age_band)).all()
+        rebuilt = [(row.age_band, row.value_sum, row.sample_count) for row in rows]
+    assert incremental == rebuilt
+
+    response = client.delete(f"/api/v1/athletes/{ids['peers'][1]}")
+    assert response.status_code == 204
+    assert _peer_average() == 40.0
+
+
+def _peer_rows(session: Session) -> list[tuple[int, int, float, int]]:
+    rows = session.exec(
+        select(PeerAverage)
+        .where(PeerAverage.sample_count > 0)
+        .order_by(PeerAverage.test_id, PeerAverage.age_band)
+    ).all()
+    return [(row.test_id, row.age_band, row.value_sum, row.sample_count) for row in rows]
+
+
+def test_peer_totals_follow_birth_date_edits_and_session_deletes(test_engine, client):
+    today = date.today()
+    with Session(test_engine) as session:
+        jump = TestDefinition(name="Jump", unit="cm")
+        sessions = [
+            AssessmentSession(
+                name=f"Combine {index}", scheduled_at=datetime(today.year, 1, 1)
+            )
+            for index in range(2)
+        ]
+        admin = User(
+            email="admin@example.com",
+            hashed_password="x",
+            full_name="Admin",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        athletes = [_athlete(index, date(today.year - 14, 1, 1)) for index in range(2)]
+        session.add_all([jump, *sessions, admin, *athletes])
+        session.commit()
+        jump_id = jump.id
+        session_ids = [assessment.id for assessment in sessions]
+        athlete_ids = [athlete.id for athlete in athletes]
+        app.dependency_overrides[get_current_active_user] = _user_override(
+            test_engine, admin.id
+        )
+
+    for session_id, value in zip(session_ids, (40.0, 60.0)):
+        response = client.post(
+            f"/api/v1/sessions/{session_id}/results",
+            json=[
+                {"athlete_id": athlete_id, "test_id": jump_id, "value": value}
+                for athlete_id in athlete_ids
+            ],
+        )
+        assert response.status_code == 200
+
+    def _assert_matches_rebuild() -> list[tuple[int, int, float, int]]:
+        with Session(test_engine) as session:
+            incremental = _peer_rows(session)
+            rebuild_peer_averages(session)
+            assert _peer_rows(session) == incremental
+            session.rollback()
+        return incremental
+
+    [(_, band, _, count)] = _assert_matches_rebuild()
+    assert count == 4
+
+    response = client.patch(
+        f"/api/v1/athletes/{athlete_ids[1]}",
+        json={"birth_date": date(today.year - 18, 1, 1).isoformat()},
+    )
+    assert response.status_code == 200
+    rows = _assert_matches_rebuild()
+    assert [(row[1], row[3]) for row in rows] == [(band, 2), (band + 4, 2)]
+
+    response = client.delete(f"/api/v1/sessions/{session_ids[1]}")
+    assert response.status_code == 204
+    rows = _assert_matches_rebuild()
+    assert [(row[1], row[2], row[3]) for row in rows] == [
+        (band, 40.0, 1),
+        (band + 4, 40.0, 1),
+    ]
+
+
+def test_report_sessions_are_paginated_and_streamed(test_engine, client):
+    with Session(test_engine) as session:
+        jump = TestDefinition(name="Jump", unit="cm")
+        athlete = _athlete(0, date(2010, 1, 1))
+        admin = User(
+            email="admin@example.com",
+            hashed_password="x",
+            full_name="Admin",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        sessions = [AssessmentSession(name="Unscheduled")] + [
+            AssessmentSession(name=f"Day {day}", scheduled_at=datetime(2024, 3, day))
+            for day in (3, 1, 2)
+        ]
+        session.add_all([jump, athlete, admin, *sessions])
+        session.commit()
+        for index, assessment in enumerate(sessions):
+            session.add(
+                SessionResult(
+                    session_id=assessment.id,
+                    athlete_id=athlete.id,
+                    test_id=jump.id,
+                    value=30.0 + index,
+                )
+            )
+        session.commit()
+        athlete_id = athlete.id
+        app.dependency_overrides[get_current_active_user] = _user_override(
+            test_engine, admin.id
+        )
+
+    # The full report keeps the database's NULL placement (first on SQLite);
+    # pages and streams always put unscheduled sessions last.
+    full = client.get(f"/api/v1/reports/athletes/{athlete_id}")
+    full_sessions = full.json()["sessions"]
+    assert [item["session_name"] for item in full_sessions] == [
+        "Unscheduled",
+        "Day 1",
+        "Day 2",
+        "Day 3",
+    ]
+    expected = ["Day 1", "Day 2", "Day 3", "Unscheduled"]
+
+    names: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(
+            f"/api/v1/reports/athletes/{athlete_id}/sessions", params=params
+        )
+        assert response.status_code == 200
+        body = response.json()
+        names.extend(item["session_name"] for item in body["sessions"])
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert names == expected
+    assert pages == 2
+
+    bad = client.get(
+        f"/api/v1/reports/athletes/{athlete_id}/sessions", params={"cursor": "nope"}
+    )
+    assert bad.status_code == 400
+
+    with client.stream("GET", f"/api/v1/reports/athletes/{athlete_id}/stream") as stream:
+        assert stream.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in stream.iter_lines() if line]
+    assert [line["session_name"] for line in lines] == expected
+    assert lines == full_sessions[1:] + full_sessions[:1]
@@ -1,14 +1,18 @@
+import asyncio
 from datetime import date, datetime
 
 from fastapi.testclient import TestClient
 import pytest
-from sqlmodel import SQLModel, Session, create_engine
+from sqlalchemy import event as sa_event
+from sqlmodel import SQLModel, Session, create_engine, select
 
 from app.api.deps import get_current_active_user, get_session
 from app.main import app
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
 from app.models.event import Event, EventStatus
 from app.models.event_participant import EventParticipant, ParticipantStatus
 from app.models.user import User, UserRole
+from app.services.notification_service import notification_service
 
 
 @pytest.fixture
@@ -41,14 +45,18 @@ def _user_override(engine, user_id: int):
     return _dep
 
 
-def test_create_event_enqueues_bulk_emails(monkeypatch, test_engine, client):
-    sent_calls = []
+def _queued(engine) -> list[tuple[str, str]]:
+    with Session(engine) as session:
+        messages = session.exec(select(EmailOutbox)).all()
+        for message in messages:
+            assert message.status == EmailOutboxStatus.PENDING
+            assert message.notification is not None
+            assert not message.notification.sent
+            assert message.notification.sent_at is None
+        return [(m.template, m.payload["args"][0]) for m in messages]
 
-    def _enqueue(background_tasks, fn, *args, **kwargs):
-        sent_calls.append(fn.__name__)
-
-    monkeypatch.setattr("app.services.notification_service.enqueue_email", _enqueue)
 
+def test_create_event_enqueues_bulk_emails(test_engine, client):
     with Session(test_engine) as session:
         admin = User(
             email="admin@example.com",
@@ -90,18 +98,12 @@ def test_create_event_enqueues_bulk_emails(monkeypatch, test_engine, client):
 
     response = client.post("/api/v1/events/", json=payload)
     assert response.status_code == 201
-    assert sent_calls  # at least one email enqueued
-    assert "send_event_invitation" in sent_calls
-
-
-def test_event_reminder_enqueues_bulk_emails(monkeypatch, test_engine, client):
-    sent_calls = []
-
-    def _enqueue(background_tasks, fn, *args, **kwargs):
-        sent_calls.append(fn.__name__)
+    queued = _queued(test_engine)
+    assert queued  # at least one email enqueued
+    assert ("send_event_invitation", "invitee@example.com") in queued
 
-    monkeypatch.setattr("app.services.notification_service.enqueue_email", _enqueue)
 
+def test_event_reminder_enqueues_bulk_emails(test_engine, client):
     with Session(test_engine) as session:
         admin = User(
             email="admin2@example.com",
@@ -154,5 +156,75 @@ def test_event_reminder_enqueues_bulk_emails(monkeypatch, test_engine, client):
 
     response = client.post(f"/api/v1/events/{event_id}/remind")
     assert response.status_code == 200
-    assert sent_calls  # reminder enqueued
-    assert "send_event_reminder" in sent_calls
+    queued = _queued(test_engine)
+    assert queued  # reminder enqueued
+    assert ("send_event_reminder", "user@example.com") in queued
+
+
+def test_notification_fan_out_does_not_query_per_recipient(test_engine):
+    def _fan_out(count: int) -> tuple[int, int]:
+        with Session(test_engine) as session:
+            admin = User(
+                email=f"organizer{count}@example.com",
+                hashed_password="x",
+                full_name="Organizer",
+                role=UserRole.ADMIN,
+                is_active=True,
+            )
+            users = [
+                User(
+                    email=f"fan{count}-{index}@example.com",
+                    hashed_password="x",
+                    full_name=f"Fan {index}",
+                    role=UserRole.COACH,
+                    is_active=True,
+                )
+                for index in range(count)
+            ]
+            session.add_all([admin, *users])
+            session.flush()
+            event = Event(
+                name=f"Fan-out {count}",
+                event_date=date.today(),
+                created_by_id=admin.id,
+                status=EventStatus.SCHEDULED,
+            )
+            session.add(event)
+            session.flush()
+            session.add_all(
+                EventParticipant(
+                    event_id=event.id,
+                    user_id=user.id,
+                    status=ParticipantStatus.CONFIRMED,
+                )
+                for user in users
+            )
+            session.commit()
+            invitee_ids = [user.id for user in users]
+
+            statements = []
+
+            def _count(*_args):
+                statements.append(1)
+
+            sa_event.listen(test_engine, "before_cursor_execute", _count)
+            try:
+                asyncio.run(
+                    notification_service.notify_event_created(
+                        session, event, invitee_ids
+                    )
+                )
+                created = len(statements)
+                statements.clear()
+                asyncio.run(notification_service.send_event_reminders(session, event))
+                reminded = len(statements)
+            finally:
+                sa_event.remove(test_engine, "before_cursor_execute", _count)
+            return created, reminded
+
+    assert _fan_out(2) == _fan_out(12)
+    with Session(test_engine) as session:
+        messages = session.exec(select(EmailOutbox)).all()
+        assert len(messages) == 2 * (2 + 12)
+        assert all(message.notification_id for message in messages)
+        assert len({message.notification_id for message in messages}) == len(messages)
@@ -0,0 +1,212 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.core import http_client
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
+from app.services import email_service as email_module
+from app.services.email_queue import drain_outbox, enqueue_email
+from app.services.email_service import EmailService, substitute_recipient
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """Capture provider requests; ``status`` sets the reply per path."""
+    state = {"requests": [], "status": {}}
+
+    def _handler(request):
+        state["requests"].append(
+            (request.url.host, request.url.path, json.loads(request.content))
+        )
+        status = state["status"].get(request.url.path, 202)
+        if isinstance(status, Exception):
+            raise status
+        return httpx.Response(status)
+
+    monkeypatch.setattr(
+        http_client,
+        "_build_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+    # RSVP tokens embed a timestamp; make them deterministic.
+    monkeypatch.setattr(
+        email_module.security_token_manager,
+        "generate_token",
+        lambda data, salt: f"{data['user_id']}-{data['event_id']}-{data['status']}",
+    )
+    return state
+
+
+@pytest.fixture
+def sendgrid_service():
+    service = EmailService()
+    service.sendgrid_api_key = "key"
+    service.sendgrid_from_email = "noreply@example.com"
+    service.use_sendgrid = service.is_configured = True
+    service.use_resend = False
+    service.smtp_user = service.smtp_password = ""
+    return service
+
+
+def _invite(email, name, user_id, event_id=7, event_name="Training"):
+    args = [email, name, event_name, "2026-05-01", "10:00", "Field", None, "Coach"]
+    return args, {"user_id": user_id, "event_id": event_id}
+
+
+def _smtp_fallback(service, monkeypatch):
+    sent = []
+    service.smtp_user = service.smtp_password = "smtp"
+    monkeypatch.setattr(
+        service,
+        "_send_smtp",
+        lambda to_email, email: sent.append((to_email, email.text_body)) or True,
+    )
+    return sent
+
+
+def test_invitations_share_one_sendgrid_request_per_event(provider, sendgrid_service):
+    calls = [
+        _invite("a@example.com", "Ann", 1),
+        _invite("b@example.com", "Ben", 2),
+        _invite("c@example.com", "Cat", 3),
+        _invite("d@example.com", "Dan", 4, event_id=8, event_name="Match"),
+    ]
+
+    delivered = asyncio.run(
+        sendgrid_service.send_batch("send_event_invitation", calls)
+    )
+
+    assert delivered == [True] * 4
+    assert len(provider["requests"]) == 2
+    _, path, payload = provider["requests"][0]
+    assert path == "/v3/mail/send"
+    assert [p["to"][0]["email"] for p in payload["personalizations"]] == [
+        "a@example.com",
+        "b@example.com",
+        "c@example.com",
+    ]
+
+    # Substituting each recipient's values reproduces the single-send email.
+    text, html = (part["value"] for part in payload["content"])
+    for personalization, (args, kwargs) in zip(payload["personalizations"], calls):
+        substitutions = personalization["substitutions"]
+        expected = sendgrid_service._render_event_invitation(
+            args[1],
+            *args[2:],
+            rsvp_urls=sendgrid_service._rsvp_urls(
+                kwargs["user_id"], kwargs["event_id"]
+            ),
+            event_id=kwargs["event_id"],
+        )
+        batch = substitute_recipient(
+            expected._replace(text_body=text, html_body=html), substitutions
+        )
+        assert batch.text_body == expected.text_body
+        assert batch.html_body == expected.html_body
+
+
+def test_rejected_batch_falls_back_to_single_sends(
+    provider, sendgrid_service, monkeypatch
+):
+    provider["status"]["/v3/mail/send"] = 400
+    smtp_sent = _smtp_fallback(sendgrid_service, monkeypatch)
+
+    delivered = asyncio.run(
+        sendgrid_service.send_batch(
+            "send_event_invitation",
+            [_invite("a@example.com", "Ann", 1), _invite("b@example.com", "Ben", 2)],
+        )
+    )
+
+    assert delivered == [True, True]
+    # SendGrid is not asked again per recipient; SMTP sends each one.
+    assert len(provider["requests"]) == 1
+    assert [to for to, _ in smtp_sent] == ["a@example.com", "b@example.com"]
+    assert "Hello Ann" in smtp_sent[0][1]
+    assert "1-7-confirmed" in smtp_sent[0][1]
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [503, httpx.ReadTimeout("read timed out")],
+    ids=["server-error", "read-timeout"],
+)
+def test_ambiguous_batch_failure_is_not_resent(
+    provider, sendgrid_service, monkeypatch, failure
+):
+    provider["status"]["/v3/mail/send"] = failure
+    smtp_sent = _smtp_fallback(sendgrid_service, monkeypatch)
+
+    delivered = asyncio.run(
+        sendgrid_service.send_batch(
+            "send_event_invitation",
+            [_invite("a@example.com", "Ann", 1), _invite("b@example.com", "Ben", 2)],
+        )
+    )
+
+    # The batch may have gone out, so it is left for the outbox to retry.
+    assert delivered == [False, False]
+    assert len(provider["requests"]) == 1
+    assert smtp_sent == []
+
+
+@pytest.mark.parametrize(
+    ("status", "delivered", "smtp_calls"),
+    [(400, True, 1), (503, False, 0)],
+    ids=["rejected", "ambiguous"],
+)
+def test_single_send_falls_back_only_when_rejected(
+    provider, sendgrid_service, monkeypatch, status, delivered, smtp_calls
+):
+    provider["status"]["/v3/mail/send"] = status
+    smtp_sent = _smtp_fallback(sendgrid_service, monkeypatch)
+
+    sent = asyncio.run(
+        sendgrid_service._send_email("a@example.com", "Hello", "Body")
+    )
+
+    assert sent is delivered
+    assert len(provider["requests"]) == 1
+    assert len(smtp_sent) == smtp_calls
+
+
+def test_worker_sends_queued_reminders_in_one_request(
+    provider, sendgrid_service, tmp_path
+):
+    engine = create_engine(f"sqlite:///{tmp_path / 'batch.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as db:
+        for index in range(3):
+            enqueue_email(
+                db,
+                "send_event_reminder",
+                f"user{index}@example.com",
+                f"User {index}",
+                "Training",
+                "2026-05-01",
+                "10:00",
+                "Field",
+                24,
+                event_id=7,
+            )
+        enqueue_email(
+            db, "send_password_code", "reset@example.com", "Reset", "1234", 10
+        )
+        db.commit()
+
+        processed = asyncio.run(
+            drain_outbox(db, concurrency=4, batch_size=10, service=sendgrid_service)
+        )
+
+        assert processed == 4
+        statuses = {m.status for m in db.exec(select(EmailOutbox)).all()}
+        assert statuses == {EmailOutboxStatus.SENT}
+    engine.dispose()
+
+    personalizations = sorted(
+        len(payload["personalizations"]) for _, _, payload in provider["requests"]
+    )
+    assert personalizations == [1, 3]
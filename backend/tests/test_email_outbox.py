@@ -0,0 +1,198 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.core.config import settings
+from app.main import app
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
+from app.models.event import Notification
+from app.models.user import User, UserRole
+from app.services.email_queue import (
+    claim_due_emails,
+    drain_outbox,
+    enqueue_email,
+    retry_delay,
+)
+from app.services.email_service import email_service
+from app.workers import email_worker
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'email_outbox.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as db:
+        yield db
+    engine.dispose()
+
+
+class FakeEmailService:
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = []
+
+    async def send_event_reminder(self, to_email, *args):
+        self.calls.append((to_email, *args))
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _queue_reminder(db: Session) -> tuple[int, int]:
+    user = User(
+        email="user@example.com",
+        hashed_password="x",
+        full_name="User",
+        role=UserRole.COACH,
+        is_active=True,
+    )
+    db.add(user)
+    db.flush()
+    notification = Notification(
+        user_id=user.id,
+        type="event_reminder",
+        channel="email",
+        title="Reminder",
+        body="Starts in 24h",
+    )
+    db.add(notification)
+    message = enqueue_email(
+        db,
+        "send_event_reminder",
+        user.email,
+        user.full_name,
+        "Training",
+        datetime(2026, 5, 1).date(),
+        None,
+        "Field",
+        24,
+        7,
+        notification=notification,
+    )
+    db.commit()
+    return message.id, notification.id
+
+
+def _drain(db: Session, service: FakeEmailService) -> int:
+    return asyncio.run(drain_outbox(db, concurrency=2, batch_size=10, service=service))
+
+
+def test_delivered_email_marks_notification_sent(session):
+    message_id, notification_id = _queue_reminder(session)
+    service = FakeEmailService([True])
+
+    assert _drain(session, service) == 1
+    assert _drain(session, service) == 0
+
+    assert service.calls == [
+        (
+            "user@example.com",
+            "User",
+            "Training",
+            "2026-05-01",
+            None,
+            "Field",
+            24,
+            7,
+        )
+    ]
+    session.expire_all()
+    message = session.get(EmailOutbox, message_id)
+    assert message.status == EmailOutboxStatus.SENT
+    assert message.attempts == 1
+    assert message.claim_token is None
+    notification = session.get(Notification, notification_id)
+    assert notification.sent is True
+    assert notification.sent_at is not None
+
+
+def test_failed_email_backs_off_then_gives_up(session, monkeypatch):
+    monkeypatch.setattr(settings, "EMAIL_MAX_ATTEMPTS", 2)
+    message_id, notification_id = _queue_reminder(session)
+    service = FakeEmailService([False, RuntimeError("smtp down")])
+
+    before = datetime.utcnow()
+    assert _drain(session, service) == 1
+    session.expire_all()
+    message = session.get(EmailOutbox, message_id)
+    assert message.status == EmailOutboxStatus.PENDING
+    assert message.attempts == 1
+    assert message.next_attempt_at >= before + retry_delay(1)
+    # Not due yet, so nothing is claimed.
+    assert _drain(session, service) == 0
+
+    message.next_attempt_at = before
+    session.add(message)
+    session.commit()
+    assert _drain(session, service) == 1
+    session.expire_all()
+    message = session.get(EmailOutbox, message_id)
+    assert message.status == EmailOutboxStatus.FAILED
+    assert message.attempts == 2
+    assert message.last_error == "RuntimeError: smtp down"
+    notification = session.get(Notification, notification_id)
+    assert notification.sent is False
+    assert notification.error == "RuntimeError: smtp down"
+
+
+def test_expired_lease_is_claimed_again(session):
+    message_id, _ = _queue_reminder(session)
+    now = datetime.utcnow()
+
+    assert [m.id for m in claim_due_emails(session, limit=10, now=now)] == [message_id]
+    assert claim_due_emails(session, limit=10, now=now) == []
+
+    later = now + timedelta(seconds=settings.EMAIL_LEASE_SECONDS + 1)
+    assert [m.id for m in claim_due_emails(session, limit=10, now=later)] == [
+        message_id
+    ]
+
+
+def test_claim_loads_notifications_up_front(session):
+    _, notification_id = _queue_reminder(session)
+    session.expire_all()
+
+    [message] = claim_due_emails(session, limit=10)
+
+    assert "notification" not in inspect(message).unloaded
+    assert message.notification.id == notification_id
+
+
+def test_enqueue_rejects_unknown_template(session):
+    with pytest.raises(ValueError):
+        enqueue_email(session, "send_nothing", "user@example.com")
+
+
+def test_api_process_drains_outbox_without_worker(session, monkeypatch):
+    sent = []
+
+    async def _fake_send(to_email, *args):
+        sent.append(to_email)
+        return True
+
+    monkeypatch.setattr(email_service, "send_password_code", _fake_send)
+    monkeypatch.setattr(settings, "EMAIL_OUTBOX_IN_PROCESS", True)
+    monkeypatch.setattr(email_worker, "engine", session.get_bind())
+    message = enqueue_email(
+        session, "send_password_code", "user@example.com", "User", "1234", 10
+    )
+    session.commit()
+
+    with TestClient(app):
+        for _ in range(100):
+            session.expire_all()
+            if session.get(EmailOutbox, message.id).status == EmailOutboxStatus.SENT:
+                break
+            time.sleep(0.05)
+
+    assert sent == ["user@example.com"]
+    assert session.get(EmailOutbox, message.id).status == EmailOutboxStatus.SENT
@@ -0,0 +1,169 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.api.deps import get_current_active_user, get_session
+from app.main import app
+from app.models.athlete import Athlete
+from app.models.event_visibility import EventVisibility
+from app.models.team import CoachTeamLink, Team
+from app.models.user import User, UserRole
+from app.services.event_visibility_service import (
+    _visibility_pairs,
+    rebuild_event_visibility,
+)
+
+
+@pytest.fixture
+def test_engine(tmp_path):
+    db_path = tmp_path / "event_visibility.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(test_engine):
+    def _session_override():
+        with Session(test_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _session_override
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _user_override(engine, user_id: int):
+    def _dep():
+        with Session(engine) as session:
+            return session.get(User, user_id)
+
+    return _dep
+
+
+def _rows(engine) -> set[tuple[int, int]]:
+    with Session(engine) as session:
+        stored = {
+            (row.user_id, row.event_id)
+            for row in session.exec(select(EventVisibility)).all()
+        }
+        assert stored == set(session.exec(_visibility_pairs()).all())
+        rebuild_event_visibility(session)
+        assert {
+            (row.user_id, row.event_id)
+            for row in session.exec(select(EventVisibility)).all()
+        } == stored
+        session.rollback()
+    return stored
+
+
+def test_visibility_rows_follow_event_and_team_writes(test_engine, client):
+    with Session(test_engine) as session:
+        admin = User(
+            email="admin@example.com",
+            hashed_password="x",
+            full_name="Admin",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        coach = User(
+            email="coach@example.com",
+            hashed_password="x",
+            full_name="Coach",
+            role=UserRole.COACH,
+            is_active=True,
+        )
+        team = Team(name="Lions", age_category="U14")
+        session.add_all([admin, coach, team])
+        session.flush()
+        athlete = Athlete(
+            first_name="Ath",
+            last_name="Lete",
+            email="athlete@example.com",
+            birth_date=date(2011, 5, 1),
+            primary_position="Forward",
+            team_id=team.id,
+        )
+        session.add(athlete)
+        session.flush()
+        athlete_user = User(
+            email="athlete@example.com",
+            hashed_password="x",
+            full_name="Ath Lete",
+            role=UserRole.ATHLETE,
+            is_active=True,
+            athlete_id=athlete.id,
+        )
+        session.add_all(
+            [athlete_user, CoachTeamLink(user_id=coach.id, team_id=team.id)]
+        )
+        session.commit()
+        admin_id, coach_id, team_id = admin.id, coach.id, team.id
+        athlete_id, athlete_user_id = athlete.id, athlete_user.id
+
+    app.dependency_overrides[get_current_active_user] = _user_override(
+        test_engine, admin_id
+    )
+    response = client.post(
+        "/api/v1/events/",
+        json={
+            "name": "Training",
+            "event_date": date.today().isoformat(),
+            "team_ids": [team_id],
+            "send_email": False,
+            "send_push": False,
+        },
+    )
+    assert response.status_code in {200, 201}
+    event_id = response.json()["id"]
+    assert _rows(test_engine) == {
+        (admin_id, event_id),
+        (coach_id, event_id),
+        (athlete_user_id, event_id),
+    }
+
+    # Leaving the team keeps the roster invite created with the event.
+    with Session(test_engine) as session:
+        session.get(Athlete, athlete_id).team_id = None
+        session.commit()
+    assert (athlete_user_id, event_id) in _rows(test_engine)
+
+    # A coach joining later sees the event through the team link only.
+    with Session(test_engine) as session:
+        assistant = User(
+            email="assistant@example.com",
+            hashed_password="x",
+            full_name="Assistant",
+            role=UserRole.COACH,
+            is_active=True,
+        )
+        session.add(assistant)
+        session.flush()
+        session.add(CoachTeamLink(user_id=assistant.id, team_id=team_id))
+        session.commit()
+        assistant_id = assistant.id
+    assert (assistant_id, event_id) in _rows(test_engine)
+
+    # Deleting the team removes its links with bulk statements.
+    response = client.delete(f"/api/v1/teams/{team_id}")
+    assert response.status_code == 204
+    rows = _rows(test_engine)
+    assert (assistant_id, event_id) not in rows
+    assert (coach_id, event_id) in rows  # invited when the event was created
+
+    app.dependency_overrides[get_current_active_user] = _user_override(
+        test_engine, assistant_id
+    )
+    assert client.get(f"/api/v1/events/{event_id}").status_code == 403
+
+    app.dependency_overrides[get_current_active_user] = _user_override(
+        test_engine, admin_id
+    )
+    response = client.delete(f"/api/v1/events/{event_id}")
+    assert response.status_code == 204
+    assert _rows(test_engine) == set()
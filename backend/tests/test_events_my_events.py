@@ -1,7 +1,9 @@
-from datetime import date
+import re
+from datetime import date, time
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event as sa_event
 from sqlmodel import SQLModel, Session, create_engine
 
 from app.api.deps import get_current_active_user, get_session
@@ -65,7 +67,7 @@ def _make_users_and_team(session: Session):
 def _make_team_event(session: Session, creator: User) -> Event:
     event = Event(
         name="Team Practice",
-        event_date=date(2024, 9, 1),
+        event_date=date.today(),
         start_time=None,
         location="Field",
         notes=None,
@@ -315,3 +317,132 @@ def test_athlete_sees_event_by_participant_invite(test_engine, client):
     data = response.json()
     event_ids = [item["id"] for item in data]
     assert event_ids.count(event_id) == 1
+
+
+def test_athlete_events_come_from_one_ordered_query(test_engine, client):
+    with Session(test_engine) as session:
+        coach, creator, team = _make_users_and_team(session)
+        athlete_user = _make_athlete_user(session, team)
+        schedule = [
+            (date(2024, 9, 1), time(18, 0)),
+            (date(2024, 9, 3), None),
+            (date(2024, 9, 3), time(9, 30)),
+            (date(2024, 8, 20), time(7, 0)),
+        ]
+        event_ids = []
+        for event_date, start_time in schedule:
+            event = _make_team_event(session, creator)
+            event.event_date = event_date
+            event.start_time = start_time
+            session.add(event)
+            event_ids.append(event.id)
+        session.add(EventTeamLink(event_id=event_ids[0], team_id=team.id))
+        session.add(
+            EventParticipant(
+                event_id=event_ids[1],
+                athlete_id=athlete_user.athlete_id,
+                status=ParticipantStatus.INVITED,
+            )
+        )
+        session.add(
+            EventParticipant(
+                event_id=event_ids[2],
+                user_id=athlete_user.id,
+                status=ParticipantStatus.INVITED,
+            )
+        )
+        session.commit()
+        athlete_user_id = athlete_user.id
+
+    app.dependency_overrides[get_current_active_user] = _current_user_override(
+        test_engine, athlete_user_id
+    )
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, *args):  # noqa: ANN001
+        statements.append(statement)
+
+    sa_event.listen(test_engine, "before_cursor_execute", _record)
+    try:
+        response = client.get(
+            "/api/v1/events/my-events",
+            params={"date_from": "2024-08-01", "date_to": "2024-09-30"},
+        )
+    finally:
+        sa_event.remove(test_engine, "before_cursor_execute", _record)
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == [
+        event_ids[2],
+        event_ids[1],
+        event_ids[0],
+    ]
+    event_queries = [
+        statement for statement in statements if re.search(r"FROM event\s", statement)
+    ]
+    assert len(event_queries) == 1
+
+
+def test_my_events_pages_through_the_date_window(test_engine, client):
+    with Session(test_engine) as session:
+        admin = User(
+            email="admin4@example.com",
+            hashed_password="x",
+            full_name="Admin4",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        session.add(admin)
+        session.commit()
+        schedule = [
+            (date(2024, 9, day), start_time)
+            for day in (1, 2, 3)
+            for start_time in (None, time(8, 0), time(17, 30))
+        ]
+        schedule.append((date(2024, 12, 1), time(9, 0)))
+        for event_date, start_time in schedule:
+            event = _make_team_event(session, admin)
+            event.event_date = event_date
+            event.start_time = start_time
+            session.add(event)
+        session.commit()
+        admin_id = admin.id
+
+    app.dependency_overrides[get_current_active_user] = _current_user_override(
+        test_engine, admin_id
+    )
+    window = {"date_from": "2024-09-01", "date_to": "2024-09-30"}
+
+    full = client.get("/api/v1/events/my-events", params=window)
+    assert "X-Next-Cursor" not in full.headers
+    expected = [(item["event_date"], item["start_time"]) for item in full.json()]
+    assert len(expected) == 9
+    assert expected[:3] == [
+        ("2024-09-03", "17:30:00"),
+        ("2024-09-03", "08:00:00"),
+        ("2024-09-03", None),
+    ]
+
+    seen: list[tuple] = []
+    cursor = None
+    while True:
+        params = {**window, "limit": 4}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/events/my-events", params=params)
+        assert response.status_code == 200
+        seen.extend((item["event_date"], item["start_time"]) for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert seen == expected
+
+    response = client.get(
+        "/api/v1/events/my-events", params={**window, "cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+    response = client.get(
+        "/api/v1/events/my-events",
+        params={"date_from": "2020-01-01", "date_to": "2024-12-31"},
+    )
+    assert response.status_code == 400
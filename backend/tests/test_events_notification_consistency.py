@@ -1,3 +1,4 @@
+import asyncio
 from datetime import date
 
 import pytest
@@ -9,6 +10,7 @@ from app.main import app
 from app.models.event import Event
 from app.models.event_participant import EventParticipant, ParticipantStatus
 from app.models.user import User, UserRole
+from app.services.email_queue import drain_outbox
 
 
 @pytest.fixture
@@ -107,4 +109,7 @@ def test_event_participants_exist_before_email_sent(monkeypatch, test_engine, cl
         assert event.email_sent is True
         assert event.push_sent is False
 
+    # The email worker sends the queued invitation.
+    with Session(test_engine) as session:
+        assert asyncio.run(drain_outbox(session, concurrency=1, batch_size=10)) == 1
     assert send_calls, "Email send should have been enqueued/called"
@@ -1,12 +1,15 @@
 from datetime import date
 
 from fastapi.testclient import TestClient
-from sqlmodel import SQLModel, Session, create_engine
+from sqlalchemy import event as sa_event
+from sqlmodel import SQLModel, Session, create_engine, select
 import pytest
 
 from app.api.deps import get_current_active_user, get_session
 from app.main import app
+from app.models.athlete import Athlete
 from app.models.event import Event
+from app.models.event_participant import EventParticipant
 from app.models.event_team_link import EventTeamLink
 from app.models.team import CoachTeamLink, Team
 from app.models.user import User, UserRole
@@ -67,7 +70,7 @@ def _make_team(session: Session, name: str) -> Team:
 def _make_event(session: Session, creator: User) -> Event:
     event = Event(
         name="Update Event",
-        event_date=date(2025, 1, 1),
+        event_date=date.today(),
         start_time=None,
         location="Field",
         notes=None,
@@ -129,3 +132,66 @@ def test_update_event_adds_team_visibility_for_coaches(test_engine, client):
     assert resp_coach_b.status_code == 200
     ids_b = [item["id"] for item in resp_coach_b.json()]
     assert ids_b.count(event_id) == 1
+
+
+def test_team_invites_are_inserted_in_one_statement(test_engine, client):
+    with Session(test_engine) as session:
+        admin = _make_user(session, "admin@example.com", UserRole.ADMIN)
+        coach = _make_user(session, "coach@example.com", UserRole.COACH)
+        team = _make_team(session, "Team A")
+        session.add(CoachTeamLink(user_id=coach.id, team_id=team.id))
+        session.add_all(
+            Athlete(
+                first_name="Ath",
+                last_name=str(index),
+                email=f"athlete{index}@example.com",
+                birth_date=date(2012, 1, 1),
+                primary_position="Forward",
+                team_id=team.id,
+            )
+            for index in range(30)
+        )
+        session.commit()
+        admin_id, coach_id, team_id = admin.id, coach.id, team.id
+
+    inserts: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO event_participant"):
+            inserts.append(statement)
+
+    app.dependency_overrides[get_current_active_user] = _user_override(
+        test_engine, admin_id
+    )
+    sa_event.listen(test_engine, "before_cursor_execute", _record)
+    try:
+        response = client.post(
+            "/api/v1/events/",
+            json={
+                "name": "Tournament",
+                "event_date": date.today().isoformat(),
+                "team_ids": [team_id],
+                "send_email": False,
+                "send_push": False,
+            },
+        )
+    finally:
+        sa_event.remove(test_engine, "before_cursor_execute", _record)
+    assert response.status_code == 201
+    assert len(inserts) == 1
+    event_id = response.json()["id"]
+
+    resp_update = client.put(
+        f"/api/v1/events/{event_id}",
+        json={"team_ids": [team_id], "send_notification": False},
+    )
+    assert resp_update.status_code == 200
+
+    with Session(test_engine) as session:
+        participants = session.exec(
+            select(EventParticipant).where(EventParticipant.event_id == event_id)
+        ).all()
+    athlete_ids = [p.athlete_id for p in participants if p.athlete_id is not None]
+    user_ids = [p.user_id for p in participants if p.user_id is not None]
+    assert len(athlete_ids) == len(set(athlete_ids)) == 30
+    assert user_ids == [coach_id]
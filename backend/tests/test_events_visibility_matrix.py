@@ -97,7 +97,7 @@ def _make_team(session: Session, name: str = "Team A") -> Team:
 def _make_event(session: Session, creator: User) -> Event:
     event = Event(
         name="Friendly Match",
-        event_date=date(2025, 1, 1),
+        event_date=date.today(),
         start_time=None,
         location="Field",
         notes=None,
@@ -252,3 +252,20 @@ def test_admin_and_staff_list_events(test_engine, client):
     assert resp_staff.status_code == 200
     staff_ids = [item["id"] for item in resp_staff.json()]
     assert event_id in staff_ids
+
+
+def test_list_events_pages_do_not_overlap_on_ties(test_engine, client):
+    with Session(test_engine) as session:
+        admin = _make_admin(session)
+        event_ids = {_make_event(session, admin).id for _ in range(5)}
+        admin_id = admin.id
+
+    app.dependency_overrides[get_current_active_user] = _user_override(
+        test_engine, admin_id
+    )
+    seen: list[int] = []
+    for page in (1, 2, 3):
+        response = client.get("/api/v1/events/", params={"page": page, "size": 2})
+        assert response.status_code == 200
+        seen.extend(item["id"] for item in response.json())
+    assert seen == sorted(event_ids, reverse=True)
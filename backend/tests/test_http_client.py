@@ -0,0 +1,45 @@
+import asyncio
+
+import httpx
+
+from app.core import http_client
+from app.services.email_service import EmailService
+
+
+def test_email_sends_share_one_pooled_client(monkeypatch):
+    requests = []
+    built = []
+
+    def _handler(request):
+        requests.append(request.url.host)
+        return httpx.Response(202)
+
+    def _build():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        built.append(client)
+        return client
+
+    monkeypatch.setattr(http_client, "_build_client", _build)
+    service = EmailService()
+    service.sendgrid_api_key = "key"
+    service.sendgrid_from_email = "noreply@example.com"
+    service.use_sendgrid = service.is_configured = True
+
+    async def _send_batch():
+        results = await asyncio.gather(
+            *(
+                service._send_email(f"user{i}@example.com", "Hi", "Body")
+                for i in range(3)
+            )
+        )
+        assert http_client.get_http_client() is built[-1]
+        await http_client.close_http_client()
+        return results
+
+    assert asyncio.run(_send_batch()) == [True, True, True]
+    assert requests == ["api.sendgrid.com"] * 3
+    assert len(built) == 1 and built[0].is_closed
+
+    # A new event loop gets its own client.
+    assert asyncio.run(_send_batch()) == [True, True, True]
+    assert len(built) == 2
@@ -0,0 +1,277 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.analytics.windows import resolve_window
+from app.api.deps import get_current_active_user, get_session
+from app.main import app
+from app.models.athlete import Athlete
+from app.models.scoring_rollup import ScoringRollup
+from app.models.team import Team
+from app.models.user import User, UserRole
+from app.services.scoring_rollup_service import rebuild_scoring_rollups
+
+
+@pytest.fixture
+def test_engine(tmp_path):
+    db_path = tmp_path / "leaderboards.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(test_engine):
+    def _session_override():
+        with Session(test_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _session_override
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _user_override(engine, user_id: int):
+    def _dep():
+        with Session(engine) as session:
+            return session.get(User, user_id)
+
+    return _dep
+
+
+def _rollup_rows(session: Session) -> list[tuple]:
+    return sorted(
+        (
+            row.athlete_id,
+            row.team_id,
+            row.goals,
+            row.games_played,
+            row.goalless_games,
+            row.clean_sheets,
+            row.goals_conceded,
+        )
+        for row in session.exec(select(ScoringRollup)).all()
+    )
+
+
+def test_match_reports_update_rollup_and_leaderboards(test_engine, client):
+    with Session(test_engine) as session:
+        admin = User(
+            email="coach@example.com",
+            hashed_password="x",
+            full_name="Coach",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        team = Team(name="Lions", age_category="U14")
+        session.add_all([admin, team])
+        session.flush()
+        striker, winger, keeper, backup = [
+            Athlete(
+                first_name=name,
+                last_name="Player",
+                email=f"{name.lower()}@example.com",
+                birth_date=date(2011, 5, 1),
+                primary_position="Forward",
+                team_id=team.id,
+            )
+            for name in ("Striker", "Winger", "Keeper", "Backup")
+        ]
+        session.add_all([striker, winger, keeper, backup])
+        session.commit()
+        ids = {
+            "team": team.id,
+            "striker": striker.id,
+            "winger": winger.id,
+            "keeper": keeper.id,
+            "backup": backup.id,
+        }
+        app.dependency_overrides[get_current_active_user] = _user_override(
+            test_engine, admin.id
+        )
+
+    reports = [
+        {
+            "goals_for": 3,
+            "goal_scorers": [
+                {"athlete_id": ids["striker"], "goals": 2},
+                {"athlete_id": ids["winger"], "goals": 1},
+            ],
+            "goalkeepers": [{"athlete_id": ids["keeper"], "conceded": 0}],
+        },
+        {
+            "goals_for": 1,
+            "goals_against": 2,
+            "goal_scorers": [{"athlete_id": ids["winger"], "goals": 1}],
+            "goalkeepers": [{"athlete_id": ids["backup"], "conceded": 2}],
+        },
+        {
+            "goals_for": 2,
+            "goal_scorers": [{"athlete_id": ids["winger"], "goals": 2}],
+            "goalkeepers": [{"athlete_id": ids["backup"], "conceded": 0}],
+        },
+    ]
+    for index, report in enumerate(reports):
+        response = client.post(
+            "/api/v1/match-stats/reports",
+            json={
+                "team_id": ids["team"],
+                "opponent": f"Rival {index}",
+                "date": f"2026-09-0{index + 1}",
+                **report,
+            },
+        )
+        assert response.status_code == 201
+
+    response = client.get("/api/v1/analytics/leaderboards/scoring")
+    assert response.status_code == 200
+    scorers = response.json()["entries"]
+    assert [(entry["athlete_id"], entry["goals"]) for entry in scorers] == [
+        (ids["winger"], 4),
+        (ids["striker"], 2),
+    ]
+    assert scorers[0]["team"] == "Lions"
+
+    response = client.get(
+        "/api/v1/analytics/leaderboards/scoring",
+        params={"leaderboard_type": "clean_sheets", "limit": 2},
+    )
+    keepers = response.json()["entries"]
+    assert [
+        (
+            entry["athlete_id"],
+            entry["clean_sheets"],
+            entry["games_played"],
+            entry["goals_conceded"],
+        )
+        for entry in keepers
+    ] == [(ids["keeper"], 1, 1, 0), (ids["backup"], 1, 2, 2)]
+
+    # The incrementally maintained rollup matches a rebuild from match_stat.
+    with Session(test_engine) as session:
+        incremental = _rollup_rows(session)
+        rebuild_scoring_rollups(session)
+        session.commit()
+        assert _rollup_rows(session) == incremental
+
+    response = client.delete(f"/api/v1/athletes/{ids['winger']}")
+    assert response.status_code == 204
+    response = client.get("/api/v1/analytics/leaderboards/scoring")
+    assert [entry["athlete_id"] for entry in response.json()["entries"]] == [
+        ids["striker"]
+    ]
+
+
+def test_resolve_window_boundaries():
+    today = date(2026, 3, 15)
+    assert resolve_window("all_time", today) is None
+    assert resolve_window("season", today, season_start_month=8) == (
+        date(2025, 8, 1),
+        today,
+    )
+    assert resolve_window("season", date(2026, 8, 1), season_start_month=8) == (
+        date(2026, 8, 1),
+        date(2026, 8, 1),
+    )
+    assert resolve_window("month", today) == (date(2026, 3, 1), today)
+    assert resolve_window("last_days", today, days=7) == (date(2026, 3, 9), today)
+
+
+def test_windowed_leaderboards_only_count_recent_buckets(test_engine, client):
+    with Session(test_engine) as session:
+        admin = User(
+            email="admin@example.com",
+            hashed_password="x",
+            full_name="Admin",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        team = Team(name="Hawks", age_category="U16")
+        session.add_all([admin, team])
+        session.flush()
+        veteran, newcomer = [
+            Athlete(
+                first_name=name,
+                last_name="Player",
+                email=f"{name.lower()}@example.com",
+                birth_date=date(2010, 2, 1),
+                primary_position="Forward",
+                team_id=team.id,
+            )
+            for name in ("Veteran", "Newcomer")
+        ]
+        session.add_all([veteran, newcomer])
+        session.commit()
+        ids = {"team": team.id, "veteran": veteran.id, "newcomer": newcomer.id}
+        app.dependency_overrides[get_current_active_user] = _user_override(
+            test_engine, admin.id
+        )
+
+    today = date.today()
+    long_ago = today - timedelta(days=400)
+    recent = today - timedelta(days=3)
+    for match_day, athlete_key, goals in [
+        (long_ago, "veteran", 5),
+        (recent, "newcomer", 2),
+        (recent, "veteran", 1),
+    ]:
+        response = client.post(
+            "/api/v1/match-stats/reports",
+            json={
+                "team_id": ids["team"],
+                "opponent": "Rivals",
+                "date": match_day.isoformat(),
+                "goal_scorers": [{"athlete_id": ids[athlete_key], "goals": goals}],
+            },
+        )
+        assert response.status_code == 201
+
+    for recorded_on, athlete_key, split in [
+        (long_ago, "veteran", 1.70),
+        (recent, "veteran", 1.95),
+        (recent, "newcomer", 1.90),
+        (recent, "newcomer", 1.85),
+    ]:
+        response = client.post(
+            f"/api/v1/teams/{ids['team']}/combine-metrics",
+            json={
+                "athlete_id": ids[athlete_key],
+                "split_10m_s": split,
+                "recorded_at": f"{recorded_on.isoformat()}T10:00:00",
+            },
+        )
+        assert response.status_code == 201
+
+    def scorers(**params):
+        response = client.get("/api/v1/analytics/leaderboards/scoring", params=params)
+        assert response.status_code == 200
+        return [
+            (entry["athlete_id"], entry["goals"]) for entry in response.json()["entries"]
+        ]
+
+    assert scorers() == [(ids["veteran"], 6), (ids["newcomer"], 2)]
+    assert scorers(window="last_days", days=30) == [
+        (ids["newcomer"], 2),
+        (ids["veteran"], 1),
+    ]
+
+    def sprinters(**params):
+        response = client.get(
+            "/api/v1/analytics/leaderboards/combine",
+            params={"metric": "split_10m_s", **params},
+        )
+        assert response.status_code == 200
+        return [
+            (entry["athlete_id"], entry["value"]) for entry in response.json()["entries"]
+        ]
+
+    assert sprinters() == [(ids["veteran"], 1.70), (ids["newcomer"], 1.85)]
+    assert sprinters(window="last_days", days=30) == [
+        (ids["newcomer"], 1.85),
+        (ids["veteran"], 1.95),
+    ]
@@ -0,0 +1,98 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.analytics.calculators import CALCULATORS
+from app.analytics.metric_definitions import METRIC_DEFINITIONS
+from app.analytics.metric_engine import MetricEngine
+from app.models.assessment_session import AssessmentSession
+from app.models.athlete import Athlete
+from app.models.session_result import SessionResult
+from app.models.test_definition import TestDefinition
+
+
+@pytest.fixture
+def test_engine(tmp_path):
+    db_path = tmp_path / "metric_calculators.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+TRIALS: dict[tuple[str, str], list[float]] = {
+    ("10 m Sprint", "s"): [2.0, 1.9],
+    ("Beep Test", "level"): [9.5, 10.0],
+    ("Shot Power (Run-Up, Right Foot)", "km/h"): [80.0, 90.0],
+    ("Shot Power (Run-Up, Left Foot)", "km/h"): [70.0],
+    ("10 m Accuracy Kick (Right Foot, 5 attempts)", ""): [5.0],
+    ("35 m Driven Shot (Right Foot, 5 attempts)", ""): [2.0, 1.0],
+    ("Reaction Time: Ruler Drop (Right Hand)", "cm"): [20.0, 15.0],
+}
+
+
+def _seed(session: Session) -> int:
+    assessment = AssessmentSession(name="Combine Day")
+    athlete = Athlete(
+        first_name="All",
+        last_name="Metrics",
+        email="all.metrics@example.com",
+        birth_date=date(2010, 1, 1),
+        primary_position="Midfielder",
+    )
+    session.add_all([assessment, athlete])
+    session.commit()
+    for (name, unit), values in TRIALS.items():
+        test = TestDefinition(name=name, unit=unit)
+        session.add(test)
+        session.flush()
+        for value in values:
+            session.add(
+                SessionResult(
+                    session_id=assessment.id,
+                    athlete_id=athlete.id,
+                    test_id=test.id,
+                    value=value,
+                )
+            )
+    session.commit()
+    return athlete.id
+
+
+def test_every_metric_definition_has_a_calculator():
+    assert {metric.id for metric in METRIC_DEFINITIONS} <= set(CALCULATORS)
+
+
+def test_all_metrics_are_computed_from_one_query(test_engine):
+    with Session(test_engine) as session:
+        athlete_id = _seed(session)
+
+    with Session(test_engine) as session:
+        athlete = session.get(Athlete, athlete_id)
+        engine = MetricEngine(session)
+        statements: list[str] = []
+
+        def _before_cursor_execute(conn, cursor, statement, *args):  # noqa: ANN001
+            statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", _before_cursor_execute)
+        try:
+            response = engine.build_metric_response(athlete)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", _before_cursor_execute)
+
+    assert len(statements) == 1
+    values = {metric.id: metric.value for metric in response.metrics}
+    assert values == {
+        "reactive_quickness": round(1000 / ((2 * 0.15 / 9.81) ** 0.5 * 1000), 2),
+        "short_acceleration": round(10 / 1.9, 2),
+        "aerobic_capacity": round(3.46 * 10.0 + 12, 2),
+        "shoot_power_right": 90.0,
+        "shoot_power_left": 70.0,
+        "shoot_accuracy_right": round((100 * 10 + 40 * 35) / 45, 2),
+        "two_footedness_index": 75.0,
+    }
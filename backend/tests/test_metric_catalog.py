@@ -0,0 +1,112 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.analytics.catalog import get_test_catalog
+from app.analytics.metric_definitions import get_metric_by_id
+from app.analytics.metric_engine import MetricEngine
+from app.api.deps import get_current_active_user, get_session
+from app.main import app
+from app.models.test_definition import TestDefinition
+from app.models.user import User, UserRole
+
+
+@pytest.fixture
+def test_engine(tmp_path):
+    db_path = tmp_path / "metric_catalog.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(test_engine):
+    def _session_override():
+        with Session(test_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _session_override
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _user_override(engine, user_id: int):
+    def _dep():
+        with Session(engine) as session:
+            return session.get(User, user_id)
+
+    return _dep
+
+
+def _count_statements(engine, fn):
+    statements: list[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, *args):  # noqa: ANN001
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+    return result, statements
+
+
+def test_catalog_is_shared_and_resolves_aliases(test_engine):
+    with Session(test_engine) as session:
+        session.add_all(
+            [
+                TestDefinition(name="10m Sprint", unit="s", target_direction="lower"),
+                TestDefinition(name="Vertical Jump", unit="cm"),
+            ]
+        )
+        session.commit()
+
+    with Session(test_engine) as session:
+        first = MetricEngine(session)._catalog
+
+    with Session(test_engine) as session:
+        engine, statements = _count_statements(
+            test_engine, lambda: MetricEngine(session)
+        )
+        assert engine._catalog is first
+        assert len(statements) == 1
+        assert "count" in statements[0].lower()
+
+        metric = get_metric_by_id("lower_body_power")
+        resolved = engine._resolve_tests(metric.primary_tests)
+        assert [meta.definition.name for meta in resolved] == ["Vertical Jump"]
+
+
+def test_creating_test_definition_invalidates_catalog(test_engine, client):
+    with Session(test_engine) as session:
+        admin = User(
+            email="admin@example.com",
+            hashed_password="x",
+            full_name="Admin",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        session.add(admin)
+        session.commit()
+        admin_id = admin.id
+        before = get_test_catalog(session)
+        assert before.tests == {}
+
+    app.dependency_overrides[get_current_active_user] = _user_override(
+        test_engine, admin_id
+    )
+    response = client.post(
+        "/api/v1/tests/",
+        json={"name": "20m Sprint", "unit": "s", "target_direction": "lower"},
+    )
+    assert response.status_code == 201
+
+    with Session(test_engine) as session:
+        after = get_test_catalog(session)
+    assert after.version > before.version
+    assert "20msprint" in after.tests
@@ -0,0 +1,201 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.api.deps import get_current_active_user, get_session
+from app.main import app
+from app.models.assessment_session import AssessmentSession
+from app.models.athlete import Athlete, AthleteGender, AthleteStatus
+from app.models.athlete_metric_snapshot import AthleteMetricSnapshot
+from app.models.test_definition import TestDefinition
+from app.models.user import User, UserRole
+from app.services.metric_snapshot_service import (
+    SNAPSHOT_METRIC_IDS,
+    rebuild_metric_snapshots,
+)
+
+
+@pytest.fixture
+def test_engine(tmp_path):
+    db_path = tmp_path / "metric_snapshots.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(test_engine):
+    def _session_override():
+        with Session(test_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _session_override
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _user_override(engine, user_id: int):
+    def _dep():
+        with Session(engine) as session:
+            return session.get(User, user_id)
+
+    return _dep
+
+
+@pytest.fixture
+def seeded(test_engine):
+    with Session(test_engine) as session:
+        sprint = TestDefinition(
+            name="10m Sprint", category="Speed", unit="s", target_direction="lower"
+        )
+        assessment = AssessmentSession(name="Combine Day")
+        athlete = Athlete(
+            first_name="Snap",
+            last_name="Shot",
+            email="snap@example.com",
+            birth_date=date(2010, 1, 1),
+            gender=AthleteGender.male,
+            primary_position="Forward",
+            status=AthleteStatus.active,
+        )
+        admin = User(
+            email="admin@example.com",
+            hashed_password="x",
+            full_name="Admin",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        session.add_all([sprint, assessment, athlete, admin])
+        session.commit()
+        ids = {
+            "sprint": sprint.id,
+            "session": assessment.id,
+            "athlete": athlete.id,
+            "admin": admin.id,
+        }
+
+    app.dependency_overrides[get_current_active_user] = _user_override(
+        test_engine, ids["admin"]
+    )
+    return ids
+
+
+def _snapshot(engine, athlete_id: int, metric_id: str) -> AthleteMetricSnapshot | None:
+    with Session(engine) as session:
+        return session.exec(
+            select(AthleteMetricSnapshot).where(
+                AthleteMetricSnapshot.athlete_id == athlete_id,
+                AthleteMetricSnapshot.metric_id == metric_id,
+            )
+        ).first()
+
+
+def _post_sprint(client, seeded, value: float):
+    return client.post(
+        f"/api/v1/sessions/{seeded['session']}/results",
+        json=[
+            {
+                "athlete_id": seeded["athlete"],
+                "test_id": seeded["sprint"],
+                "value": value,
+                "unit": "s",
+            }
+        ],
+    )
+
+
+def test_adding_results_refreshes_snapshots(test_engine, client, seeded):
+    assert _post_sprint(client, seeded, 2.0).status_code == 200
+    snapshot = _snapshot(test_engine, seeded["athlete"], "short_acceleration")
+    assert snapshot is not None
+    assert snapshot.value == 5.0
+
+    unscored = _snapshot(test_engine, seeded["athlete"], "aerobic_capacity")
+    assert unscored is not None
+    assert unscored.score is None
+
+    assert _post_sprint(client, seeded, 1.6).status_code == 200
+    snapshot = _snapshot(test_engine, seeded["athlete"], "short_acceleration")
+    assert snapshot.value == 6.25
+
+    ranking = client.get("/api/v1/analytics/rankings/metrics/short_acceleration")
+    assert ranking.status_code == 200
+    assert ranking.json()["entries"][0]["value"] == 6.25
+
+    metrics = client.get(f"/api/v1/analytics/athletes/{seeded['athlete']}/metrics")
+    assert metrics.status_code == 200
+    assert [metric["id"] for metric in metrics.json()["metrics"]] == [
+        "short_acceleration"
+    ]
+
+
+def test_new_test_definition_rebuilds_snapshots(test_engine, client, seeded):
+    assert _post_sprint(client, seeded, 2.0).status_code == 200
+    assert _snapshot(test_engine, seeded["athlete"], "short_acceleration")
+
+    response = client.post(
+        "/api/v1/tests",
+        json={"name": "Yo-Yo IR1", "category": "Endurance", "unit": "m"},
+    )
+    assert response.status_code in (200, 201)
+    snapshot = _snapshot(test_engine, seeded["athlete"], "short_acceleration")
+    assert snapshot is not None
+    assert snapshot.value == 5.0
+
+
+def test_reads_score_missing_snapshots_without_writing(test_engine, client, seeded):
+    assert _post_sprint(client, seeded, 2.0).status_code == 200
+    with Session(test_engine) as session:
+        session.exec(delete(AthleteMetricSnapshot))
+        session.commit()
+
+    ranking = client.get("/api/v1/analytics/rankings/metrics/short_acceleration")
+    assert ranking.json()["entries"][0]["value"] == 5.0
+    metrics = client.get(f"/api/v1/analytics/athletes/{seeded['athlete']}/metrics")
+    assert [metric["id"] for metric in metrics.json()["metrics"]] == [
+        "short_acceleration"
+    ]
+    assert _snapshot(test_engine, seeded["athlete"], "short_acceleration") is None
+
+    with Session(test_engine) as session:
+        assert rebuild_metric_snapshots(session) == 1
+        session.commit()
+    assert _snapshot(test_engine, seeded["athlete"], "short_acceleration").value == 5.0
+
+
+def test_age_dependent_metrics_are_not_stored(test_engine, client, seeded):
+    assert "resting_readiness" not in SNAPSHOT_METRIC_IDS
+    assert _post_sprint(client, seeded, 2.0).status_code == 200
+    assert _snapshot(test_engine, seeded["athlete"], "resting_readiness") is None
+
+
+def test_deleting_a_session_refreshes_snapshots(test_engine, client, seeded):
+    assert _post_sprint(client, seeded, 2.0).status_code == 200
+    with Session(test_engine) as session:
+        retest = AssessmentSession(name="Retest")
+        session.add(retest)
+        session.commit()
+        retest_id = retest.id
+    response = client.post(
+        f"/api/v1/sessions/{retest_id}/results",
+        json=[
+            {
+                "athlete_id": seeded["athlete"],
+                "test_id": seeded["sprint"],
+                "value": 1.6,
+                "unit": "s",
+            }
+        ],
+    )
+    assert response.status_code == 200
+    assert _snapshot(test_engine, seeded["athlete"], "short_acceleration").value == 6.25
+
+    assert client.delete(f"/api/v1/sessions/{retest_id}").status_code == 204
+    snapshot = _snapshot(test_engine, seeded["athlete"], "short_acceleration")
+    assert snapshot.value == 5.0
@@ -0,0 +1,99 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import create_engine
+
+from app.core.observability import RequestContextMiddleware, setup_db_instrumentation
+
+
+@pytest.fixture
+def test_engine(tmp_path):
+    db_path = tmp_path / "request_db_stats.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    yield engine
+    engine.dispose()
+
+
+def _build_app(engine, query_budget: int | None) -> FastAPI:
+    setup_db_instrumentation()
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware, query_budget=query_budget)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int) -> dict[str, int]:
+        with engine.connect() as connection:
+            for _ in range(3):
+                connection.execute(text("SELECT 1")).all()
+        return {"item_id": item_id}
+
+    @app.get("/failing-query")
+    def failing_query() -> dict[str, bool]:
+        with engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing_table"))
+            connection.rollback()
+            connection.execute(text("SELECT 1")).all()
+        return {"ok": True}
+
+    return app
+
+
+def _access_records(caplog, message: str) -> list[logging.LogRecord]:
+    return [
+        record
+        for record in caplog.records
+        if record.name == "app.access" and record.getMessage() == message
+    ]
+
+
+def test_access_log_carries_db_stats_and_route_template(test_engine, caplog):
+    client = TestClient(_build_app(test_engine, query_budget=None))
+    labels = {"method": "GET", "handler": "/items/{item_id}"}
+    before = REGISTRY.get_sample_value("http_request_db_queries_sum", labels) or 0.0
+
+    with caplog.at_level(logging.INFO, logger="app.access"):
+        response = client.get("/items/7")
+
+    assert response.status_code == 200
+    [record] = _access_records(caplog, "request_completed")
+    assert record.route == "/items/{item_id}"
+    assert record.db_queries == 3
+    assert record.db_time_ms > 0
+    assert not _access_records(caplog, "query_budget_exceeded")
+    after = REGISTRY.get_sample_value("http_request_db_queries_sum", labels)
+    assert after - before == 3
+
+
+def test_query_budget_warning(test_engine, caplog):
+    client = TestClient(_build_app(test_engine, query_budget=2))
+
+    with caplog.at_level(logging.INFO, logger="app.access"):
+        client.get("/items/1")
+
+    [warning] = _access_records(caplog, "query_budget_exceeded")
+    assert warning.levelno == logging.WARNING
+    assert warning.query_budget == 2
+    assert warning.db_queries == 3
+
+
+def test_failed_statement_leaves_no_timing_state(test_engine, caplog):
+    client = TestClient(_build_app(test_engine, query_budget=None))
+
+    with caplog.at_level(logging.INFO, logger="app.access"):
+        for _ in range(3):
+            assert client.get("/failing-query").status_code == 200
+
+    # Only completed statements are counted.
+    assert [
+        record.db_queries for record in _access_records(caplog, "request_completed")
+    ] == [1, 1, 1]
+    # Nothing from the failed statements is left on the pooled connection.
+    with test_engine.connect() as connection:
+        assert connection.info == {}
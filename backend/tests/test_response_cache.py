@@ -0,0 +1,148 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.api.deps import get_current_active_user, get_session
+from app.core import response_cache
+from app.core.response_cache import (
+    LEADERBOARD_SCORING,
+    LRUCacheBackend,
+    get_cache_backend,
+    set_cache_backend,
+)
+from app.main import app
+from app.models.athlete import Athlete
+from app.models.team import Team
+from app.models.user import User, UserRole
+
+
+@pytest.fixture
+def test_engine(tmp_path):
+    db_path = tmp_path / "response_cache.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(test_engine):
+    def _session_override():
+        with Session(test_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _session_override
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def cache_backend():
+    previous = get_cache_backend()
+    backend = LRUCacheBackend(max_entries=16)
+    set_cache_backend(backend)
+    yield backend
+    set_cache_backend(previous)
+
+
+def _user_override(engine, user_id: int):
+    def _dep():
+        with Session(engine) as session:
+            return session.get(User, user_id)
+
+    return _dep
+
+
+def _cache_requests(result: str) -> float:
+    labels = {"namespace": LEADERBOARD_SCORING, "result": result}
+    return REGISTRY.get_sample_value("response_cache_requests_total", labels) or 0.0
+
+
+def _post_report(client, team_id: int, athlete_id: int, goals: int) -> None:
+    response = client.post(
+        "/api/v1/match-stats/reports",
+        json={
+            "team_id": team_id,
+            "opponent": "Rival",
+            "date": "2026-09-01",
+            "goals_for": goals,
+            "goal_scorers": [{"athlete_id": athlete_id, "goals": goals}],
+        },
+    )
+    assert response.status_code == 201
+
+
+def test_scoring_leaderboard_is_cached_until_a_report_is_posted(
+    test_engine, client, cache_backend
+):
+    with Session(test_engine) as session:
+        admin = User(
+            email="coach@example.com",
+            hashed_password="x",
+            full_name="Coach",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        team = Team(name="Lions", age_category="U14")
+        session.add_all([admin, team])
+        session.flush()
+        striker = Athlete(
+            first_name="Striker",
+            last_name="Player",
+            email="striker@example.com",
+            birth_date=date(2011, 5, 1),
+            primary_position="Forward",
+            team_id=team.id,
+        )
+        session.add(striker)
+        session.commit()
+        team_id, striker_id = team.id, striker.id
+        app.dependency_overrides[get_current_active_user] = _user_override(
+            test_engine, admin.id
+        )
+
+    _post_report(client, team_id, striker_id, goals=2)
+    hits, misses = _cache_requests("hit"), _cache_requests("miss")
+
+    first = client.get("/api/v1/analytics/leaderboards/scoring")
+    second = client.get("/api/v1/analytics/leaderboards/scoring")
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert first.json()["entries"][0]["goals"] == 2
+    assert _cache_requests("miss") - misses == 1
+    assert _cache_requests("hit") - hits == 1
+
+    # A different query string is a separate entry.
+    client.get("/api/v1/analytics/leaderboards/scoring", params={"limit": 3})
+    assert _cache_requests("miss") - misses == 2
+
+    _post_report(client, team_id, striker_id, goals=1)
+    response = client.get("/api/v1/analytics/leaderboards/scoring")
+    assert response.json()["entries"][0]["goals"] == 3
+    assert _cache_requests("miss") - misses == 3
+
+
+def test_lru_backend_evicts_and_expires(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    backend = LRUCacheBackend(max_entries=2)
+
+    backend.set("ns:0:a", b"a", ttl=10)
+    backend.set("ns:0:b", b"b", ttl=10)
+    assert backend.get("ns:0:a") == b"a"  # "b" is now least recently used
+    backend.set("ns:0:c", b"c", ttl=10)
+    assert backend.get("ns:0:b") is None
+    assert backend.get("ns:0:a") == b"a"
+
+    now[0] += 11
+    assert backend.get("ns:0:a") is None
+
+    backend.set("ns:0:d", b"d", ttl=10)
+    backend.bump_generation("ns")
+    assert backend.generation("ns") == 1
+    assert backend.get("ns:0:d") is None
@@ -0,0 +1,107 @@
+import smtplib
+from email.message import EmailMessage
+
+import pytest
+
+from app.services import smtp_pool
+from app.services.smtp_pool import SMTPConnectionPool
+
+
+class FakeSMTP:
+    instances: list["FakeSMTP"] = []
+
+    def __init__(self, host, port, timeout):
+        self.logins = 0
+        self.noops = 0
+        self.sent = []
+        self.closed = False
+        self.alive = True
+        self.drop_next_send = False
+        FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        self.logins += 1
+
+    def noop(self):
+        self.noops += 1
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected("gone")
+        return 250, b"OK"
+
+    def send_message(self, message):
+        if self.drop_next_send:
+            self.drop_next_send = False
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self.sent.append(message["To"])
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    FakeSMTP.instances = []
+    monkeypatch.setattr(smtp_pool.smtplib, "SMTP", FakeSMTP)
+    return SMTPConnectionPool(
+        "smtp.example.com",
+        587,
+        "user",
+        "secret",
+        size=2,
+        idle_seconds=60,
+        max_messages=3,
+        timeout=5,
+    )
+
+
+def _message(to):
+    message = EmailMessage()
+    message["To"] = to
+    message.set_content("Hi")
+    return message
+
+
+def test_messages_reuse_one_logged_in_connection(pool):
+    for index in range(3):
+        pool.send_message(_message(f"user{index}@example.com"))
+
+    (connection,) = FakeSMTP.instances
+    assert connection.logins == 1
+    assert connection.sent == [f"user{i}@example.com" for i in range(3)]
+    # max_messages reached, so the connection is retired.
+    assert connection.closed
+
+    pool.send_message(_message("next@example.com"))
+    assert len(FakeSMTP.instances) == 2
+
+
+def test_idle_connection_is_checked_and_replaced_when_dead(pool):
+    pool.send_message(_message("a@example.com"))
+    (connection,) = FakeSMTP.instances
+    pool._idle[0].last_used -= smtp_pool.NOOP_AFTER_SECONDS + 1
+    connection.alive = False
+
+    pool.send_message(_message("b@example.com"))
+
+    assert connection.noops == 1 and connection.closed
+    assert FakeSMTP.instances[1].sent == ["b@example.com"]
+
+
+def test_dropped_connection_reconnects_and_retries(pool):
+    pool.send_message(_message("a@example.com"))
+    FakeSMTP.instances[0].drop_next_send = True
+
+    pool.send_message(_message("b@example.com"))
+
+    first, second = FakeSMTP.instances
+    assert first.closed
+    assert first.sent == ["a@example.com"]
+    assert second.sent == ["b@example.com"]
+    pool.close()
+    assert second.closed
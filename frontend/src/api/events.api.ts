@@ -11,6 +11,8 @@ import type {
   EventUpdatePayload,
   EventConfirmationPayload,
   EventFilters,
+  EventDateRange,
+  EventPage,
 } from '../types/event';
 
 type EventStatus = Event['status'];
@@ -73,11 +75,20 @@ export const listEvents = async (filters?: EventFilters): Promise<Event[]> => {
 };
 
 /**
- * List events where current user is involved (invited or organizer)
+ * List one page of events where current user is involved (invited or organizer)
+ * within a date range, newest first. Pass `nextCursor` back for the next page.
  */
-export const listMyEvents = async (): Promise<Event[]> => {
-  const response = await api.get<Event[]>('/events/my-events');
-  return normalizeEvents(response.data);
+export const listMyEvents = async (
+  range?: EventDateRange,
+  cursor?: string
+): Promise<EventPage> => {
+  const response = await api.get<Event[]>('/events/my-events', {
+    params: { ...range, cursor },
+  });
+  return {
+    events: normalizeEvents(response.data),
+    nextCursor: response.headers['x-next-cursor'] || null,
+  };
 };
 
 /**
@@ -2,7 +2,7 @@ import { renderHook, act } from "@testing-library/react";
 import { describe, expect, it, vi, beforeEach } from "vitest";
 
 import { useDashboardEvents } from "../useDashboardEvents";
-import { formatDateKey } from "../../lib/dashboardDateUtils";
+import { calendarDateRange, formatDateKey } from "../../lib/dashboardDateUtils";
 import type { Athlete } from "../../types/athlete";
 import type { Team } from "../../types/team";
 import type { Event } from "../../types/event";
@@ -119,6 +119,36 @@ describe("useDashboardEvents", () => {
     expect(result.current.loadErrorMessage).toBe("Unable to load athletes right now.");
   });
 
+  it("requests events for the visible calendar range", () => {
+    const { result } = buildHook();
+
+    const today = new Date();
+    const range = calendarDateRange(new Date(today.getFullYear(), today.getMonth(), 1));
+    expect(mockUseEvents).toHaveBeenCalledWith(range, { enabled: true });
+    expect(mockUseMyEvents).toHaveBeenCalledWith(range, { enabled: false });
+
+    act(() => {
+      result.current.eventsSectionProps.calendarProps.onNextMonth();
+    });
+    const next = calendarDateRange(new Date(today.getFullYear(), today.getMonth() + 1, 1));
+    expect(mockUseEvents).toHaveBeenLastCalledWith(next, { enabled: true });
+  });
+
+  it("loads further pages of my events only while more exist", () => {
+    const fetchNextPage = vi.fn();
+    mockUseMyEvents.mockReturnValue({
+      data: baseEvents,
+      isError: false,
+      hasNextPage: true,
+      isFetchingNextPage: false,
+      fetchNextPage,
+    });
+
+    buildHook({ permissions: { canManageUsers: false, canCreateCoaches: true } });
+
+    expect(fetchNextPage).toHaveBeenCalled();
+  });
+
   it("opens event modal with default date and team when openEventFormPanel is called", () => {
     const { result } = buildHook();
 
@@ -18,7 +18,12 @@ import type { Event, ParticipantStatus } from "../types/event";
 import type { EventFormState } from "../types/dashboard";
 import type EventsSection from "../components/dashboard/EventsSection";
 import type EventModal from "../components/dashboard/EventModal";
-import { formatDateKey, readableDate, isDateInPast } from "../lib/dashboardDateUtils";
+import {
+  calendarDateRange,
+  formatDateKey,
+  readableDate,
+  isDateInPast,
+} from "../lib/dashboardDateUtils";
 import type { useTranslation } from "../i18n/useTranslation";
 import { faCheck, faQuestion, faTimes } from "@fortawesome/free-solid-svg-icons";
 
@@ -74,8 +79,21 @@ export const useDashboardEvents = ({
   const canManageEvents = permissions.canManageUsers || permissions.canCreateCoaches;
   const shouldUseGlobalEvents = permissions.canManageUsers;
 
-  const allEventsQuery = useEvents(undefined, { enabled: shouldUseGlobalEvents });
-  const myEventsQuery = useMyEvents({ enabled: !shouldUseGlobalEvents });
+  const [calendarCursor, setCalendarCursor] = useState(() => {
+    const today = new Date();
+    return new Date(today.getFullYear(), today.getMonth(), 1);
+  });
+  const calendarRange = useMemo(() => calendarDateRange(calendarCursor), [calendarCursor]);
+
+  const allEventsQuery = useEvents(calendarRange, { enabled: shouldUseGlobalEvents });
+  const myEventsQuery = useMyEvents(calendarRange, { enabled: !shouldUseGlobalEvents });
+  const { hasNextPage, isFetchingNextPage, fetchNextPage } = myEventsQuery;
+  useEffect(() => {
+    // The calendar shows every event in its range, which may span pages.
+    if (hasNextPage && !isFetchingNextPage) {
+      fetchNextPage();
+    }
+  }, [hasNextPage, isFetchingNextPage, fetchNextPage]);
   const events = useMemo(
     () => (shouldUseGlobalEvents ? allEventsQuery.data ?? [] : myEventsQuery.data ?? []),
     [shouldUseGlobalEvents, allEventsQuery.data, myEventsQuery.data],
@@ -142,11 +160,6 @@ export const useDashboardEvents = ({
     [athleteById],
   );
 
-  const [calendarCursor, setCalendarCursor] = useState(() => {
-    const today = new Date();
-    return new Date(today.getFullYear(), today.getMonth(), 1);
-  });
-
   const [selectedEventDate, setSelectedEventDate] = useState<string | null>(null);
   const [isEventModalOpen, setEventModalOpen] = useState(false);
   const [eventForm, setEventForm] = useState<EventFormState>(() => ({
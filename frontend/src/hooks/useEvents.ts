@@ -3,9 +3,11 @@
  */
 
 import {
+  useInfiniteQuery,
   useQuery,
   useMutation,
   useQueryClient,
+  type UseInfiniteQueryResult,
   type UseQueryResult,
   type UseMutationResult,
 } from '@tanstack/react-query';
@@ -18,6 +20,7 @@ import type {
   EventUpdatePayload,
   EventConfirmationPayload,
   EventFilters,
+  EventDateRange,
 } from '../types/event';
 
 // Query keys
@@ -26,6 +29,7 @@ export const eventKeys = {
   lists: () => [...eventKeys.all, 'list'] as const,
   list: (filters?: EventFilters) => [...eventKeys.lists(), { filters }] as const,
   myEvents: () => [...eventKeys.all, 'my-events'] as const,
+  myEventsRange: (range?: EventDateRange) => [...eventKeys.myEvents(), { range }] as const,
   details: () => [...eventKeys.all, 'detail'] as const,
   detail: (id: number) => [...eventKeys.details(), id] as const,
 };
@@ -47,14 +51,20 @@ export const useEvents = (
 };
 
 /**
- * Hook to fetch current user's events (invited or organized)
+ * Hook to fetch current user's events (invited or organized) in a date range.
+ * Only the first page is loaded; call `fetchNextPage` while `hasNextPage`
+ * when the view needs older events from the range.
  */
 export const useMyEvents = (
+  range?: EventDateRange,
   options?: { enabled?: boolean }
-): UseQueryResult<Event[], Error> => {
-  return useQuery({
-    queryKey: eventKeys.myEvents(),
-    queryFn: eventsApi.listMyEvents,
+): UseInfiniteQueryResult<Event[], Error> => {
+  return useInfiniteQuery({
+    queryKey: eventKeys.myEventsRange(range),
+    queryFn: ({ pageParam }) => eventsApi.listMyEvents(range, pageParam),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.nextCursor ?? undefined,
+    select: (data) => data.pages.flatMap((page) => page.events),
     enabled: options?.enabled ?? true,
     staleTime: 2 * 60 * 1000,
     gcTime: 5 * 60 * 1000,
@@ -18,6 +18,13 @@ export const readableDate = (dateStr: string) => {
   });
 };
 
+// Date range for event queries: the given month through the end of the next
+// one, so upcoming events near a month's end are still loaded.
+export const calendarDateRange = (month: Date) => ({
+  date_from: formatDateKey(new Date(month.getFullYear(), month.getMonth(), 1)),
+  date_to: formatDateKey(new Date(month.getFullYear(), month.getMonth() + 2, 0)),
+});
+
 export const isDateInPast = (date: Date) => {
   const current = new Date();
   current.setHours(0, 0, 0, 0);
@@ -17,6 +17,7 @@ import type { Team } from "../types/team";
 import type { Event as ApiEvent } from "../types/event";
 import { updateAthlete } from "../api/athletes";
 import { useEvents, useMyEvents } from "../hooks/useEvents";
+import { calendarDateRange } from "../lib/dashboardDateUtils";
 import { useAthletes } from "../hooks/useAthletes";
 import { listTeamCombineMetrics } from "../api/teamMetrics";
 import { getTeamPosts } from "../api/teamPosts";
@@ -138,11 +139,19 @@ const TeamDashboard = () => {
       cleanSheetsDescription: "Goalkeepers with the lowest concessions.",
     };
 
+  const upcomingRange = useMemo(() => calendarDateRange(new Date()), []);
   const eventsQuery = useEvents(
-    selectedTeamId ? { team_id: selectedTeamId } : undefined,
+    selectedTeamId ? { team_id: selectedTeamId, ...upcomingRange } : upcomingRange,
     { enabled: Boolean(selectedTeamId) },
   );
-  const myEventsQuery = useMyEvents({ enabled: !selectedTeamId });
+  const myEventsQuery = useMyEvents(upcomingRange, { enabled: !selectedTeamId });
+  const { hasNextPage, isFetchingNextPage, fetchNextPage } = myEventsQuery;
+  useEffect(() => {
+    // Pages are newest first, so the soonest events are on the last page.
+    if (hasNextPage && !isFetchingNextPage) {
+      fetchNextPage();
+    }
+  }, [hasNextPage, isFetchingNextPage, fetchNextPage]);
   const upcomingEvents = useMemo(() => {
     const events: ApiEvent[] = selectedTeamId ? eventsQuery.data ?? [] : myEventsQuery.data ?? [];
     return events
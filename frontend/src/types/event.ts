@@ -71,3 +71,10 @@ export interface EventFilters {
   date_to?: string;
   athlete_id?: number;
 }
+
+export type EventDateRange = Pick<EventFilters, 'date_from' | 'date_to'>;
+
+export interface EventPage {
+  events: Event[];
+  nextCursor: string | null;
+}
@@ -12,6 +12,8 @@ from sqlmodel.pool import StaticPool
 
 # Ensure tests always use in-memory SQLite, regardless of local .env
 os.environ.setdefault("DATABASE_URL", "sqlite://")
+# The app tests use their own session; no background outbox drain.
+os.environ.setdefault("EMAIL_OUTBOX_IN_PROCESS", "false")
 
 from app.main import app
 from app.db.session import get_session